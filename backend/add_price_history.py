@@ -56,6 +56,11 @@ def create_price_history_table():
             CREATE INDEX IF NOT EXISTS idx_price_history_date 
             ON price_history (date_recorded)
         """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_price_history_game_date
+            ON price_history (game_id, datetime(date_recorded) DESC, id DESC)
+        """)
         
         print("✅ Created indexes for price_history table")
         
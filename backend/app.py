@@ -6,10 +6,20 @@ import requests
 import logging
 import re
 import sqlite3
-from fuzzywuzzy import process
+import threading
+import queue
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from contextlib import closing
+from rapidfuzz import process as rf_process, fuzz as rf_fuzz, utils as rf_utils
 import csv
-import shutil
 from datetime import datetime
+from collections import OrderedDict
+import uuid
+import hashlib
+import statistics
+from pathlib import Path
 import io
 import unicodedata
 import smtplib
@@ -24,58 +34,6 @@ except ImportError:
     def get_youtube_video_id(query):
         return None
 
-# Conditional imports for Docker vs local environment
-try:
-    # Try Docker-compatible imports first
-    if os.getenv('DOCKER_ENV') or os.path.exists('/.dockerenv'):
-        print("🐳 Docker environment detected - using standard selenium")
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.chrome.service import Service as ChromeService
-    else:
-        # Local environment imports
-        print("💻 Local environment detected - using undetected-chromedriver")
-        import undetected_chromedriver as uc
-        import chromedriver_autoinstaller
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.chrome.service import Service as ChromeService
-except ImportError as e:
-    print(f"⚠️ Import warning: {e}")
-    # Fallback to basic selenium - will disable old functions
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.chrome.service import Service as ChromeService
-    except ImportError:
-        print("❌ No selenium available - old scraper functions will be disabled")
-        # Define dummy classes to prevent NameError
-        class DummyClass:
-            pass
-        webdriver = DummyClass()
-        Service = DummyClass
-        Options = DummyClass
-        By = DummyClass()
-        WebDriverWait = DummyClass
-        EC = DummyClass()
-        Keys = DummyClass()
-        ChromeService = DummyClass
-
 # Calculate paths
 # PROJECT_ROOT is the parent of the backend folder in local dev, but will be '/'
 # inside the container. Use APP_ROOT for container-safe absolute base.
@@ -115,29 +73,110 @@ except ImportError:
     )
     print("✅ Successfully imported scrapers from modules directory path")
 
-from flask import Flask, request, jsonify, Response, send_from_directory
+from flask import Flask, request, jsonify, Response, send_from_directory, abort
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    print("Warning: orjson not available - falling back to stdlib json for responses")
+    orjson = None
+
+try:
+    import waitress
+except ImportError:
+    print("Warning: waitress not available - falling back to the Flask development server")
+    waitress = None
+
+# orjson's decode errors subclass json.JSONDecodeError, so callers catch either the same way
+json_loads = orjson.loads if orjson is not None else json.loads
 
 app = Flask(__name__)
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify() and request.json through orjson; keys keep their insertion order."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
+
+def json_dumps(payload, indent=False):
+    """Serialize payload to JSON bytes (orjson when available); indent=True for two-space indentation."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, option=option)
+    return json.dumps(payload, indent=2 if indent else None).encode()
+
+
+def json_response(payload, status=200):
+    """Serialize payload straight into a JSON Response (orjson when available)."""
+    return Response(json_dumps(payload), status=status, mimetype="application/json")
+
+
+def _intarg(name, default, lo, hi):
+    """Integer query arg clamped to [lo, hi]; aborts with a 400 JSON error when it isn't a number."""
+    value = request.args.get(name)
+    if not value:
+        return default
+    try:
+        return max(lo, min(hi, int(value, 10)))
+    except ValueError:
+        abort(json_response({"error": f"Invalid integer for '{name}'"}, 400))
+
+
+class TTLCache:
+    """Small thread-safe mapping whose entries expire after ttl seconds (oldest evicted past maxsize)."""
+
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._data.pop(key, None)
+        if item is None or item[0] < time.monotonic():
+            return default
+        return item[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
 # IGDB credentials default from environment (used as final fallback)
 IGDB_CLIENT_ID = os.getenv("IGDB_CLIENT_ID", "")
 IGDB_CLIENT_SECRET = os.getenv("IGDB_CLIENT_SECRET", "")
 
-# Specify the exact path to the ChromeDriver binary
-# driver_path = "/opt/homebrew/bin/chromedriver"  # Replace with the actual path - NOT USED IN DOCKER
-
-# Legacy driver path for old functions (not used in Docker)
-try:
-    if os.path.exists("/opt/homebrew/bin/chromedriver"):
-        driver_path = "/opt/homebrew/bin/chromedriver" 
-    else:
-        driver_path = None  # Will disable old functions
-except:
-    driver_path = None
-
 # Specify the path to the SQLite database
 
 # External for local
@@ -181,6 +220,7 @@ for directory in [DATA_DIR, ARTWORK_DIR, GRID_DIR, HERO_DIR, LOGO_DIR, ICON_DIR]
 # -------------------------
 # Text Normalization for Search
 # -------------------------
+@lru_cache(maxsize=4096)
 def normalize_for_search(text):
     """
     Normalize text for search by removing accents and special characters.
@@ -188,6 +228,9 @@ def normalize_for_search(text):
     """
     if not text:
         return ""
+    if text.isascii():
+        # Nothing to decompose
+        return text.lower()
     
     # Normalize unicode characters (NFD = decomposed form)
     normalized = unicodedata.normalize('NFD', text)
@@ -203,16 +246,42 @@ def normalize_for_search(text):
 # Price Source Configuration Management
 # -------------------------
 
-# Determine config file path based on environment
-if os.getenv('DOCKER_ENV') or os.path.exists('/.dockerenv'):
+# Determine config file path based on environment; neither can change while
+# the process runs, so both are worked out once here.
+DOCKER_ENVIRONMENT = bool(os.getenv('DOCKER_ENV') or os.path.exists('/.dockerenv'))
+if DOCKER_ENVIRONMENT:
     # In Docker, the config is mounted at /app/config
     CONFIG_FILE = "/app/config/config.json"
 else:
     # Local development - config is relative to project root
     CONFIG_FILE = os.path.join(BASE_DIR, "config", "config.json")
+CONFIG_FILE_ABSOLUTE = os.path.abspath(CONFIG_FILE)
+CONFIG_DIR = os.path.dirname(CONFIG_FILE)
+
+# Last config read or written, as (path, mtime_ns, dict). load_config serves a
+# copy of it while the file's mtime is unchanged, so edits by hand still show up.
+_config_snapshot = None
+
+
+def _config_mtime():
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _remember_config(config, mtime):
+    global _config_snapshot
+    _config_snapshot = (CONFIG_FILE, mtime, dict(config)) if mtime is not None else None
+
 
 def load_config():
     """Load configuration from JSON file, create default if doesn't exist"""
+    mtime = _config_mtime()
+    snapshot = _config_snapshot
+    if snapshot is not None and snapshot[:2] == (CONFIG_FILE, mtime):
+        return dict(snapshot[2])
+
     default_config = {
         "price_source": "PriceCharting",
         "steamgriddb_api_key": "your_steamgriddb_api_key_here_get_from_https://www.steamgriddb.com/profile/preferences/api",
@@ -223,7 +292,7 @@ def load_config():
     # Debug logging
     logging.info(f"Loading config from: {CONFIG_FILE}")
     logging.info(f"Config file absolute path: {os.path.abspath(CONFIG_FILE)}")
-    logging.info(f"Docker environment: {os.getenv('DOCKER_ENV') or os.path.exists('/.dockerenv')}")
+    logging.info(f"Docker environment: {DOCKER_ENVIRONMENT}")
 
     # Ensure config directory exists
     config_dir = os.path.dirname(CONFIG_FILE)
@@ -245,8 +314,8 @@ def load_config():
     if os.path.exists(CONFIG_FILE):
         try:
             logging.info(f"✅ Config file exists, loading...")
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                config = json_loads(f.read())
                 # Ensure price_source exists and is valid
                 if "price_source" not in config or config["price_source"] not in ["eBay", "Amazon", "CeX", "PriceCharting"]:
                     config["price_source"] = "PriceCharting"
@@ -267,6 +336,8 @@ def load_config():
                     save_config(config)
                 
                 logging.info(f"✅ Config loaded successfully from {CONFIG_FILE}")
+                if not changed:
+                    _remember_config(config, mtime)
                 return config
         except (json.JSONDecodeError, IOError) as e:
             logging.warning(f"⚠️  Failed to load config file: {e}, creating default config")
@@ -280,6 +351,7 @@ def load_config():
 
 def save_config(config):
     """Save configuration to JSON file"""
+    _config_preferences.clear()
     try:
         # Ensure config directory exists
         config_dir = os.path.dirname(CONFIG_FILE)
@@ -294,8 +366,9 @@ def save_config(config):
         logging.info(f"Config directory writable: {os.access(config_dir, os.W_OK) if os.path.exists(config_dir) else False}")
         logging.info(f"Config file writable: {os.access(os.path.dirname(CONFIG_FILE), os.W_OK) if os.path.dirname(CONFIG_FILE) else False}")
         
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(CONFIG_FILE, 'wb') as f:
+            f.write(json_dumps(config, indent=True))
+        _remember_config(config, _config_mtime())
         logging.info(f"✅ Config saved successfully to: {CONFIG_FILE}")
         
         # Verify the file was created and has the right content
@@ -308,25 +381,37 @@ def save_config(config):
     except IOError as e:
         logging.error(f"❌ Failed to save config to {CONFIG_FILE}: {e}")
         # In Docker, try to use a fallback location
-        if os.getenv('DOCKER_ENV') or os.path.exists('/.dockerenv'):
+        if DOCKER_ENVIRONMENT:
             try:
                 fallback_config = "/tmp/config.json"
-                with open(fallback_config, 'w') as f:
-                    json.dump(config, f, indent=2)
+                with open(fallback_config, 'wb') as f:
+                    f.write(json_dumps(config, indent=True))
                 logging.warning(f"Config saved to fallback location: {fallback_config}")
             except Exception as fallback_error:
                 logging.error(f"Failed to save config to fallback location: {fallback_error}")
         raise  # Re-raise the exception so the calling function knows it failed
 
+# Price source / default region are read on every price lookup but change
+# rarely; save_config clears this, the TTL covers edits made to the file by hand.
+CONFIG_PREFERENCE_TTL = 30
+_config_preferences = TTLCache(maxsize=8, ttl=CONFIG_PREFERENCE_TTL)
+
+
 def get_price_source():
     """Get current price source preference"""
-    config = load_config()
-    return config.get("price_source", "PriceCharting")
+    price_source = _config_preferences.get("price_source")
+    if price_source is None:
+        price_source = load_config().get("price_source", "PriceCharting")
+        _config_preferences.set("price_source", price_source)
+    return price_source
 
 def get_default_region():
     """Get current default region preference"""
-    config = load_config()
-    return config.get("default_region", "PAL")
+    region = _config_preferences.get("default_region")
+    if region is None:
+        region = load_config().get("default_region", "PAL")
+        _config_preferences.set("default_region", region)
+    return region
 
 def set_default_region(region):
     """Set default region preference"""
@@ -364,8 +449,8 @@ def set_price_source(price_source):
     
     # Verify the save was successful by reading it back
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            saved_config = json.load(f)
+        with open(CONFIG_FILE, 'rb') as f:
+            saved_config = json_loads(f.read())
             logging.info(f"Config file after saving: {saved_config}")
             if saved_config.get("price_source") == price_source:
                 logging.info(f"✅ Price source '{price_source}' saved successfully to {CONFIG_FILE}")
@@ -424,16 +509,486 @@ COMPANY_NAMES = [
 ]
 
 
-def get_db_connection():
-    try:
-        print(f"📂 Attempting to connect to database at: {database_path}")
-        conn = sqlite3.connect(database_path, timeout=30, check_same_thread=False)
+# -------------------------
+# Database connection pool
+# -------------------------
+# Opening SQLite per request re-opens the db, -wal and -shm files and throws away
+# the page cache, so handlers borrow long-lived connections from a small pool.
+# conn.close() hands the connection back rather than closing the file.
+DB_POOL_SIZE = 5
+# Read-only endpoints use a separate pool of mode=ro connections, one per core,
+# so they never queue behind (or accidentally become) a writer.
+DB_READ_POOL_SIZE = os.cpu_count() or DB_POOL_SIZE
+
+# Applied to every new connection
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",   # safe with WAL, avoids an fsync per commit
+    "PRAGMA cache_size=-20000",    # ~20MB page cache per connection
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # reads served from a 256MB shared mapping, not copied per connection
+)
+
+# Compiled statements kept per connection; the hot-path SQL below is defined once
+# so the same text (and cached statement) is reused across requests.
+DB_STATEMENT_CACHE_SIZE = 256
+
+SQL_BARCODE_CACHE_GET = "SELECT title, ts FROM barcode_cache WHERE barcode = ?"
+SQL_BARCODE_CACHE_PUT = "INSERT OR REPLACE INTO barcode_cache (barcode, title, ts) VALUES (?, ?, ?)"
+SQL_GAME_ID_BY_TITLE = "SELECT id FROM games WHERE title = ? LIMIT 1"
+SQL_TOP_GAMES = (
+    "SELECT {columns} FROM games "
+    "WHERE average_price IS NOT NULL AND id != -1 ORDER BY average_price DESC LIMIT 5"
+)
+# Duplicate check and insert in one statement (see save_game_to_db). Named
+# parameters bind region and platform once even though each is used twice.
+SQL_INSERT_GAME_IF_NEW = """
+    INSERT INTO games (id, title, description, publisher, platforms, genres, series, release_date, average_price, youtube_trailer_url, region, date_added)
+    SELECT :id, :title, :description, :publisher, :platforms, :genres, :series, :release_date, :average_price, :youtube_trailer_url, :region, :date_added
+    WHERE NOT EXISTS (
+        SELECT 1 FROM games g
+        WHERE TRIM(g.title) = :trimmed_title AND UPPER(IFNULL(g.region, 'PAL')) = :region
+          AND (:platform = '' OR EXISTS (
+              SELECT 1 FROM game_platforms p WHERE p.game_id = g.id AND p.platform = :platform
+          ))
+    )
+"""
+
+
+# Pooled connections parse column names, so a query aliasing a JSON value
+# AS "name [JSON]" gets it back already decoded (NULL stays None).
+sqlite3.register_converter("JSON", json_loads)
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that returns itself to its pool on close()."""
+
+    pool = None
+    checked_out = False
+
+    def close(self):
+        if self.pool is None:
+            return super().close()
+        if self.checked_out:
+            self.checked_out = False
+            self.pool.release(self)
+
+
+class ConnectionPool:
+    """Minimal LIFO pool of SQLite connections for one database file."""
+
+    def __init__(self, path, size=DB_POOL_SIZE, read_only=False):
+        self.path = path
+        self.read_only = read_only
+        self._idle = queue.LifoQueue(maxsize=size)
+        # A read-only pool can't run prepare_database; get_read_pool has the writer pool do it
+        self._prepared = read_only
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        print(f"📂 Opening pooled {'read-only ' if self.read_only else ''}database connection: {self.path}")
+        if self.read_only:
+            target, uri = f"{Path(self.path).resolve().as_uri()}?mode=ro", True
+        else:
+            target, uri = self.path, False
+        conn = sqlite3.connect(
+            target, uri=uri, timeout=30, check_same_thread=False,
+            factory=PooledConnection, cached_statements=DB_STATEMENT_CACHE_SIZE,
+            detect_types=sqlite3.PARSE_COLNAMES,
+        )
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            if not self._prepared:
+                prepare_database(conn)
+                self._prepared = True
+        conn.pool = self
+        return conn
+
+    def acquire(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
         conn.row_factory = sqlite3.Row
+        conn.checked_out = True
         return conn
+
+    def release(self, conn):
+        try:
+            # Drop anything a handler left uncommitted before the next borrower sees it
+            conn.rollback()
+            self._idle.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            close_pooled_connection(conn)
+
+    def close(self):
+        while True:
+            try:
+                close_pooled_connection(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+def close_pooled_connection(conn):
+    """Really close a pooled connection, letting SQLite refresh its planner stats first."""
+    conn.pool = None
+    try:
+        # Cheap unless the connection's queries showed stats are missing or stale
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    conn.close()
+
+
+# Tables owned by the app itself (caches), created idempotently per database file
+APP_TABLES = (
+    """CREATE TABLE IF NOT EXISTS barcode_cache (
+        barcode TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        ts INTEGER NOT NULL
+    )""",
+)
+
+# Left behind by earlier versions; dropped so writes stop maintaining them.
+# games.normalized_title itself stays (unread) in databases that have it.
+OBSOLETE_OBJECTS = (
+    "DROP TRIGGER IF EXISTS trg_games_normalized_title",
+    "DROP INDEX IF EXISTS idx_games_normalized_title",
+    # strftime() twin of idx_games_release_year_int, no longer queried
+    "DROP INDEX IF EXISTS idx_games_release_year",
+    # DESC twin of idx_games_price_sort, which serves the same queries
+    "DROP INDEX IF EXISTS idx_games_average_price",
+)
+
+# Indexes the request handlers rely on; created idempotently per database file
+GAMES_INDEXES = (
+    # /scan existence check
+    "CREATE INDEX IF NOT EXISTS idx_games_title ON games(title)",
+    # save_game_to_db duplicate check (matches its TRIM(title) predicate, covers the rest)
+    "CREATE INDEX IF NOT EXISTS idx_games_title_platforms_region ON games(TRIM(title), platforms, region)",
+    # /games region filter (same expression as the predicate) then price range
+    "CREATE INDEX IF NOT EXISTS idx_games_region_price ON games(UPPER(IFNULL(region, 'PAL')), average_price)",
+    # Year filters of /games, /export_csv and the gallery, and the year lists; every
+    # year predicate uses this exact expression (see RELEASE_YEAR_SQL)
+    "CREATE INDEX IF NOT EXISTS idx_games_release_year_int ON games(CAST(substr(release_date, 1, 4) AS INTEGER))",
+    # Sort orders of /games and the gallery; id (the rowid) is the implicit last
+    # key, so each index walks in (sort key, id) order in either direction
+    "CREATE INDEX IF NOT EXISTS idx_games_release_date ON games(release_date)",
+    # ...walked backwards, this one also serves /top_games
+    "CREATE INDEX IF NOT EXISTS idx_games_price_sort ON games(average_price)",
+    "CREATE INDEX IF NOT EXISTS idx_games_price_nulls_last ON games((average_price IS NULL), average_price)",
+    "CREATE INDEX IF NOT EXISTS idx_games_date_added_sort ON games(datetime(COALESCE(date_added, '1970-01-01')))",
+    # Games still missing a high-res cover (SQL_HIGH_RES_ARTWORK_STATUS); the
+    # WHERE matches the query's predicate word for word so the planner can use it
+    "CREATE INDEX IF NOT EXISTS idx_games_missing_cover ON games(title) "
+    "WHERE high_res_cover_url IS NULL OR high_res_cover_url = ''",
+    # Latest price_history entry per game (SQL_UPDATE_GAME_PRICE_FROM_HISTORY)
+    "CREATE INDEX IF NOT EXISTS idx_price_history_game_date ON price_history(game_id, datetime(date_recorded) DESC, id DESC)",
+)
+
+
+def list_json_sql(column):
+    """
+    SQL expression turning a list column into a JSON array for json_each(). Values
+    are stored either as a JSON array or as a comma separated string ("A, B").
+    Pure SQL so that triggers work for every script that writes to games.
+    """
+    as_csv = (
+        "'[\"' || REPLACE(REPLACE(REPLACE(IFNULL(" + column + ", ''), '\\', '\\\\'), "
+        "'\"', '\\\"'), ',', '\",\"') || '\"]'"
+    )
+    csv_or_empty = f"(CASE WHEN json_valid({as_csv}) THEN {as_csv} ELSE '[]' END)"
+    # CASE (unlike AND) short-circuits, so json_type() never sees malformed JSON
+    return (
+        f"(CASE WHEN NOT json_valid({column}) THEN {csv_or_empty} "
+        f"WHEN json_type({column}) = 'array' THEN {column} "
+        f"ELSE {csv_or_empty} END)"
+    )
+
+
+def ensure_list_link_table(conn, table, column, value_name):
+    """
+    Maintains table(game_id, <value_name>) with one row per entry of games.<column>,
+    kept in sync by triggers and backfilled when the table is first created.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+
+    def insert_rows(source, id_expr, value_expr, join=""):
+        return (
+            f"INSERT OR IGNORE INTO {table} (game_id, {value_name}) "
+            f"SELECT {id_expr}, TRIM(j.value) FROM {source}json_each({list_json_sql(value_expr)}) j "
+            f"WHERE TRIM(j.value) != ''"
+        )
+
+    statements = [
+        f"""CREATE TABLE IF NOT EXISTS {table} (
+            game_id INTEGER NOT NULL,
+            {value_name} TEXT NOT NULL COLLATE NOCASE,
+            PRIMARY KEY (game_id, {value_name})
+        ) WITHOUT ROWID""",
+        f"CREATE INDEX IF NOT EXISTS idx_{table}_{value_name} ON {table}({value_name}, game_id)",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{table}_insert AFTER INSERT ON games BEGIN
+            {insert_rows("", "NEW.id", f"NEW.{column}")};
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{table}_update AFTER UPDATE OF {column} ON games BEGIN
+            DELETE FROM {table} WHERE game_id = OLD.id;
+            {insert_rows("", "NEW.id", f"NEW.{column}")};
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS trg_{table}_delete AFTER DELETE ON games BEGIN
+            DELETE FROM {table} WHERE game_id = OLD.id;
+        END""",
+    ]
+    if not exists:
+        statements.append(insert_rows("games g, ", "g.id", f"g.{column}"))
+
+    try:
+        for statement in statements:
+            conn.execute(statement)
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"⚠️ Could not set up {table} ({e})")
+
+
+def ensure_title_search_table(conn):
+    """
+    Maintains games_fts, an FTS5 index over games.title that ignores case and
+    accents, kept in sync by triggers and rebuilt when first created.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'games_fts'"
+    ).fetchone()
+
+    statements = [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+            title, content='games', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS trg_games_fts_insert AFTER INSERT ON games BEGIN
+            INSERT INTO games_fts (rowid, title) VALUES (NEW.id, NEW.title);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS trg_games_fts_update AFTER UPDATE OF title ON games BEGIN
+            INSERT INTO games_fts (games_fts, rowid, title) VALUES ('delete', OLD.id, OLD.title);
+            INSERT INTO games_fts (rowid, title) VALUES (NEW.id, NEW.title);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS trg_games_fts_delete AFTER DELETE ON games BEGIN
+            INSERT INTO games_fts (games_fts, rowid, title) VALUES ('delete', OLD.id, OLD.title);
+        END""",
+    ]
+    if not exists:
+        statements.append("INSERT INTO games_fts (games_fts) VALUES ('rebuild')")
+
+    try:
+        for statement in statements:
+            conn.execute(statement)
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"⚠️ Could not set up games_fts ({e})")
+
+
+# Word characters as FTS5's unicode61 tokenizer sees them (no underscore)
+TITLE_SEARCH_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def title_match_query(text):
+    """
+    FTS5 MATCH expression for a free-text title search: every word must
+    appear, each as a prefix ("poke mar" finds "Pokémon Mario").
+    Returns None when the text has no searchable words.
+    """
+    tokens = TITLE_SEARCH_TOKEN_RE.findall(text or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def like_escape(text):
+    """Escape LIKE wildcards so user text only matches literally (pair with ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def prepare_database(conn):
+    """One-time setup for a database file, run on the first pooled connection."""
+    try:
+        # WAL is persistent in the file; it can still be refused (e.g. some network filesystems)
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if journal_mode.lower() != "wal":
+            print(f"⚠️ WAL mode not enabled, journal_mode is {journal_mode}")
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not enable WAL mode: {e}")
+
+    for statement in OBSOLETE_OBJECTS + APP_TABLES + GAMES_INDEXES:
+        try:
+            conn.execute(statement)
+        except sqlite3.Error as e:
+            # Missing table/column on a database that hasn't been migrated yet
+            print(f"⚠️ Skipping index ({e}): {statement}")
+    conn.commit()
+
+    # One row per platform, for exact platform matches without LIKE scans
+    ensure_list_link_table(conn, "game_platforms", "platforms", "platform")
+    # ...and the same for genres ("RPG" must not match "Action RPG")
+    ensure_list_link_table(conn, "game_genres", "genres", "genre")
+
+    # Indexed, accent-insensitive title search (see title_filter)
+    ensure_title_search_table(conn)
+
+
+_db_pools = {}
+_db_read_pools = {}
+_db_pools_lock = threading.Lock()
+
+
+def get_db_pool():
+    # Keyed by path so a re-pointed database_path (tests, reconfig) gets its own pool
+    with _db_pools_lock:
+        pool = _db_pools.get(database_path)
+        if pool is None:
+            pool = _db_pools[database_path] = ConnectionPool(database_path)
+        return pool
+
+
+def get_read_pool():
+    write_pool = get_db_pool()
+    if not write_pool._prepared:
+        # Schema setup (WAL, indexes, link tables) needs a writable connection
+        write_pool.acquire().close()
+    with _db_pools_lock:
+        pool = _db_read_pools.get(database_path)
+        if pool is None:
+            pool = _db_read_pools[database_path] = ConnectionPool(
+                database_path, size=DB_READ_POOL_SIZE, read_only=True
+            )
+        return pool
+
+
+@atexit.register
+def close_db_pools():
+    with _db_pools_lock:
+        pools = list(_db_pools.values()) + list(_db_read_pools.values())
+        _db_pools.clear()
+        _db_read_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+# Columns served by the game list endpoints (/games, /top_games, /recent_games)
+GAME_LIST_COLUMNS = (
+    "id", "title", "description", "publisher", "platforms", "genres", "series",
+    "release_date", "average_price", "youtube_trailer_url",
+    "high_res_cover_url", "high_res_cover_path", "hero_image_url", "hero_image_path",
+    "logo_image_url", "logo_image_path", "icon_image_url", "icon_image_path",
+    "steamgriddb_id", "artwork_last_updated", "region", "date_added",
+)
+
+
+def game_list_columns_sql(conn):
+    """
+    SELECT list for GAME_LIST_COLUMNS. Columns an older, unmigrated database
+    doesn't have yet come back as NULL instead of failing the query.
+    """
+    pool = getattr(conn, "pool", None)
+    select_sql = getattr(pool, "game_list_sql", None)
+    if select_sql is None:
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+        select_sql = ", ".join(col if col in existing else f"NULL AS {col}" for col in GAME_LIST_COLUMNS)
+        if pool is not None:
+            pool.game_list_sql = select_sql
+    return select_sql
+
+
+def game_row_to_dict(row):
+    """Response dict for a row selected with game_list_columns_sql()."""
+    game = dict(row)
+    game["cover_image"] = None  # cover_image column doesn't exist in data/games.db
+    game["region"] = game.get("region") or "PAL"
+    return game
+
+
+def get_db_connection():
+    try:
+        return get_db_pool().acquire()
     except sqlite3.OperationalError as e:
         print(f"🚨 Database Connection Error: {e}")
         raise
 
+
+def get_read_connection():
+    """Pooled read-only connection for handlers that only query; close() returns it."""
+    try:
+        return get_read_pool().acquire()
+    except sqlite3.OperationalError as e:
+        print(f"🚨 Database Connection Error: {e}")
+        raise
+
+# One keep-alive session for every Twitch/IGDB call (token, search, multiquery,
+# lookup by id) so repeat requests reuse the TLS connection instead of paying a
+# fresh handshake each time.
+igdb_http = requests.Session()
+
+# Worker threads for blocking I/O (scrapers, IGDB calls) that a single request
+# can overlap instead of running back to back.
+io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="io")
+
+# Follow-up work for newly saved games (trailer lookup, artwork fetch) that the
+# client response doesn't need to wait for.
+enrichment_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="enrich")
+
+# Twitch app tokens live for ~60 days; keep the current one in-process and
+# only go back to OAuth shortly before it expires (or the credentials change).
+# It's also saved next to config.json so a restart doesn't have to re-authenticate.
+IGDB_TOKEN_EXPIRY_MARGIN = 60  # seconds
+IGDB_TOKEN_FILE = os.path.join(CONFIG_DIR, "igdb_token.json")
+_igdb_token_cache = {"key": None, "token": None, "exp": 0.0}
+_igdb_token_lock = threading.Lock()
+
+
+def _igdb_token_key(client_id, client_secret):
+    # The token file identifies the credentials without storing the secret
+    return hashlib.sha256(f"{client_id}:{client_secret}".encode()).hexdigest()
+
+
+def _igdb_token_valid(entry, cache_key):
+    return (
+        entry.get("key") == cache_key
+        and entry.get("token")
+        and time.time() < entry.get("exp", 0) - IGDB_TOKEN_EXPIRY_MARGIN
+    )
+
+
+def _load_igdb_token_file():
+    try:
+        with open(IGDB_TOKEN_FILE, 'rb') as f:
+            entry = json_loads(f.read())
+        return entry if isinstance(entry, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_igdb_token_file():
+    try:
+        with open(IGDB_TOKEN_FILE, 'wb') as f:
+            f.write(json_dumps(_igdb_token_cache))
+    except OSError as e:
+        logging.warning(f"Could not save IGDB token to {IGDB_TOKEN_FILE}: {e}")
+
+
+def _drop_igdb_token_on_401(response, *args, **kwargs):
+    """Forget a token IGDB has rejected so the next call fetches a fresh one."""
+    if response.status_code == 401 and response.url.startswith("https://api.igdb.com/"):
+        with _igdb_token_lock:
+            _igdb_token_cache.update(key=None, token=None, exp=0.0)
+            try:
+                os.remove(IGDB_TOKEN_FILE)
+            except OSError:
+                pass
+
+
+igdb_http.hooks["response"].append(_drop_igdb_token_on_401)
+
 # Get IGDB access token
 def get_igdb_access_token():
     client_id, client_secret = get_igdb_credentials()
@@ -447,9 +1002,22 @@ def get_igdb_access_token():
         logging.error("IGDB credentials are set to placeholder values")
         return None
     
+    cache_key = _igdb_token_key(client_id, client_secret)
+    with _igdb_token_lock:
+        if _igdb_token_valid(_igdb_token_cache, cache_key):
+            return _igdb_token_cache["token"]
+        saved = _load_igdb_token_file()
+        if _igdb_token_valid(saved, cache_key):
+            _igdb_token_cache.update(key=cache_key, token=saved["token"], exp=saved["exp"])
+            return saved["token"]
+        return _fetch_igdb_access_token(client_id, client_secret)
+
+
+def _fetch_igdb_access_token(client_id, client_secret):
+    """POST to Twitch OAuth and store the new token in _igdb_token_cache and IGDB_TOKEN_FILE."""
     try:
         url = f"https://id.twitch.tv/oauth2/token?client_id={client_id}&client_secret={client_secret}&grant_type=client_credentials"
-        response = requests.post(url)
+        response = igdb_http.post(url)
         response.raise_for_status()
         response_data = response.json()
         
@@ -461,7 +1029,14 @@ def get_igdb_access_token():
         if not access_token:
             logging.error("No access token received from IGDB")
             return None
-            
+
+        expires_in = response_data.get("expires_in") or 0
+        _igdb_token_cache.update(
+            key=_igdb_token_key(client_id, client_secret),
+            token=access_token,
+            exp=time.time() + float(expires_in),
+        )
+        _save_igdb_token_file()
         return access_token
     except requests.exceptions.RequestException as e:
         logging.error(f"Failed to get IGDB access token: {e}")
@@ -470,207 +1045,70 @@ def get_igdb_access_token():
         logging.error(f"Unexpected error getting IGDB access token: {e}")
         return None
 
-# Clean the game title by removing console names
-
-# def scrape_ebay_prices(game_title):
-    """
-    Opens eBay UK homepage, enters the game_title in the search box,
-    waits for the results, and returns the first price found as a float.
-    """
-    options = uc.ChromeOptions()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--start-maximized")
-    # Set a realistic user agent
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36")
-    
-    service = ChromeService(driver_path)
-    driver = uc.Chrome(service=service, options=options)
+# -------------------------
+# Barcode -> title cache
+# -------------------------
+# Barcode lookups scrape a third-party site with a browser; remember resolved
+# titles in SQLite (survives restarts) with an in-memory layer in front.
+BARCODE_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+_barcode_titles = TTLCache(maxsize=4096, ttl=BARCODE_CACHE_TTL)
 
-    try:
-        # 1. Navigate to eBay UK homepage.
-        driver.get("https://www.ebay.co.uk/")
-        time.sleep(2)  # Wait for the page to load.
 
-        # 2. Locate the search box. (eBay's search box typically has id 'gh-ac')
-        search_box = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "gh-ac"))
-        )
-        # 3. Enter the game title and press Enter.
-        search_box.send_keys(game_title)
-        time.sleep(1)
-        search_box.send_keys(Keys.RETURN)
-        time.sleep(3)  # Wait for search results to load.
-
-        # 4. Find price elements. Many eBay listings have a price element with class 's-item__price'
-        price_elements = driver.find_elements(By.CSS_SELECTOR, "span.s-item__price")
-        if price_elements:
-            # For now, we return just the first price.
-            price_text = price_elements[0].text.strip()
-            # Clean up the price text by removing currency symbols and extra words.
-            # Typical formats are "£42.00" or "GBP 42.00"
-            price_text = price_text.replace("£", "").replace("GBP", "").strip()
-            # Sometimes the text might include additional text (e.g., "to" a second price), so take the first token.
-            price_token = price_text.split()[0].replace(",", "")
-            logging.debug(f"Scraped eBay price text: {price_token}")
-            return float(price_token)
-        else:
-            logging.warning("No price elements found on eBay search page.")
-            return None
-    except Exception as e:
-        logging.error(f"Error scraping eBay: {e}")
+def get_cached_barcode_title(barcode):
+    """Return the cached title for barcode, or None if unknown or expired."""
+    if not barcode:
         return None
-    finally:
-        driver.quit()
-
-# NOTE: Old functions below are for compatibility - use modules/scrapers.py instead
+    memo_key = (database_path, barcode)
+    title = _barcode_titles.get(memo_key)
+    if title:
+        return title
 
-# Legacy Amazon scraper (use modules.scrapers.scrape_amazon_price instead)
-def legacy_scrape_amazon_prices(game_title):
-    """
-    Legacy function - redirects to modular scraper or returns empty list
-    """
-    if driver_path is None:
-        print("⚠️ Legacy scraper disabled in Docker environment")
-        return []
-    
-    # Original function body would be here, but disabled for Docker
-    # Opens Amazon's homepage, performs a search for the given game title,
-    # waits for any captcha to be resolved manually, and returns a list of price values found.
-    options = uc.ChromeOptions()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--start-maximized")
-    # Use a realistic user agent:
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                         "AppleWebKit/537.36 (KHTML, like Gecko) "
-                         "Chrome/115.0.0.0 Safari/537.36")
-
-    service = ChromeService(driver_path)
-    driver = uc.Chrome(service=service, options=options)
-    prices = []
+    conn = get_db_connection()
     try:
-        # 1. Go to Amazon's homepage
-        driver.get("https://www.amazon.co.uk/")
-        time.sleep(2)
-
-        # 2. Locate the search box and type the game title, then press Enter
-        search_box = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "twotabsearchtextbox"))
-        )
-        search_box.send_keys(game_title)
-        time.sleep(1)
-        search_box.send_keys(Keys.RETURN)
-
-        # 3. Wait for search results to load and for any captcha to be solved
-        max_wait = 60  # Maximum total wait time (seconds)
-        wait_interval = 5
-        total_wait = 0
-        while "captcha" in driver.page_source.lower() and total_wait < max_wait:
-            logging.info("Captcha detected. Waiting for captcha resolution...")
-            time.sleep(wait_interval)
-            total_wait += wait_interval
-
-        if "captcha" in driver.page_source.lower():
-            logging.error("Captcha still present after waiting; aborting Amazon scrape.")
-            return []  # Or return None to indicate failure
-
-        # 4. Now, attempt to gather all price elements
-        price_elements = driver.find_elements(By.CSS_SELECTOR, "span.a-price-whole")
-        if price_elements:
-            for el in price_elements:
-                price_text = el.text.strip().replace(",", "")
-                try:
-                    price = float(price_text)
-                    prices.append(price)
-                except ValueError:
-                    continue
-        else:
-            logging.warning("No price elements found on Amazon search page.")
-    except Exception as e:
-        logging.error(f"Error scraping Amazon: {e}")
+        row = conn.execute(SQL_BARCODE_CACHE_GET, (barcode,)).fetchone()
+    except sqlite3.Error as e:
+        logging.warning(f"Barcode cache lookup failed: {e}")
+        row = None
     finally:
-        driver.quit()
-    return prices
-
-# Legacy barcode scraper (use modules.scrapers.scrape_barcode_lookup instead)
-def legacy_scrape_barcode_lookup(barcode):
-    """
-    Legacy function - redirects to modular scraper or returns None values
-    """
-    if driver_path is None:
-        print("⚠️ Legacy barcode scraper disabled in Docker environment - using modular scraper")
-        # This should call the imported function instead, but for now just return safe values
-        return None, None
-
-    # Original function would continue here but is disabled for Docker compatibility
-    options = uc.ChromeOptions()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-
-    # Use the Service class to specify the ChromeDriver path and avoid caching issues
-    service = ChromeService(driver_path)
+        conn.close()
 
-    # Initialize the Chrome browser using undetected_chromedriver with the given service and options
-    driver = uc.Chrome(service=service, options=options)
+    if not row:
+        return None
+    remaining = row["ts"] + BARCODE_CACHE_TTL - time.time()
+    if remaining <= 0:
+        return None
+    _barcode_titles.set(memo_key, row["title"], ttl=remaining)
+    return row["title"]
 
-    url = f"https://www.barcodelookup.com/{barcode}"
-    driver.get(url)
 
+def cache_barcode_title(barcode, title):
+    """Remember a successfully resolved barcode."""
+    if not barcode or not title:
+        return
+    conn = get_db_connection()
     try:
-        # Wait for the page to load and the expected element to be located
-        try:
-            WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "div.col-50.product-details")
-            )
-            )
-        except Exception as e:
-            logging.error(f"Failed to find barcode")
-            game_title = None
-            average_price = None
-            driver.quit()
-            return game_title, average_price
-
-        # Extract the game title
-        game_title_element = driver.find_element(
-            By.CSS_SELECTOR, "div.col-50.product-details h4"
-        )
-        game_title = game_title_element.text.strip()
-        logging.debug(f"Game title found: {game_title}")
-
-        # Extract prices and calculate the average price
-        price_elements = driver.find_elements(By.CSS_SELECTOR, "div.store-list li")
-        prices = []
-        for price_element in price_elements:
-            price_text = price_element.text
-            # Extract the price using regex (assuming the price is formatted as $X.XX or £X.XX)
-            price_match = re.search(r"[\$\£]\d+(\.\d{2})?", price_text)
-            if price_match:
-                price = float(price_match.group()[1:])
-                prices.append(price)
-
-        average_price = round(sum(prices) / len(prices), 2) if prices else None
-        logging.debug(f"Average price calculated: {average_price}")
-
-    except Exception as e:
-        logging.error(f"Failed to find elements: {e}")
-        game_title = None
-        average_price = None
+        conn.execute(SQL_BARCODE_CACHE_PUT, (barcode, title, int(time.time())))
+        conn.commit()
+    except sqlite3.Error as e:
+        logging.warning(f"Barcode cache write failed: {e}")
     finally:
-        driver.quit()
-
-    return game_title, average_price
+        conn.close()
+    _barcode_titles.set((database_path, barcode), title)
 
 
 # Clean the game title by removing console names
+# One alternation compiled once; longest names first so "PlayStation 5" is
+# removed whole rather than leaving a stray "5" behind "PlayStation".
+TITLE_NOISE_RE = re.compile(
+    r"\b(?:%s)\b" % "|".join(
+        re.escape(name) for name in sorted(CONSOLE_NAMES + COMPANY_NAMES, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=4096)
 def clean_game_title(game_title):
-    for console in CONSOLE_NAMES:
-        game_title = re.sub(rf"\b{console}\b", "", game_title, flags=re.IGNORECASE)
-    for company in COMPANY_NAMES:
-        game_title = re.sub(rf"\b{company}\b", "", game_title, flags=re.IGNORECASE)
-    return game_title.strip()
+    return TITLE_NOISE_RE.sub("", game_title).strip()
 
 
 # Search for game information on IGDB
@@ -688,7 +1126,7 @@ def search_igdb_game(game_name, auth_token):
 
     try:
         # Encode the body in UTF-8
-        response = requests.post(url, headers=headers, data=body.encode('utf-8'), timeout=timeout_duration)
+        response = igdb_http.post(url, headers=headers, data=body.encode('utf-8'), timeout=timeout_duration)
         response.raise_for_status()
         response_json = response.json()
         return response_json
@@ -707,6 +1145,155 @@ def remove_last_word(game_title):
         return " ".join(words[:-1])
     return game_title
 
+def enumerate_attempts(game_name, max_attempts=30, trim_fully=True):
+    """
+    Builds the ladder of title variants to try on IGDB, in preference order:
+    the title itself, then its cleaned form and each word-trimmed version,
+    breadth first. Duplicates are dropped and the ladder is capped at max_attempts.
+
+    With trim_fully=False only one word is trimmed per step, so shorter
+    variants are reached through the queue rather than all at once.
+    """
+    queue = [game_name]
+    attempts = []
+    seen = set()
+    while queue and len(attempts) < max_attempts:
+        current_title = queue.pop(0).strip()
+        if not current_title or current_title in seen:
+            continue
+        seen.add(current_title)
+        attempts.append(current_title)
+
+        cleaned_title = clean_game_title(current_title)
+        if cleaned_title and cleaned_title != current_title:
+            queue.append(cleaned_title)
+        next_attempt = remove_last_word(current_title)
+        while next_attempt and next_attempt != current_title:
+            queue.append(next_attempt)
+            if not trim_fully:
+                break
+            current_title = next_attempt
+            next_attempt = remove_last_word(current_title)
+    return attempts
+
+
+IGDB_GAME_FIELDS = "name, cover.url, summary, platforms.name, genres.name, involved_companies.company.name, first_release_date"
+# IGDB's /multiquery endpoint accepts at most 10 queries per request
+IGDB_MULTIQUERY_LIMIT = 10
+
+# Title searches repeat across scans (shared base names, the same trim ladder);
+# keep IGDB's answer for a while, keyed by the normalized search text.
+IGDB_SEARCH_CACHE_TTL = 3600
+_igdb_searches = TTLCache(maxsize=4096, ttl=IGDB_SEARCH_CACHE_TTL)
+
+
+def search_igdb_multiquery(titles, auth_token):
+    """
+    Runs one IGDB game search per title in a single /v4/multiquery request.
+    Returns a list of result lists aligned with titles (empty on error).
+    Titles searched within the last IGDB_SEARCH_CACHE_TTL seconds are answered
+    from _igdb_searches and left out of the request.
+    """
+    # A stray quote would break the whole batch, not just its own query
+    search_texts = [title.replace('"', '') for title in titles]
+    keys = [text.strip().lower() for text in search_texts]
+    results = []
+    for key in keys:
+        cached = _igdb_searches.get(key)
+        # Kept serialized so callers can't modify the cached copy
+        results.append(None if cached is None else json_loads(cached))
+    missing = [idx for idx, result in enumerate(results) if result is None]
+    if not missing:
+        return results
+
+    url = "https://api.igdb.com/v4/multiquery"
+    client_id, _ = get_igdb_credentials()
+    headers = {
+        "Client-ID": client_id,
+        "Authorization": f"Bearer {auth_token}",
+    }
+    queries = []
+    for idx in missing:
+        queries.append(f'query games "v{idx}" {{ search "{search_texts[idx]}"; fields {IGDB_GAME_FIELDS}; limit 10; }};')
+    body = "".join(queries)
+
+    logging.debug(f"IGDB multiquery for {len(missing)} titles: {[titles[idx] for idx in missing]}")
+    try:
+        response = igdb_http.post(url, headers=headers, data=body.encode('utf-8'), timeout=10)
+        response.raise_for_status()
+        by_name = {entry.get("name"): entry.get("result") or [] for entry in response.json()}
+    except requests.exceptions.Timeout:
+        logging.error(f"Timeout while querying IGDB multiquery for {titles}")
+        return [[] for _ in titles]
+    except (requests.exceptions.RequestException, ValueError, AttributeError) as e:
+        logging.error(f"IGDB multiquery error: {e}")
+        return [[] for _ in titles]
+    for idx in missing:
+        results[idx] = by_name.get(f"v{idx}", [])
+        _igdb_searches.set(keys[idx], json_dumps(results[idx]))
+    return results
+
+
+def iter_igdb_attempts(attempts, auth_token):
+    """
+    Yields (title, results) for each attempt in ladder order.
+
+    Attempts are sent in /multiquery batches, so a 30-step ladder costs at most
+    three round trips; the next batch is only requested once the caller has
+    consumed the previous one.
+    """
+    for start in range(0, len(attempts), IGDB_MULTIQUERY_LIMIT):
+        batch = attempts[start:start + IGDB_MULTIQUERY_LIMIT]
+        logging.debug(f"IGDB Search Attempts {start + 1}-{start + len(batch)}/{len(attempts)}")
+        yield from zip(batch, search_igdb_multiquery(batch, auth_token))
+
+
+def search_igdb_attempts(attempts, auth_token):
+    """
+    Returns (title, results) for the earliest attempt IGDB has results for, or (None, []).
+    """
+    for title, results in iter_igdb_attempts(attempts, auth_token):
+        if results:
+            return title, results
+    return None, []
+
+
+# Once one title is 8x the length of the other, WRatio caps its partial matches
+# at 60 and the plain ratio is far below that.
+WRATIO_CAPPED_LENGTH_RATIO = 8
+WRATIO_CAPPED_SCORE = 60
+
+
+def title_scores(query, names, above=None):
+    """
+    Scores query against every name in one rapidfuzz pass, aligned with names.
+    Uses WRatio with default preprocessing, rounded to integers (as fuzzywuzzy did).
+
+    When the caller only cares about scores above a threshold of at least 60,
+    names whose length rules that out are skipped (scored 0) before the fuzzy pass.
+    """
+    scores = [0] * len(names)
+    candidates = list(range(len(names)))
+    if above is not None and above >= WRATIO_CAPPED_SCORE:
+        query_len = len(rf_utils.default_process(query))
+        candidates = [
+            idx for idx in candidates
+            if _length_ratio(query_len, len(rf_utils.default_process(names[idx]))) < WRATIO_CAPPED_LENGTH_RATIO
+        ]
+    for _, score, pos in rf_process.extract(
+        query, [names[idx] for idx in candidates],
+        scorer=rf_fuzz.WRatio, processor=rf_utils.default_process, limit=None
+    ):
+        scores[candidates[pos]] = int(round(score))
+    return scores
+
+
+def _length_ratio(a, b):
+    if not a or not b:
+        return float("inf")
+    return max(a, b) / min(a, b)
+
+
 def fuzzy_match_title(search_title, igdb_results):
     """
     Uses fuzzy matching to find the closest game title from IGDB results.
@@ -716,7 +1303,16 @@ def fuzzy_match_title(search_title, igdb_results):
     if not game_titles:
         return None  # No valid game titles found
 
-    best_match, score = process.extractOne(search_title, game_titles)
+    # Most IGDB top results are exact hits, so skip the scoring pass for those
+    wanted = normalize_for_search(search_title).strip()
+    for game in igdb_results if wanted else ():
+        if "name" in game and normalize_for_search(game["name"]).strip() == wanted:
+            logging.debug(f"Exact match found: {game['name']}")
+            return game
+
+    scores = title_scores(search_title, game_titles, above=80)
+    score = max(scores)
+    best_match = game_titles[scores.index(score)]
 
     if score > 80:  # Only accept high-confidence matches
         for game in igdb_results:
@@ -854,22 +1450,25 @@ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
 
     return False
 
-def get_game_alert_settings(game_id):
-    """Get alert settings for a specific game (with global fallbacks)"""
-    try:
-        config = load_notification_config()
-        conn = sqlite3.connect(database_path)
-        cursor = conn.cursor()
+SQL_GAME_ALERT_SETTINGS = """
+    SELECT enabled, price_source, price_region, price_drop_threshold, price_increase_threshold,
+           alert_price_threshold, alert_value_threshold
+    FROM game_alert_settings
+    WHERE game_id = ?
+"""
 
-        cursor.execute("""
-            SELECT enabled, price_source, price_region, price_drop_threshold, price_increase_threshold,
-                   alert_price_threshold, alert_value_threshold
-            FROM game_alert_settings
-            WHERE game_id = ?
-        """, (game_id,))
+def get_game_alert_settings(game_id, conn=None):
+    """Get alert settings for a specific game (with global fallbacks)
 
-        result = cursor.fetchone()
-        conn.close()
+    Pass conn to read through a connection the caller already holds.
+    """
+    try:
+        config = load_notification_config()
+        if conn is None:
+            with closing(get_db_connection()) as own_conn:
+                result = own_conn.execute(SQL_GAME_ALERT_SETTINGS, (game_id,)).fetchone()
+        else:
+            result = conn.execute(SQL_GAME_ALERT_SETTINGS, (game_id,)).fetchone()
 
         if result:
             enabled, price_source, price_region, drop_thresh, increase_thresh, price_thresh, value_thresh = result
@@ -917,29 +1516,22 @@ def check_price_change_and_alert(game_id, new_price, source):
         if not game_settings['enabled']:
             return
 
-        # Get the most recent price from history
-        conn = sqlite3.connect(database_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT price FROM price_history
-            WHERE game_id = ?
-            ORDER BY date_recorded DESC
-            LIMIT 1
-        """, (game_id,))
+        with closing(get_db_connection()) as conn:
+            # Get the most recent price from history
+            result = conn.execute("""
+                SELECT price FROM price_history
+                WHERE game_id = ?
+                ORDER BY date_recorded DESC
+                LIMIT 1
+            """, (game_id,)).fetchone()
 
-        result = cursor.fetchone()
+            # Get game title for the alert
+            game_result = conn.execute("SELECT title FROM games WHERE id = ?", (game_id,)).fetchone() if result else None
 
         if result:
             old_price = result[0]
-
-            # Get game title for the alert
-            cursor.execute("SELECT title FROM games WHERE id = ?", (game_id,))
-            game_result = cursor.fetchone()
             game_title = game_result[0] if game_result else f"Game {game_id}"
 
-            conn.close()
-
             # Check if change meets threshold
             if old_price > 0:
                 change_percent = ((new_price - old_price) / old_price) * 100
@@ -960,8 +1552,6 @@ def check_price_change_and_alert(game_id, new_price, source):
                 # Price increase alert
                 elif change_percent >= game_settings['price_increase_threshold']:
                     send_price_alert(game_title, old_price, new_price, source, 'increase')
-        else:
-            conn.close()
 
     except Exception as e:
         print(f"❌ Error checking price change: {e}")
@@ -969,35 +1559,44 @@ def check_price_change_and_alert(game_id, new_price, source):
 # -------------------------
 # Health Check Endpoint
 # -------------------------
+# Fields that never change for the life of the process; monitors poll /health
+# every few seconds so there's no point rebuilding them on each request.
+_STATIC_HEALTH = {
+    "python_version": sys.version,
+    "working_directory": os.getcwd(),
+}
+
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint for Docker/Portainer monitoring"""
     health_data = {
+        **_STATIC_HEALTH,
         "status": "healthy",
         "timestamp": time.time(),
-        "python_version": sys.version,
-        "working_directory": os.getcwd(),
         "database_path": database_path,
     }
     
     try:
         # Check if database file exists
-        health_data["database_exists"] = os.path.exists(database_path)
-        health_data["database_readable"] = os.access(database_path, os.R_OK) if os.path.exists(database_path) else False
-        health_data["database_writable"] = os.access(database_path, os.W_OK) if os.path.exists(database_path) else False
-        
-        # Check database connectivity
-        conn = sqlite3.connect(database_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        cursor.execute("SELECT COUNT(*) FROM games")
-        game_count = cursor.fetchone()[0]
-        conn.close()
+        database_exists = os.path.exists(database_path)
+        health_data["database_exists"] = database_exists
+        health_data["database_readable"] = database_exists and os.access(database_path, os.R_OK)
+        health_data["database_writable"] = database_exists and os.access(database_path, os.W_OK)
+        
+        # Check database connectivity (the count query doubles as the ping). A fresh
+        # connection on purpose: a pooled one keeps working on a file that's been
+        # deleted or unmounted, which is exactly what this should catch. Read-only,
+        # so a missing file is reported instead of being created empty
+        conn = sqlite3.connect(f"{Path(database_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            game_count = conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+        finally:
+            conn.close()
         
         health_data["database"] = "connected"
         health_data["game_count"] = game_count
         
-        return jsonify(health_data), 200
+        return json_response(health_data, 200)
     except Exception as e:
         health_data["status"] = "unhealthy"
         health_data["error"] = str(e)
@@ -1010,10 +1609,81 @@ def health_check():
         except:
             pass
             
-        return jsonify(health_data), 503
+        return json_response(health_data, 503)
+
+# -------------------------
+# Price scraping dispatch
+# -------------------------
+def _scrape_pricecharting(search_query, region, prefer_boxed):
+    pricecharting_data = scrape_pricecharting_price(search_query, None, region)
+    # Use condition-aware pricing based on preference
+    price = get_pricecharting_price_by_condition(pricecharting_data, prefer_boxed)
+    if pricecharting_data:
+        logging.debug(
+            f"PriceCharting pricing breakdown - Loose: £{pricecharting_data.get('loose_price')}, "
+            f"CIB: £{pricecharting_data.get('cib_price')}, New: £{pricecharting_data.get('new_price')}"
+        )
+        logging.debug(f"Selected price: £{price}")
+    return price
+
+
+# price source -> scraper(search_query, region, prefer_boxed)
+PRICE_SCRAPERS = {
+    "Amazon": lambda search_query, region, prefer_boxed: scrape_amazon_price(search_query),
+    "CeX": lambda search_query, region, prefer_boxed: scrape_cex_price(search_query),
+    "PriceCharting": _scrape_pricecharting,
+    "eBay": lambda search_query, region, prefer_boxed: scrape_ebay_prices(search_query),
+}
+
+
+def scrape_price(price_source, search_query, region, prefer_boxed=True):
+    """Scrape a price from the given source (unknown sources fall back to eBay)."""
+    scraper = PRICE_SCRAPERS.get(price_source, PRICE_SCRAPERS["eBay"])
+    return scraper(search_query, region, prefer_boxed)
+
+
+def scrape_prices(price_sources, search_query, region, prefer_boxed=True):
+    """
+    Scrape several sources at once on io_executor, so the wait is the slowest
+    source rather than the sum of them. Returns {source: price}; a source that
+    fails or finds nothing maps to None.
+    """
+    futures = {
+        source: io_executor.submit(scrape_price, source, search_query, region, prefer_boxed)
+        for source in price_sources
+    }
+    prices = {}
+    for source, future in futures.items():
+        try:
+            prices[source] = future.result()
+        except Exception as e:
+            logging.error(f"Price scrape from {source} failed: {e}")
+            prices[source] = None
+    return prices
+
+
+def find_youtube_trailer_url(title, platforms):
+    """Look up a YouTube trailer for the game's first platform; None if not found."""
+    if not title or not platforms:
+        return None
+    search_query = f"{title} {platforms[0]}"
+    try:
+        video_id = get_youtube_video_id(search_query)
+        if video_id:
+            youtube_trailer_url = f"https://www.youtube.com/watch?v={video_id}"
+            logging.debug(f"Found YouTube trailer: {youtube_trailer_url}")
+            return youtube_trailer_url
+    except Exception as e:
+        logging.warning(f"Failed to fetch YouTube trailer for {title}: {e}")
+    return None
+
 
 class GameScan:
-    response_data = None  # Class variable to store response data
+    # IGDB results per scan, keyed by the scan_id returned from /scan. The iOS
+    # Shortcut doesn't send scan_id back, so /confirm can name the scan by the
+    # barcode it scanned instead. Both entries go once the scan is confirmed.
+    scans = TTLCache(maxsize=1024, ttl=1800)
+    scan_ids_by_barcode = TTLCache(maxsize=1024, ttl=1800)
 
     @staticmethod
     @app.route("/scan", methods=["POST"])
@@ -1039,6 +1709,12 @@ class GameScan:
                     "instructions": "Get your credentials from https://dev.twitch.tv/console/apps"
                 }), 400
 
+            # The barcode scrape drives a browser and is by far the slowest step,
+            # so skip it for barcodes we've already resolved, or otherwise start
+            # it before talking to Twitch and overlap the two.
+            cached_title = get_cached_barcode_title(barcode)
+            barcode_lookup = None if cached_title else io_executor.submit(scrape_barcode_lookup, barcode)
+
             igdb_access_token = get_igdb_access_token()
             if not igdb_access_token:
                 return jsonify({
@@ -1048,15 +1724,17 @@ class GameScan:
                 }), 500
 
             # Lookup via barcode to obtain game title
-            game_title, _ = scrape_barcode_lookup(barcode)
+            if cached_title:
+                game_title = cached_title
+            else:
+                game_title, _ = barcode_lookup.result()
+                cache_barcode_title(barcode, game_title)
             game_title = game_title if game_title else "Unknown Game"
 
             # Check if the game already exists in the database.
-            BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-            db_path = os.path.join(BASE_DIR, database_path)
-            conn = get_db_connection()
+            conn = get_read_connection()
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM games WHERE title = ?", (game_title,))
+            cursor.execute(SQL_GAME_ID_BY_TITLE, (game_title,))
             existing_game = cursor.fetchone()
             conn.close()
             if existing_game:
@@ -1076,16 +1754,20 @@ class GameScan:
 
 
             # Store the IGDB results (keep original for internal use in /confirm)
-            GameScan.response_data = {
+            scan_id = uuid.uuid4().hex
+            GameScan.scans.set(scan_id, {
                 "barcode": barcode,
                 "game_title": game_title,
                 "exact_match": exact_match,
                 "alternative_matches": alternative_matches,
                 "combined_price": combined_price
-            }
+            })
+            if barcode:
+                GameScan.scan_ids_by_barcode.set(barcode, scan_id)
 
             # Return response in exact format that the iOS Shortcut expects
             response = {
+                "scan_id": scan_id,
                 "exact_match": {
                     "index": 1,
                     "name": exact_match["name"],
@@ -1112,14 +1794,14 @@ class GameScan:
     @app.route("/confirm", methods=["POST"])
     def confirm():
         try:
-            BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-            db_path = os.path.join(BASE_DIR, database_path)
-            logging.debug(f"Database path: {db_path}")
+            logging.debug(f"Database path: {database_path}")
 
             data = request.json
             logging.debug(f"Received /confirm payload: {json.dumps(data, indent=2)}")
 
-            if not GameScan.response_data:
+            scan_id = data.get("scan_id") or GameScan.scan_ids_by_barcode.get(data.get("barcode"))
+            scan_data = GameScan.scans.get(scan_id) if scan_id else None
+            if not scan_data:
                 return jsonify({"error": "No stored game data available"}), 400
 
             selection_str = data.get("selection")
@@ -1131,8 +1813,8 @@ class GameScan:
             except ValueError:
                 return jsonify({"error": "Selection must be an integer"}), 400
 
-            exact_match = GameScan.response_data.get("exact_match")
-            all_alts = GameScan.response_data.get("alternative_matches", [])
+            exact_match = scan_data.get("exact_match")
+            all_alts = scan_data.get("alternative_matches", [])
             if selection_idx == 1:
                 selected_game = exact_match
             else:
@@ -1220,24 +1902,21 @@ class GameScan:
             logging.debug(f"Using region for price scraping: {region}")
             
             # Perform price scraping using the selected source
-            if price_source == "Amazon":
-                scraped_price = scrape_amazon_price(search_query)
-            elif price_source == "CeX":
-                scraped_price = scrape_cex_price(search_query)
-            elif price_source == "PriceCharting":
-                # Use region from request or default to PAL
-                pricecharting_data = scrape_pricecharting_price(search_query, None, region)
-                # Get condition preference from request (default to CiB preference)
-                prefer_boxed = data.get("prefer_boxed", True)
-                # Use condition-aware pricing based on preference
-                scraped_price = get_pricecharting_price_by_condition(pricecharting_data, prefer_boxed)
-                
-                if pricecharting_data:
-                    logging.debug(f"PriceCharting pricing breakdown - Loose: £{pricecharting_data.get('loose_price')}, "
-                                f"CIB: £{pricecharting_data.get('cib_price')}, New: £{pricecharting_data.get('new_price')}")
-                    logging.debug(f"Selected price: £{scraped_price}")
-            else:  # Default to eBay
-                scraped_price = scrape_ebay_prices(search_query)
+            # Get condition preference from request (default to CiB preference)
+            prefer_boxed = data.get("prefer_boxed", True)
+            # Optional list of sources to scrape side by side; the median of what they find is used
+            price_sources = data.get("price_sources") or []
+            if not isinstance(price_sources, list):
+                return jsonify({"error": "price_sources must be a list"}), 400
+            price_sources = [source for source in price_sources if isinstance(source, str) and source in PRICE_SCRAPERS]
+            if price_sources:
+                prices_by_source = scrape_prices(price_sources, search_query, region, prefer_boxed)
+                found = [price for price in prices_by_source.values() if price is not None]
+                scraped_price = statistics.median(found) if found else None
+                game_data["prices_by_source"] = prices_by_source
+                price_source = ", ".join(price_sources)
+            else:
+                scraped_price = scrape_price(price_source, search_query, region, prefer_boxed)
             
             game_data["average_price"] = scraped_price
             game_data["region"] = region
@@ -1246,6 +1925,10 @@ class GameScan:
             logging.debug(f"Using region: {region}")
 
             inserted = save_game_to_db(game_data)
+            # The scan is settled either way; a retry needs a new /scan
+            GameScan.scans.pop(scan_id)
+            if GameScan.scan_ids_by_barcode.get(scan_data["barcode"]) == scan_id:
+                GameScan.scan_ids_by_barcode.pop(scan_data["barcode"])
             if not inserted:
                 return jsonify({
                     "error": f"Game with title '{game_data['title']}' already exists in the database."
@@ -1259,49 +1942,26 @@ class GameScan:
             return jsonify({"error": str(e)}), 500
     
 def search_game_fuzzy_with_alternates(game_name, auth_token, max_attempts=30, fuzzy_threshold=60):
-    search_attempts = [game_name]
-    attempt_count = 0
-    best_results = []
-
-    while search_attempts and attempt_count < max_attempts:
-        current_title = search_attempts.pop(0).strip()
-        attempt_count += 1
-        logging.debug(f"IGDB Search Attempt {attempt_count}/{max_attempts} for: {current_title}")
-
-        igdb_response = search_igdb_game(current_title, auth_token)
-        if igdb_response:
-            best_results = igdb_response
-            break
-
-        cleaned_title = clean_game_title(current_title)
-        if cleaned_title and cleaned_title != current_title:
-            search_attempts.append(cleaned_title)
-        next_attempt = remove_last_word(current_title)
-        while next_attempt and next_attempt != current_title:
-            search_attempts.append(next_attempt)
-            current_title = next_attempt
-            next_attempt = remove_last_word(current_title)
+    _, best_results = search_igdb_attempts(enumerate_attempts(game_name, max_attempts), auth_token)
 
     if not best_results:
         return None, []
 
-    game_names = [g["name"] for g in best_results if "name" in g]
-    if not game_names:
+    named_results = [g for g in best_results if "name" in g]
+    if not named_results:
         return None, []
 
-    # Best fuzzy match for the entire list:
-    best_match_name, best_score = process.extractOne(game_name, game_names)
+    # Score every candidate against the user's original search in one pass
+    scores = title_scores(game_name, [g["name"] for g in named_results])
+    best_score = max(scores)
     if best_score < fuzzy_threshold:
         # The top match isn't even above threshold => no results
         return None, []
+    best_match_name = named_results[scores.index(best_score)]["name"]
 
     exact_match = None
     alternative_matches = []
-    for g in best_results:
-        if "name" not in g:
-            continue
-        # Compare this game's name to the user's original search
-        score = process.extractOne(game_name, [g["name"]])[1]
+    for g, score in zip(named_results, scores):
         logging.debug(f"Candidate: {g['name']} => Score: {score}")
 
         if g["name"] == best_match_name:
@@ -1319,141 +1979,181 @@ def search_game_with_fuzzy_matching(game_name, auth_token, max_attempts=30):
     and fuzzy matching to find the best possible game match.
     Always returns a tuple: (exact_match, alternative_match), with alternative_match as None if not available.
     """
-    search_attempts = [game_name]
-    attempt_count = 0  
-
-    while search_attempts and attempt_count < max_attempts:
-        current_title = search_attempts.pop(0).strip()
-        attempt_count += 1
-
-        logging.debug(f"IGDB Search Attempt {attempt_count}/{max_attempts} for: {current_title}")
-        igdb_response = search_igdb_game(current_title, auth_token)
-
-        if igdb_response:
-            # Check for an exact match
-            for game in igdb_response:
-                if "name" in game and game["name"].lower() == current_title.lower():
-                    logging.debug(f"✅ Exact match found: {game['name']}")
-                    return game, None  # Always return a tuple (exact_match, alternative_match)
-
-            # Try fuzzy matching if no exact match is found
-            fuzzy_match = fuzzy_match_title(current_title, igdb_response)
-            if fuzzy_match:
-                return fuzzy_match, None
-
-        # If no match, generate new variations of the title
-        if attempt_count < max_attempts:
-            cleaned_title = clean_game_title(current_title)
-            if cleaned_title and cleaned_title != current_title:
-                search_attempts.append(cleaned_title)
-            next_attempt = remove_last_word(current_title)
-            while next_attempt and next_attempt != current_title:
-                search_attempts.append(next_attempt)
-                current_title = next_attempt  # Continue trimming
-                next_attempt = remove_last_word(current_title)
+    for current_title, igdb_response in iter_igdb_attempts(enumerate_attempts(game_name, max_attempts), auth_token):
+        if not igdb_response:
+            continue
+
+        # Check for an exact match
+        for game in igdb_response:
+            if "name" in game and game["name"].lower() == current_title.lower():
+                logging.debug(f"✅ Exact match found: {game['name']}")
+                return game, None  # Always return a tuple (exact_match, alternative_match)
+
+        # Try fuzzy matching if no exact match is found
+        fuzzy_match = fuzzy_match_title(current_title, igdb_response)
+        if fuzzy_match:
+            return fuzzy_match, None
 
     logging.warning("⏳ Max API attempts reached. Returning best available results.")
     return None, None
 
 
 def search_game_with_alternatives(game_name, auth_token, max_attempts=50):
-    search_attempts = [game_name]
+    attempts = enumerate_attempts(game_name, max_attempts, trim_fully=False)
+    current_title, igdb_response = search_igdb_attempts(attempts, auth_token)
+    if not igdb_response:
+        logging.warning("⏳ Max API attempts reached. Returning best available results.")
+        return None, []
+
     exact_match = None
     alternative_matches = []
-    attempt_count = 0
-
-    while search_attempts and attempt_count < max_attempts:
-        current_title = search_attempts.pop(0).strip()
-        attempt_count += 1
-        logging.debug(f"IGDB Search Attempt {attempt_count}/{max_attempts} for: {current_title}")
-        igdb_response = search_igdb_game(current_title, auth_token)
-
-        if igdb_response:
-            # Find an exact match (case insensitive)
-            for game in igdb_response:
-                if "name" in game and game["name"].lower() == current_title.lower():
-                    if not exact_match:
-                        exact_match = game
-                        logging.debug(f"Exact match found: {game['name']}")
-
-            # Consider all games that are not the exact match as potential alternatives.
-            for game in igdb_response:
-                if exact_match and game["name"].lower() != exact_match["name"].lower():
-                    # Optionally, use fuzzy matching to ensure quality (e.g., score > 60)
-                    score = process.extractOne(game_name, [game["name"]])[1]
-                    if score > 60:
-                        alternative_matches.append(game)
-                        logging.debug(f"Alternative match candidate (score {score}): {game['name']}")
-                elif not exact_match:
-                    # If there's no exact match yet, add all as alternatives.
-                    alternative_matches.append(game)
-                    logging.debug(f"Alternative match candidate: {game['name']}")
-
-            if exact_match or alternative_matches:
-                return exact_match, alternative_matches
-
-        # If no match, try modifying the title
-        cleaned_title = clean_game_title(current_title)
-        if cleaned_title and cleaned_title != current_title:
-            search_attempts.append(cleaned_title)
-        next_attempt = remove_last_word(current_title)
-        if next_attempt and next_attempt != current_title:
-            search_attempts.append(next_attempt)
 
-    logging.warning("⏳ Max API attempts reached. Returning best available results.")
+    # Find an exact match (case insensitive)
+    for game in igdb_response:
+        if "name" in game and game["name"].lower() == current_title.lower():
+            if not exact_match:
+                exact_match = game
+                logging.debug(f"Exact match found: {game['name']}")
+
+    # Consider all games that are not the exact match as potential alternatives.
+    scores = title_scores(game_name, [game.get("name", "") for game in igdb_response], above=60) if exact_match else []
+    for idx, game in enumerate(igdb_response):
+        if exact_match and game["name"].lower() != exact_match["name"].lower():
+            # Optionally, use fuzzy matching to ensure quality (e.g., score > 60)
+            score = scores[idx]
+            if score > 60:
+                alternative_matches.append(game)
+                logging.debug(f"Alternative match candidate (score {score}): {game['name']}")
+        elif not exact_match:
+            # If there's no exact match yet, add all as alternatives.
+            alternative_matches.append(game)
+            logging.debug(f"Alternative match candidate: {game['name']}")
+
     return exact_match, alternative_matches
 
-@app.route("/top_games", methods=["GET"])
-def get_top_games():
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    db_path = os.path.join(BASE_DIR, database_path)
+# /top_games is read far more often than prices change. Writes made through the
+# app clear it; the TTL bounds staleness from scripts that write to the DB directly.
+TOP_GAMES_CACHE_TTL = 60
+_top_games = TTLCache(maxsize=16, ttl=TOP_GAMES_CACHE_TTL)
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM games WHERE average_price IS NOT NULL AND id != -1 ORDER BY average_price DESC LIMIT 5")
-    games = cursor.fetchall()
-    conn.close()
 
-    game_list = []
-    for game in games:
-        game_list.append(
-            {
-                "id": game[0],
-                "title": game[1],
-                "cover_image": None,  # cover_image column doesn't exist in data/games.db
-                "description": game[2],
-                "publisher": game[3],
-                "platforms": game[4],
-                "genres": game[5],
-                "series": game[6],
-                "release_date": game[7],
-                "average_price": game[8],
-                "youtube_trailer_url": game[9] if len(game) > 9 else None,
-                # High-resolution artwork (if available)
-                "high_res_cover_url": game[10] if len(game) > 10 else None,
-                "high_res_cover_path": game[11] if len(game) > 11 else None,
-                "hero_image_url": game[12] if len(game) > 12 else None,
-                "hero_image_path": game[13] if len(game) > 13 else None,
-                "logo_image_url": game[14] if len(game) > 14 else None,
-                "logo_image_path": game[15] if len(game) > 15 else None,
-                "icon_image_url": game[16] if len(game) > 16 else None,
-                "icon_image_path": game[17] if len(game) > 17 else None,
-                "steamgriddb_id": game[18] if len(game) > 18 else None,
-                "artwork_last_updated": game[19] if len(game) > 19 else None,
-                "region": (game[20] if len(game) > 20 else None) or "PAL",
-                "date_added": game[21] if len(game) > 21 else None,
-            }
-        )
+# Filtered /games totals, so paging through one result set counts it once
+GAMES_COUNT_CACHE_TTL = 30
+_games_counts = TTLCache(maxsize=256, ttl=GAMES_COUNT_CACHE_TTL)
+
+
+# Serialized /api/gallery/filters body per database; every gallery open asks for it
+GALLERY_FILTERS_CACHE_TTL = 300
+_gallery_filters = TTLCache(maxsize=16, ttl=GALLERY_FILTERS_CACHE_TTL)
+
+
+def invalidate_game_caches():
+    """Drop cached game listings after the games table changes."""
+    _top_games.clear()
+    _games_counts.clear()
+    _gallery_filters.clear()
 
-    return jsonify(game_list)
+
+# Release year as every year filter and year list computes it, so all of them
+# can use idx_games_release_year_int. Unlike strftime('%Y', ...), it also reads
+# bare "1998" dates, which strftime takes for a Julian day number.
+RELEASE_YEAR_SQL = "CAST(substr({}, 1, 4) AS INTEGER)"
+
+
+# Cost ranks for /games, /export_csv and gallery filters. SQLite tests the terms it
+# can't answer from an index in the order written, so cheap comparisons go
+# first and rows they reject never reach the LIKE scans.
+FILTER_EQUALITY, FILTER_RANGE, FILTER_LIKE, FILTER_TITLE_LIKE = range(4)
+
+
+def where_clause(filters):
+    """Joins (rank, sql, params) filters cheapest first into a WHERE body and its params."""
+    filters = sorted(filters, key=lambda f: f[0])
+    sql = " AND ".join(clause for _, clause, _ in filters)
+    params = [param for _, _, clause_params in filters for param in clause_params]
+    return sql, params
+
+
+def title_filter(text, table=""):
+    """
+    (rank, sql, params) filter for a free-text title search, the same for /games,
+    /export_csv and the gallery. The FTS index ignores case and accents, so
+    "Pokemon" finds "Pokémon" and vice versa. table qualifies the columns ("g").
+    """
+    prefix = f"{table}." if table else ""
+    match_query = title_match_query(text)
+    if match_query:
+        return (FILTER_EQUALITY, f"{prefix}id IN (SELECT rowid FROM games_fts WHERE games_fts MATCH ?)", [match_query])
+    # Punctuation-only search: nothing for the index to match on
+    return (FILTER_TITLE_LIKE, f"{prefix}title LIKE ? ESCAPE '\\'", [f"%{like_escape(text)}%"])
+
+
+# /games sort orders: sort param -> (column, SQL wrapping it, descending, NULLs last).
+# id breaks ties so every order is total and can be resumed from a cursor.
+GAMES_SORTS = {
+    None: ("id", "{}", False, False),
+    "alphabetical": ("title", "{}", False, False),
+    "title_desc": ("title", "{}", True, True),
+    "highest": ("average_price", "{}", True, True),
+    "lowest": ("average_price", "{}", False, True),
+    "recent": ("date_added", "datetime(COALESCE({}, '1970-01-01'))", True, False),
+}
+
+
+def games_order_by(sort, sorts=GAMES_SORTS, id_column="id", default=None):
+    column, wrap, descending, nulls_last = sorts.get(sort, sorts[default])
+    direction = "DESC" if descending else "ASC"
+    key = wrap.format(column)
+    if column == id_column:
+        return f" ORDER BY {id_column} {direction}"
+    nulls = f"({key} IS NULL), " if nulls_last and not descending else ""
+    return f" ORDER BY {nulls}{key} {direction}, {id_column} {direction}"
+
+
+def games_after_cursor(sort, after_value, after_id, sorts=GAMES_SORTS, id_column="id", default=None):
+    """
+    WHERE clause (and params) selecting the rows that come after the row
+    (after_value, after_id) in the given sort order.
+    """
+    column, wrap, descending, nulls_last = sorts.get(sort, sorts[default])
+    op = "<" if descending else ">"
+    if column == id_column:
+        return f" AND {id_column} {op} ?", [after_id]
+
+    key = wrap.format(column)
+    if wrap != "{}":
+        # Wrapped keys are never NULL; wrap the cursor value the same way
+        return f" AND ({key}, {id_column}) {op} ({wrap.format('?')}, ?)", [after_value, after_id]
+    if after_value is None:
+        if nulls_last:
+            return f" AND {key} IS NULL AND {id_column} {op} ?", [after_id]
+        return f" AND (({key} IS NULL AND {id_column} {op} ?) OR {key} IS NOT NULL)", [after_id]
+    if nulls_last:
+        return f" AND ({key} IS NULL OR ({key}, {id_column}) {op} (?, ?))", [after_value, after_id]
+    return f" AND ({key}, {id_column}) {op} (?, ?)", [after_value, after_id]
+
+
+@app.route("/top_games", methods=["GET"])
+def get_top_games():
+    game_list = _top_games.get(database_path)
+    if game_list is None:
+        conn = get_read_connection()
+        cursor = conn.cursor()
+        cursor.execute(SQL_TOP_GAMES.format(columns=game_list_columns_sql(conn)))
+        games = cursor.fetchall()
+        conn.close()
+        game_list = [game_row_to_dict(game) for game in games]
+        _top_games.set(database_path, game_list)
+
+    return json_response(game_list)
 
 @app.route("/recent_games", methods=["GET"])
 def get_recent_games():
-    conn = get_db_connection()
+    conn = get_read_connection()
     cursor = conn.cursor()
     cursor.execute(
-        """
-        SELECT * FROM games
+        f"""
+        SELECT {game_list_columns_sql(conn)} FROM games
         WHERE id != -1
         ORDER BY datetime(COALESCE(date_added, '1970-01-01')) DESC
         LIMIT 5
@@ -1462,38 +2162,7 @@ def get_recent_games():
     games = cursor.fetchall()
     conn.close()
 
-    game_list = []
-    for game in games:
-        game_list.append(
-            {
-                "id": game[0],
-                "title": game[1],
-                "cover_image": None,
-                "description": game[2],
-                "publisher": game[3],
-                "platforms": game[4],
-                "genres": game[5],
-                "series": game[6],
-                "release_date": game[7],
-                "average_price": game[8],
-                "youtube_trailer_url": game[9] if len(game) > 9 else None,
-                "high_res_cover_url": game[10] if len(game) > 10 else None,
-                "high_res_cover_path": game[11] if len(game) > 11 else None,
-                "hero_image_url": game[12] if len(game) > 12 else None,
-                "hero_image_path": game[13] if len(game) > 13 else None,
-                "logo_image_url": game[14] if len(game) > 14 else None,
-                "logo_image_path": game[15] if len(game) > 15 else None,
-                "icon_image_url": game[16] if len(game) > 16 else None,
-                "icon_image_path": game[17] if len(game) > 17 else None,
-                "steamgriddb_id": game[18] if len(game) > 18 else None,
-                "artwork_last_updated": game[19] if len(game) > 19 else None,
-                "region": (game[20] if len(game) > 20 else None) or "PAL",
-                # Include date_added if the column exists
-                "date_added": game[21] if len(game) > 21 else None,
-            }
-        )
-
-    return jsonify(game_list)
+    return jsonify([game_row_to_dict(game) for game in games])
 
 @app.route("/search_game_by_id", methods=["POST"])
 def search_game_by_id():
@@ -1532,7 +2201,7 @@ def search_game_by_id():
             "Authorization": f"Bearer {igdb_access_token}",
         }
         body = f"fields name, cover.url, summary, platforms.name, genres.name, involved_companies.company.name, franchises.name, first_release_date; where id = {igdb_id};"
-        response = requests.post(url, headers=headers, data=body)
+        response = igdb_http.post(url, headers=headers, data=body, timeout=10)
         response_json = response.json()
         logging.debug(f"IGDB search response for ID {igdb_id}: {response_json}")
 
@@ -1608,15 +2277,11 @@ def search_game_by_name():
         return jsonify({"error": str(e)}), 500
 
 def save_game_to_db(game_data):
+    conn = get_db_connection()
     try:
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-        db_path = os.path.join(BASE_DIR, database_path)
-        conn = get_db_connection()
         cursor = conn.cursor()
         logging.debug(f"Inserting game data: {game_data}")
 
-        release_date = game_data.get("release_date") or "1900-01-01"
-        
         # Use TRIM on title and check for matching platform AND region as well.
         # We'll consider the first platform from the list for comparison.
         platform_str = ""
@@ -1624,148 +2289,148 @@ def save_game_to_db(game_data):
             platform_str = game_data["platforms"][0]
         # Default region to PAL if not provided
         region = (game_data.get("region") or "PAL").strip().upper()
-        
+
+        # Trailer lookup happens in the background after commit unless the caller supplied one
+        youtube_trailer_url = game_data.get("youtube_trailer_url")
+
+        game_id = generate_random_id()
+        date_added = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Duplicate check and insert in one statement; BEGIN IMMEDIATE takes the
+        # write lock up front so two concurrent saves can't both pass the check.
+        conn.execute("BEGIN IMMEDIATE")
         cursor.execute(
-            "SELECT COUNT(*) FROM games WHERE TRIM(title) = ? AND platforms LIKE ? AND UPPER(IFNULL(region, 'PAL')) = ?",
-            (game_data["title"].strip(), f"%{platform_str}%", region)
+            SQL_INSERT_GAME_IF_NEW,
+            {
+                "id": game_id,
+                "title": game_data["title"],
+                "description": game_data["description"],
+                "publisher": ", ".join(game_data["publisher"]),
+                "platforms": ", ".join(game_data["platforms"]),
+                "genres": ", ".join(game_data["genres"]),
+                "series": ", ".join(game_data["series"]),
+                "release_date": game_data["release_date"],
+                "average_price": game_data["average_price"],
+                "youtube_trailer_url": youtube_trailer_url,
+                "region": region,
+                "date_added": date_added,
+                "trimmed_title": game_data["title"].strip(),
+                "platform": platform_str,
+            },
         )
-        count = cursor.fetchone()[0]
-
-        if count == 0:
-            # Generate YouTube trailer URL
-            youtube_trailer_url = None
-            title = game_data.get("title", "")
-            platforms = game_data.get("platforms", [])
-            if title and platforms:
-                platform = platforms[0] if platforms else ""
-                search_query = f"{title} {platform}"
-                try:
-                    video_id = get_youtube_video_id(search_query)
-                    if video_id:
-                        youtube_trailer_url = f"https://www.youtube.com/watch?v={video_id}"
-                        logging.debug(f"Found YouTube trailer: {youtube_trailer_url}")
-                except Exception as e:
-                    logging.warning(f"Failed to fetch YouTube trailer for {title}: {e}")
-            
-            game_id = generate_random_id()
-            from datetime import datetime
-            date_added = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-            cursor.execute(
-                """
-                INSERT INTO games (id, title, description, publisher, platforms, genres, series, release_date, average_price, youtube_trailer_url, region, date_added)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    game_id,
-                    game_data["title"],
-                    game_data["description"],
-                    ", ".join(game_data["publisher"]),
-                    ", ".join(game_data["platforms"]),
-                    ", ".join(game_data["genres"]),
-                    ", ".join(game_data["series"]),
-                    game_data["release_date"],
-                    game_data["average_price"],
-                    youtube_trailer_url,
-                    region,
-                    date_added,
-                ),
-            )
-            conn.commit()
-            logging.debug("Data inserted into database successfully.")
-            
-            # Automatically attempt to fetch high-resolution artwork for the new game
-            try:
-                fetch_artwork_for_game(game_id)
-                logging.debug(f"Attempted to fetch high-res artwork for game ID: {game_id}")
-            except Exception as e:
-                logging.warning(f"Failed to fetch high-res artwork for new game {game_id}: {e}")
-            
-            return True
-        else:
+        inserted = cursor.rowcount == 1
+        conn.commit()
+        if inserted:
+            invalidate_game_caches()
+
+        if not inserted:
             logging.debug(f"Game with title '{game_data['title']}' and platform '{platform_str}' already exists in the database")
             return False
+        logging.debug("Data inserted into database successfully.")
+
+        enrichment_executor.submit(
+            enrich_new_game,
+            game_id,
+            game_data.get("title", ""),
+            game_data.get("platforms", []),
+            lookup_trailer=not youtube_trailer_url,
+        )
+        return True
     except Exception as e:
         logging.error(f"Error saving game to database: {e}")
         return False
     finally:
         conn.close()
 
+def enrich_new_game(game_id, title, platforms, lookup_trailer=True):
+    """Background follow-up for a freshly saved game: YouTube trailer and high-res artwork."""
+    if lookup_trailer:
+        youtube_trailer_url = find_youtube_trailer_url(title, platforms)
+        if youtube_trailer_url:
+            conn = get_db_connection()
+            try:
+                conn.execute(
+                    "UPDATE games SET youtube_trailer_url = ? WHERE id = ? AND youtube_trailer_url IS NULL",
+                    (youtube_trailer_url, game_id),
+                )
+                conn.commit()
+                invalidate_game_caches()
+            except sqlite3.Error as e:
+                logging.warning(f"Failed to store YouTube trailer for game {game_id}: {e}")
+            finally:
+                conn.close()
+
+    # Automatically attempt to fetch high-resolution artwork for the new game
+    try:
+        fetch_artwork_for_game(game_id)
+        logging.debug(f"Attempted to fetch high-res artwork for game ID: {game_id}")
+    except Exception as e:
+        logging.warning(f"Failed to fetch high-res artwork for new game {game_id}: {e}")
+
+
 @app.route("/games", methods=["GET"])
 def get_games():
     publisher = request.args.get("publisher")
     platform = request.args.get("platform")
     genre = request.args.get("genre")
-    year = request.args.get("year")
-    title = request.args.get("title")
+    year = _intarg("year", None, 1, 9999)
+    # Blank/whitespace-only searches add no title predicate at all
+    title = (request.args.get("title") or "").strip()
     sort = request.args.get("sort")  # e.g. "alphabetical"
     
     # Pagination parameters
-    page = int(request.args.get("page", 1))
-    per_page = request.args.get("per_page")
-    if per_page:
-        per_page = min(int(per_page), 10000)  # Cap at 10000 games per page for price range calculations
-
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    db_path = os.path.join(BASE_DIR, database_path)
+    page = _intarg("page", 1, 1, sys.maxsize)
+    per_page = _intarg("per_page", None, 1, 10000)  # Cap at 10000 games per page for price range calculations
+
+    # Keyset cursor from a previous page's next_cursor; replaces page/OFFSET when given
+    after_id = _intarg("after_id", None, -sys.maxsize, sys.maxsize)
+    after_value = request.args.get("after_value")
+    if after_id is not None:
+        if after_value is not None and sort in ("highest", "lowest"):
+            try:
+                after_value = float(after_value)
+            except ValueError:
+                abort(json_response({"error": "Invalid number for 'after_value'"}, 400))
 
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    query = "SELECT * FROM games WHERE 1=1 AND id != -1"
-    params = []
+    select_columns = game_list_columns_sql(conn)
+    filters = [(FILTER_EQUALITY, "id != -1", [])]
 
     if publisher:
-        query += " AND publisher LIKE ?"
-        params.append(f"%{publisher}%")
+        filters.append((FILTER_LIKE, "publisher LIKE ?", [f"%{publisher}%"]))
 
     if platform:
-        query += " AND platforms LIKE ?"
-        params.append(f"%{platform}%")
+        # Exact platform match ("NES" must not match "SNES") via the link table
+        filters.append((FILTER_EQUALITY, "id IN (SELECT game_id FROM game_platforms WHERE platform = ?)", [platform.strip()]))
 
     if genre:
-        query += " AND genres LIKE ?"
-        params.append(f"%{genre}%")
+        # Exact genre match via the link table, like platforms
+        filters.append((FILTER_EQUALITY, "id IN (SELECT game_id FROM game_genres WHERE genre = ?)", [genre.strip()]))
 
-    if year:
-        query += ' AND strftime("%Y", release_date) = ?'
-        params.append(year)
+    if year is not None:
+        filters.append((FILTER_EQUALITY, f"{RELEASE_YEAR_SQL.format('release_date')} = ?", [year]))
 
     if title:
-        # Enhanced search with special character normalization
-        # This allows "Pokemon" to find "Pokémon" and vice versa
-        normalized_search = normalize_for_search(title)
-        
-        # Search using both the original term and the accent-stripped version
-        # Use REPLACE to strip accents from database titles for comparison
-        query += """ AND (
-            LOWER(title) LIKE ? OR 
-            LOWER(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(
-                title, 'é', 'e'), 'è', 'e'), 'ê', 'e'), 'ë', 'e'), 
-                'á', 'a'), 'à', 'a'), 'ä', 'a'), 'â', 'a'),
-                'ó', 'o'), 'ò', 'o')) LIKE ?
-        )"""
-        params.append(f"%{title.lower()}%")
-        params.append(f"%{normalized_search}%")
+        filters.append(title_filter(title))
 
     # Optional region filter
     region = request.args.get("region")
     if region:
-        query += " AND UPPER(IFNULL(region, 'PAL')) = ?"
-        params.append(region.upper())
+        filters.append((FILTER_EQUALITY, "UPPER(IFNULL(region, 'PAL')) = ?", [region.upper()]))
     
     # Optional price range filter
     price_min = request.args.get("price_min")
     price_max = request.args.get("price_max")
     if price_min:
         try:
-            query += " AND average_price >= ?"
-            params.append(float(price_min))
+            filters.append((FILTER_RANGE, "average_price >= ?", [float(price_min)]))
         except (ValueError, TypeError):
             pass
     if price_max:
         try:
-            query += " AND average_price <= ?"
-            params.append(float(price_max))
+            filters.append((FILTER_RANGE, "average_price <= ?", [float(price_max)]))
         except (ValueError, TypeError):
             pass
 
@@ -1774,52 +2439,48 @@ def get_games():
     date_added_before = request.args.get("date_added_before")
     if date_added_after:
         # Accept YYYY-MM-DD or full timestamp
-        try:
-            # If only a date is provided, include the full day from 00:00:00
-            if len(date_added_after) == 10:
-                date_added_after = date_added_after + " 00:00:00"
-            query += " AND datetime(date_added) >= datetime(?)"
-            params.append(date_added_after)
-        except Exception:
-            pass
+        # If only a date is provided, include the full day from 00:00:00
+        if len(date_added_after) == 10:
+            date_added_after = date_added_after + " 00:00:00"
+        filters.append((FILTER_RANGE, "datetime(date_added) >= datetime(?)", [date_added_after]))
     if date_added_before:
-        try:
-            # If only a date is provided, include the full day until 23:59:59
-            if len(date_added_before) == 10:
-                date_added_before = date_added_before + " 23:59:59"
-            query += " AND datetime(date_added) <= datetime(?)"
-            params.append(date_added_before)
-        except Exception:
-            pass
+        # If only a date is provided, include the full day until 23:59:59
+        if len(date_added_before) == 10:
+            date_added_before = date_added_before + " 23:59:59"
+        filters.append((FILTER_RANGE, "datetime(date_added) <= datetime(?)", [date_added_before]))
 
-    if sort == "alphabetical":
-        query += " ORDER BY title ASC"
-    elif sort == "title_desc":
-        query += " ORDER BY title DESC"
-    elif sort == "highest":
-        # Place NULLs last by sorting on IS NULL first
-        query += " ORDER BY (average_price IS NULL), average_price DESC"
-    elif sort == "lowest":
-        query += " ORDER BY (average_price IS NULL), average_price ASC"
-    elif sort == "recent":
-        # Most recently added first
-        query += " ORDER BY datetime(COALESCE(date_added, '1970-01-01')) DESC"
+    where_sql, params = where_clause(filters)
+    query = f"SELECT {select_columns} FROM games WHERE {where_sql}"
 
     # Handle pagination if requested
     if per_page:
-        # Get total count first
-        count_query = query.replace("SELECT *", "SELECT COUNT(*)")
-        try:
-            cursor.execute(count_query, params)
-            total_count = cursor.fetchone()[0]
-        except Exception as e:
-            logging.error(f"/games count query failed: {e}")
-            conn.close()
-            return jsonify({"error": "Count query failed"}), 500
-        
-        # Add pagination to main query
-        offset = (page - 1) * per_page
-        query += f" LIMIT {per_page} OFFSET {offset}"
+        # Total for the filtered set, counted once per filter combination
+        count_query = f"SELECT COUNT(*) FROM games WHERE {where_sql}"
+        count_key = (database_path, count_query, tuple(params))
+        total_count = _games_counts.get(count_key)
+        if total_count is None:
+            try:
+                cursor.execute(count_query, params)
+                total_count = cursor.fetchone()[0]
+            except Exception as e:
+                logging.error(f"/games count query failed: {e}")
+                conn.close()
+                return jsonify({"error": "Count query failed"}), 500
+            _games_counts.set(count_key, total_count)
+
+        if after_id is not None:
+            cursor_sql, cursor_params = games_after_cursor(sort, after_value, after_id)
+            query += cursor_sql
+            params += cursor_params
+
+    # Sorts NULL prices last; id breaks ties
+    query += games_order_by(sort)
+
+    if per_page:
+        # One extra row tells us whether another page follows; OFFSET only for page-number requests
+        query += f" LIMIT {per_page + 1}"
+        if after_id is None:
+            query += f" OFFSET {(page - 1) * per_page}"
     
     try:
         cursor.execute(query, params)
@@ -1830,117 +2491,95 @@ def get_games():
         return jsonify({"error": "Query failed"}), 500
     conn.close()
 
-    game_list = []
-    for game in games:
-        game_list.append(
-            {
-                "id": game[0],
-                "title": game[1],
-                "cover_image": None,  # cover_image column doesn't exist in data/games.db
-                "description": game[2],
-                "publisher": game[3],
-                "platforms": game[4],
-                "genres": game[5],
-                "series": game[6],
-                "release_date": game[7],
-                "average_price": game[8],
-                "youtube_trailer_url": game[9] if len(game) > 9 else None,
-                # High-resolution artwork (if available)
-                "high_res_cover_url": game[10] if len(game) > 10 else None,
-                "high_res_cover_path": game[11] if len(game) > 11 else None,
-                "hero_image_url": game[12] if len(game) > 12 else None,
-                "hero_image_path": game[13] if len(game) > 13 else None,
-                "logo_image_url": game[14] if len(game) > 14 else None,
-                "logo_image_path": game[15] if len(game) > 15 else None,
-                "icon_image_url": game[16] if len(game) > 16 else None,
-                "icon_image_path": game[17] if len(game) > 17 else None,
-                "steamgriddb_id": game[18] if len(game) > 18 else None,
-                "artwork_last_updated": game[19] if len(game) > 19 else None,
-                "region": (game[20] if len(game) > 20 else None) or "PAL",
-                "date_added": game[21] if len(game) > 21 else None,
-            }
-        )
-        
+    has_next = False
+    if per_page and len(games) > per_page:
+        games = games[:per_page]
+        has_next = True
+
+    game_list = [game_row_to_dict(game) for game in games]
 
     # Return with pagination info if requested, otherwise just the games list
     if per_page:
         total_pages = (total_count + per_page - 1) // per_page
-        return jsonify({
+        next_cursor = None
+        if has_next:
+            sort_column = GAMES_SORTS.get(sort, GAMES_SORTS[None])[0]
+            last = game_list[-1]
+            next_cursor = {"after_id": last["id"], "after_value": last[sort_column]}
+        return json_response({
             "games": game_list,
             "pagination": {
                 "current_page": page,
                 "total_pages": total_pages,
                 "total_count": total_count,
                 "per_page": per_page,
-                "has_next": page < total_pages,
-                "has_prev": page > 1
+                "has_next": has_next,
+                "has_prev": page > 1 or after_id is not None,
+                "next_cursor": next_cursor,
             }
         })
     else:
         # Backward compatibility - return just the list
-        return jsonify(game_list)
+        return json_response(game_list)
+
+
+def distinct_list_values_sql(column):
+    """SELECT of every distinct entry across the games.<column> lists, split in SQL."""
+    return (
+        f"SELECT DISTINCT TRIM(j.value) FROM games g, json_each({list_json_sql('g.' + column)}) j "
+        "WHERE g.id != -1 AND TRIM(j.value) NOT IN ('', '__PLACEHOLDER__')"
+    )
+
+
+SQL_DISTINCT_PLATFORMS = (
+    "SELECT DISTINCT platform FROM game_platforms WHERE game_id != -1 AND platform != '__PLACEHOLDER__'"
+)
+SQL_DISTINCT_GENRES = (
+    "SELECT DISTINCT genre FROM game_genres WHERE game_id != -1 AND genre != '__PLACEHOLDER__'"
+)
+
+# /unique_values?type=... -> query returning one distinct, non-empty value per row
+UNIQUE_VALUES_SQL = {
+    "publisher": distinct_list_values_sql("publisher"),
+    "platform": SQL_DISTINCT_PLATFORMS,
+    "genre": SQL_DISTINCT_GENRES,
+    "year": (
+        f"SELECT DISTINCT CAST({RELEASE_YEAR_SQL.format('release_date')} AS TEXT) AS value FROM games "
+        f"WHERE id != -1 AND {RELEASE_YEAR_SQL.format('release_date')} BETWEEN 1000 AND 9999"
+    ),
+    "region": (
+        "SELECT DISTINCT UPPER(IFNULL(region, 'PAL')) AS value FROM games "
+        "WHERE id != -1 AND TRIM(value) NOT IN ('', '__PLACEHOLDER__')"
+    ),
+}
 
 
 @app.route("/consoles", methods=["GET"])
 def get_consoles():
-    conn = sqlite3.connect(database_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT DISTINCT platforms FROM games WHERE id != -1")
-    platforms = cursor.fetchall()
-    conn.close()
-
-    console_set = set()
-    for platform_tuple in platforms:
-        platform_list = platform_tuple[0].split(", ")
-        console_set.update(platform_list)
+    conn = get_db_connection()
+    try:
+        consoles = [row[0] for row in conn.execute(SQL_DISTINCT_PLATFORMS)]
+    finally:
+        conn.close()
 
-    return jsonify(list(console_set))
+    return jsonify(consoles)
 
 
 @app.route("/unique_values", methods=["GET"])
 def get_unique_values():
     try:
         value_type = request.args.get("type")
+        query = UNIQUE_VALUES_SQL.get(value_type)
+        if query is None:
+            return jsonify([]), 400
 
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-        db_path = os.path.join(BASE_DIR, database_path)
         conn = get_db_connection()
-        cursor = conn.cursor()
-
-        if value_type == "publisher":
-            cursor.execute("SELECT DISTINCT publisher FROM games WHERE id != -1")
-        elif value_type == "platform":
-            cursor.execute("SELECT DISTINCT platforms FROM games WHERE id != -1")
-        elif value_type == "genre":
-            cursor.execute("SELECT DISTINCT genres FROM games WHERE id != -1")
-        elif value_type == "year":
-            cursor.execute('SELECT DISTINCT strftime("%Y", release_date) FROM games WHERE id != -1')
-        elif value_type == "region":
-            cursor.execute("SELECT DISTINCT UPPER(IFNULL(region, 'PAL')) FROM games WHERE id != -1")
-        else:
+        try:
+            unique_values = [row[0] for row in conn.execute(query)]
+        finally:
             conn.close()
-            return jsonify([]), 400
-
-        values = cursor.fetchall()
-        conn.close()
 
-        unique_values = set()
-        for value_tuple in values:
-            # Get the raw value
-            value = value_tuple[0]
-            # Skip if value is None, empty string, or placeholder
-            if not value or value.strip() == "" or value == "__PLACEHOLDER__":
-                continue
-
-            if value_type in ("year", "region"):
-                unique_values.add(value)
-            else:
-                value_list = value.split(", ")
-                # Filter out placeholder values from the list
-                filtered_values = [v.strip() for v in value_list if v.strip() != "__PLACEHOLDER__"]
-                unique_values.update(filtered_values)
-
-        return jsonify(list(unique_values))
+        return jsonify(unique_values)
     except Exception as e:
         print(f"Error in get_unique_values: {e}")
         return jsonify([]), 500
@@ -1964,24 +2603,15 @@ def delete_game():
         return jsonify({"error": "Invalid game ID type"}), 400
 
     try:
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-        db_path = os.path.join(BASE_DIR, database_path)
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        # Check if the game ID exists
-        cursor.execute("SELECT COUNT(*) FROM games WHERE id = ?", (game_id,))
-        count = cursor.fetchone()[0]
-        if count == 0:
+        # closing() hands the connection back to the pool; "with conn" commits or rolls back
+        with closing(get_db_connection()) as conn, conn:
+            deleted = conn.execute("DELETE FROM games WHERE id = ?", (game_id,)).rowcount
+        if deleted == 0:
             logging.debug(f"No game found with ID: {game_id}")
             return jsonify({"error": "No game found with the given ID"}), 404
 
-        # Perform the deletion
-        cursor.execute("DELETE FROM games WHERE id = ?", (game_id,))
-        conn.commit()
+        invalidate_game_caches()
         logging.debug(f"Deleted game with ID: {game_id}")
-
-        conn.close()
         return jsonify(), 200
 
     except Exception as e:
@@ -1991,150 +2621,119 @@ def delete_game():
 @app.route("/update_game/<int:game_id>", methods=["PUT"])
 def update_game(game_id):
     data = request.json
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    db_path = os.path.join(BASE_DIR, database_path)
-
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
         # Update game data, including average_price and youtube_trailer_url
         # Default region handling
         region = (data.get("region") or "PAL").strip().upper()
 
-        cursor.execute("""
-            UPDATE games
-            SET title = ?, description = ?, publisher = ?, platforms = ?, genres = ?, series = ?, release_date = ?, average_price = ?, youtube_trailer_url = ?, region = ?
-            WHERE id = ?
-        """, (
-            data["title"],
-            data["description"],
-            ", ".join(data["publisher"]),
-            ", ".join(data["platforms"]),
-            ", ".join(data["genres"]),
-            ", ".join(data["series"]),
-            data["release_date"],
-            data["average_price"],
-            data.get("youtube_trailer_url", ""),
-            region,
-            game_id
-        ))
+        with closing(get_db_connection()) as conn, conn:
+            conn.execute("""
+                UPDATE games
+                SET title = ?, description = ?, publisher = ?, platforms = ?, genres = ?, series = ?, release_date = ?, average_price = ?, youtube_trailer_url = ?, region = ?
+                WHERE id = ?
+            """, (
+                data["title"],
+                data["description"],
+                ", ".join(data["publisher"]),
+                ", ".join(data["platforms"]),
+                ", ".join(data["genres"]),
+                ", ".join(data["series"]),
+                data["release_date"],
+                data["average_price"],
+                data.get("youtube_trailer_url", ""),
+                region,
+                game_id
+            ))
 
-        conn.commit()
-        conn.close()
+        invalidate_game_caches()
         return jsonify({"message": "Game updated successfully"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route("/game/<int:game_id>", methods=["GET"])
 def fetch_game_by_id(game_id):
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    db_path = os.path.join(BASE_DIR, database_path)
-
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM games WHERE id = ?", (game_id,))
-        game = cursor.fetchone()
+        cursor.execute(f"SELECT {game_list_columns_sql(conn)} FROM games WHERE id = ?", (game_id,))
+        row = cursor.fetchone()
         conn.close()
 
-        if game:
-            return jsonify({
-                "id": game[0],
-                "title": game[1],
-                "cover_image": None,  # cover_image column doesn't exist in data/games.db
-                "description": game[2],
-                "publisher": game[3].split(", "),
-                "platforms": game[4].split(", "),
-                "genres": game[5].split(", "),
-                "series": game[6].split(", "),
-                "release_date": game[7],
-                "average_price": game[8],
-                "youtube_trailer_url": game[9] if len(game) > 9 else None,
-                # High-resolution artwork (if available)
-                "high_res_cover_url": game[10] if len(game) > 10 else None,
-                "high_res_cover_path": game[11] if len(game) > 11 else None,
-                "hero_image_url": game[12] if len(game) > 12 else None,
-                "hero_image_path": game[13] if len(game) > 13 else None,
-                "logo_image_url": game[14] if len(game) > 14 else None,
-                "logo_image_path": game[15] if len(game) > 15 else None,
-                "icon_image_url": game[16] if len(game) > 16 else None,
-                "icon_image_path": game[17] if len(game) > 17 else None,
-                "steamgriddb_id": game[18] if len(game) > 18 else None,
-                "artwork_last_updated": game[19] if len(game) > 19 else None,
-                "region": (game[20] if len(game) > 20 else None) or "PAL",
-                "date_added": game[21] if len(game) > 21 else None,
-            }), 200
+        if row:
+            game = game_row_to_dict(row)
+            for field in ("publisher", "platforms", "genres", "series"):
+                game[field] = game[field].split(", ")
+            return jsonify(game), 200
         else:
             return jsonify({"error": "Game not found"}), 404
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# Rows per fetch (and per streamed chunk) in /export_csv
+EXPORT_CSV_FETCH_SIZE = 1000
+
+
 @app.route("/export_csv", methods=["GET"])
 def export_csv():
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    db_path = os.path.join(BASE_DIR, database_path)
-
     # Get filter parameters from query string
     publisher = request.args.get("publisher", "")
     platform = request.args.get("platform", "")
     genre = request.args.get("genre", "")
-    year = request.args.get("year", "")
-    title = request.args.get("title", "")
+    year = _intarg("year", None, 1, 9999)
+    title = (request.args.get("title") or "").strip()
 
     conn = get_db_connection()
     cursor = conn.cursor()
 
     # Build a dynamic query
-    query = "SELECT * FROM games WHERE 1=1 AND id != -1"
-    params = []
+    filters = [(FILTER_EQUALITY, "id != -1", [])]
 
     if publisher:
-        query += " AND publisher LIKE ?"
-        params.append(f"%{publisher}%")
+        filters.append((FILTER_LIKE, "publisher LIKE ?", [f"%{publisher}%"]))
     if platform:
-        query += " AND platforms LIKE ?"
-        params.append(f"%{platform}%")
+        # Exact matches via the link tables, as in /games
+        filters.append((FILTER_EQUALITY, "id IN (SELECT game_id FROM game_platforms WHERE platform = ?)", [platform.strip()]))
     if genre:
-        query += " AND genres LIKE ?"
-        params.append(f"%{genre}%")
-    if year:
-        query += ' AND strftime("%Y", release_date) = ?'
-        params.append(year)
+        filters.append((FILTER_EQUALITY, "id IN (SELECT game_id FROM game_genres WHERE genre = ?)", [genre.strip()]))
+    if year is not None:
+        filters.append((FILTER_EQUALITY, f"{RELEASE_YEAR_SQL.format('release_date')} = ?", [year]))
     if title:
-        # Enhanced search with special character normalization
-        normalized_search = normalize_for_search(title)
-        
-        # Search using both the original term and the accent-stripped version
-        query += """ AND (
-            LOWER(title) LIKE ? OR 
-            LOWER(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(
-                title, 'é', 'e'), 'è', 'e'), 'ê', 'e'), 'ë', 'e'), 
-                'á', 'a'), 'à', 'a'), 'ä', 'a'), 'â', 'a'),
-                'ó', 'o'), 'ò', 'o')) LIKE ?
-        )"""
-        params.append(f"%{title.lower()}%")
-        params.append(f"%{normalized_search}%")
-
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
+        filters.append(title_filter(title))
 
-    output = io.StringIO()
-    writer = csv.writer(output)
+    where_sql, params = where_clause(filters)
+    query = f"SELECT {game_list_columns_sql(conn)} FROM games WHERE {where_sql}"
 
-    # Write header row
-    writer.writerow(["id", "title", "cover_image", "description", "publisher",
-                     "platforms", "genres", "series", "release_date", "average_price"])
-    for row in rows:
-        writer.writerow(row)
+    try:
+        cursor.execute(query, params)
+    except Exception:
+        conn.close()
+        raise
 
-    output.seek(0)
-    return Response(
-        output,
+    def generate():
+        # One row at a time so large exports don't sit in memory before the first byte
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(GAME_LIST_COLUMNS)
+        while True:
+            rows = cursor.fetchmany(EXPORT_CSV_FETCH_SIZE)
+            if not rows:
+                break
+            writer.writerows(rows)
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+        # Header only, for an empty result
+        if output.tell():
+            yield output.getvalue()
+
+    response = Response(
+        generate(),
         mimetype="text/csv",
         headers={"Content-disposition": "attachment; filename=games_export.csv"}
     )
+    # Runs once the stream is finished or abandoned
+    response.call_on_close(conn.close)
+    return response
 
 # -------------------------
 # Price Source Configuration Endpoints
@@ -2225,114 +2824,120 @@ def set_default_region_endpoint():
 # Update Game Price Endpoint
 # -------------------------
 
+SQL_UPDATE_GAME_PRICE = "UPDATE games SET average_price = ? WHERE id = ?"
+SQL_UPDATE_GAME_PRICE_AND_REGION = "UPDATE games SET average_price = ?, region = ? WHERE id = ?"
+SQL_INSERT_PRICE_HISTORY = """
+    INSERT INTO price_history (game_id, price, price_source, date_recorded, currency)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_DELETE_PRICE_HISTORY_ENTRY = "DELETE FROM price_history WHERE id = ? RETURNING game_id"
+# Current price back to the latest remaining history entry (NULL when none are left)
+SQL_UPDATE_GAME_PRICE_FROM_HISTORY = """
+    UPDATE games SET average_price = (
+        SELECT price FROM price_history
+        WHERE game_id = :game_id
+        ORDER BY datetime(date_recorded) DESC, id DESC
+        LIMIT 1
+    )
+    WHERE id = :game_id
+"""
+
+def scrape_game_price(conn, game_id, prefer_boxed=True):
+    """Look up a fresh price for one game using its per-game or global price settings.
+
+    Returns None when the game doesn't exist, otherwise a dict with the game row,
+    the scraped price (None if nothing was found), the source and the region used.
+    """
+    # Get the current game data
+    rows = conn.execute(
+        "SELECT title, platforms, average_price FROM games WHERE id = ?", (game_id,)
+    ).fetchall()
+    
+    if not rows:
+        return None
+    game = rows[0]
+    
+    # Extract game info for price lookup
+    game_title = game["title"]
+    platforms = game["platforms"]
+    
+    # Use the first platform for price lookup
+    selected_platform = ""
+    if platforms:
+        platform_list = platforms.split(", ")
+        if platform_list:
+            selected_platform = platform_list[0]
+    
+    # Build search query
+    search_query = game_title
+    if selected_platform:
+        search_query += " " + selected_platform
+    
+    logging.debug(f"Updating price for game ID {game_id}: '{search_query}'")
+    
+    # Get per-game price source and region or fall back to global defaults
+    game_settings = get_game_alert_settings(game_id, conn)
+    price_source = game_settings.get('price_source') or get_price_source()
+    price_region = game_settings.get('price_region') or 'PAL'
+    logging.debug(f"Using price source for game {game_id}: {price_source} (per-game: {game_settings.get('price_source')}, global: {get_price_source()})")
+    logging.debug(f"Using price region for game {game_id}: {price_region} (per-game: {game_settings.get('price_region')}, default: PAL)")
+    
+    # Perform price scraping based on current configuration
+    new_price = scrape_price(price_source, search_query, price_region, prefer_boxed)
+
+    logging.debug(f"Scraped new price from {price_source}: {new_price}")
+
+    return {
+        "game": game,
+        "new_price": new_price,
+        "price_source": price_source,
+        "region": price_region,
+    }
+
+def record_game_price(cursor, game_id, new_price, price_source, region, date_recorded):
+    """Write a scraped price to the game and its price_history (caller commits)."""
+    # For PriceCharting, also update the region field
+    if price_source == "PriceCharting":
+        cursor.execute(SQL_UPDATE_GAME_PRICE_AND_REGION, (new_price, region, game_id))
+        logging.debug(f"Updated game price to £{new_price} and region to {region}")
+    else:
+        cursor.execute(SQL_UPDATE_GAME_PRICE, (new_price, game_id))
+    # Record into price_history as well for auditing
+    cursor.execute(
+        SQL_INSERT_PRICE_HISTORY,
+        (game_id, new_price, price_source, date_recorded, 'GBP')
+    )
+
 @app.route("/update_game_price/<int:game_id>", methods=["POST"])
 def update_game_price(game_id):
     """Update the price of an existing game based on current price source configuration"""
+    # One connection for the lookup, the per-game settings and the write
+    conn = get_db_connection()
     try:
-        # Get the current game data
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM games WHERE id = ?", (game_id,))
-        game = cursor.fetchone()
-        conn.close()
-        
-        if not game:
+        # Get condition preference from request or default to CiB preference
+        prefer_boxed = (request.get_json(silent=True) or {}).get("prefer_boxed", True)
+        result = scrape_game_price(conn, game_id, prefer_boxed)
+        if result is None:
             return jsonify({"error": "Game not found"}), 404
-        
-        # Extract game info for price lookup
-        game_title = game[1]  # title column
-        platforms = game[4]   # platforms column (cover_image removed from schema)
-        
-        # Use the first platform for price lookup
-        selected_platform = ""
-        if platforms:
-            platform_list = platforms.split(", ")
-            if platform_list:
-                selected_platform = platform_list[0]
-        
-        # Build search query
-        search_query = game_title
-        if selected_platform:
-            search_query += " " + selected_platform
-        
-        logging.debug(f"Updating price for game ID {game_id}: '{search_query}'")
-        
-        # Get per-game price source and region or fall back to global defaults
-        game_settings = get_game_alert_settings(game_id)
-        price_source = game_settings.get('price_source') or get_price_source()
-        price_region = game_settings.get('price_region') or 'PAL'
-        logging.debug(f"Using price source for game {game_id}: {price_source} (per-game: {game_settings.get('price_source')}, global: {get_price_source()})")
-        logging.debug(f"Using price region for game {game_id}: {price_region} (per-game: {game_settings.get('price_region')}, default: PAL)")
-        
-        # Perform price scraping based on current configuration
-        new_price = None
-        used_source = price_source
-        if price_source == "Amazon":
-            new_price = scrape_amazon_price(search_query)
-        elif price_source == "CeX":
-            new_price = scrape_cex_price(search_query)
-        elif price_source == "PriceCharting":
-            # Use per-game region setting or fall back to global default
-            region = price_region
-            logging.debug(f"Using region for price update: {region} (from per-game settings)")
-            
-            pricecharting_data = scrape_pricecharting_price(search_query, None, region)
-            # Get condition preference from request or default to CiB preference
-            prefer_boxed = request.json.get("prefer_boxed", True) if request.json else True
-            # Use condition-aware pricing based on preference
-            new_price = get_pricecharting_price_by_condition(pricecharting_data, prefer_boxed)
-            if pricecharting_data:
-                logging.debug(
-                    f"PriceCharting pricing breakdown - Loose: £{pricecharting_data.get('loose_price')}, "
-                    f"CIB: £{pricecharting_data.get('cib_price')}, New: £{pricecharting_data.get('new_price')}"
-                )
-        else:  # Default to eBay
-            new_price = scrape_ebay_prices(search_query)
-
-        logging.debug(f"Scraped new price from {price_source}: {new_price}")
+        new_price = result["new_price"]
+        used_source = result["price_source"]
 
         # Only write to DB if we have a valid new price. Never overwrite with NULL/None
         if new_price is not None:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            # For PriceCharting, also update the region field
-            if price_source == "PriceCharting":
-                cursor.execute(
-                    "UPDATE games SET average_price = ?, region = ? WHERE id = ?",
-                    (new_price, region, game_id)
-                )
-                logging.debug(f"Updated game price to £{new_price} and region to {region}")
-            else:
-                cursor.execute(
-                    "UPDATE games SET average_price = ? WHERE id = ?",
-                    (new_price, game_id)
-                )
-            # Record into price_history as well for auditing
-            from datetime import datetime
             current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            cursor.execute(
-                """
-                INSERT INTO price_history (game_id, price, price_source, date_recorded, currency)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (game_id, new_price, used_source, current_date, 'GBP')
-            )
+            record_game_price(conn.cursor(), game_id, new_price, used_source, result["region"], current_date)
             conn.commit()
+            invalidate_game_caches()
 
             # Check for price alerts
             check_price_change_and_alert(game_id, new_price, used_source)
-
-            conn.close()
-        else:
-            # No price found; preserve existing price. Do not write history.
-            used_source = price_source
+        # No price found; preserve existing price. Do not write history.
         
         return jsonify({
             "message": f"Price updated successfully using {used_source}",
             "game_id": game_id,
-            "game_title": game_title,
-            "old_price": game[8],  # average_price column
+            "game_title": result["game"]["title"],
+            "old_price": result["game"]["average_price"],
             "new_price": new_price,
             "price_source": used_source
         }), 200
@@ -2340,6 +2945,69 @@ def update_game_price(game_id):
     except Exception as e:
         logging.error(f"Error updating game price: {e}")
         return jsonify({"error": str(e)}), 500
+    finally:
+        conn.close()
+
+@app.route("/update_game_prices_bulk", methods=["POST"])
+def update_game_prices_bulk():
+    """Refresh prices for several games, writing every new price in one transaction.
+
+    Expects {"ids": [...], "prefer_boxed": bool}. Scraping happens first; the
+    updates and price_history rows are then committed together instead of one
+    commit per game.
+    """
+    data = request.get_json(silent=True) or {}
+    game_ids = data.get("ids")
+    if not isinstance(game_ids, list) or not all(isinstance(gid, int) for gid in game_ids):
+        return jsonify({"error": "'ids' must be a list of integer game IDs"}), 400
+    prefer_boxed = data.get("prefer_boxed", True)
+
+    conn = get_db_connection()
+    try:
+        results = []
+        updates = []
+        for game_id in dict.fromkeys(game_ids):
+            try:
+                result = scrape_game_price(conn, game_id, prefer_boxed)
+            except Exception as e:
+                logging.error(f"Error scraping price for game {game_id}: {e}")
+                results.append({"game_id": game_id, "error": str(e)})
+                continue
+            if result is None:
+                results.append({"game_id": game_id, "error": "Game not found"})
+                continue
+            if result["new_price"] is not None:
+                updates.append((game_id, result))
+            results.append({
+                "game_id": game_id,
+                "game_title": result["game"]["title"],
+                "old_price": result["game"]["average_price"],
+                "new_price": result["new_price"],
+                "price_source": result["price_source"],
+            })
+
+        if updates:
+            current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            with conn:
+                cursor = conn.cursor()
+                for game_id, result in updates:
+                    record_game_price(cursor, game_id, result["new_price"], result["price_source"], result["region"], current_date)
+            invalidate_game_caches()
+
+            for game_id, result in updates:
+                check_price_change_and_alert(game_id, result["new_price"], result["price_source"])
+
+        return jsonify({
+            "message": f"Updated prices for {len(updates)} of {len(results)} games",
+            "updated": len(updates),
+            "results": results
+        }), 200
+
+    except Exception as e:
+        logging.error(f"Error bulk updating game prices: {e}")
+        return jsonify({"error": str(e)}), 500
+    finally:
+        conn.close()
 
 # -------------------------
 # Update Game Artwork Endpoint
@@ -2410,10 +3078,10 @@ def update_game_artwork_endpoint(game_id):
 # Manual Artwork Upload & Serving
 # -------------------------
 
-ALLOWED_IMAGE_EXTENSIONS = {"png", "jpg", "jpeg", "webp"}
+ALLOWED_IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
 
 def _allowed_image(filename: str) -> bool:
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_IMAGE_EXTENSIONS
+    return filename.lower().endswith(ALLOWED_IMAGE_EXTENSIONS)
 
 @app.route("/upload_game_artwork/<int:game_id>", methods=["POST"])
 def upload_game_artwork(game_id: int):
@@ -2446,9 +3114,13 @@ def upload_game_artwork(game_id: int):
         dest_path = os.path.join(dest_dir, final_filename)
         file.save(dest_path)
 
-        # Build simple, stable URL rooted at /media/artwork/ ... regardless of container paths
+        # Build simple, stable URL rooted at /media/artwork/ ... regardless of container paths.
+        # Re-uploads overwrite the same file, so the URL carries a content version
+        # that lets browsers cache it indefinitely.
         subdir = "grids" if artwork_type == "grid" else "heroes" if artwork_type == "hero" else "logos" if artwork_type == "logo" else "icons"
-        url_path = f"/media/artwork/{subdir}/{final_filename}"
+        with open(dest_path, "rb") as saved:
+            version = hashlib.sha1(saved.read()).hexdigest()[:8]
+        url_path = f"/media/artwork/{subdir}/{final_filename}?v={version}"
         # Also store a relative DB path under data/ for reference
         rel_path = os.path.relpath(dest_path, DATA_DIR).replace('\\', '/')  # e.g., artwork/grids/file.png
 
@@ -2465,6 +3137,7 @@ def upload_game_artwork(game_id: int):
             (url_path, rel_path, time.strftime("%Y-%m-%dT%H:%M:%S"), game_id),
         )
         conn.commit()
+        invalidate_game_caches()
         conn.close()
 
         file_exists = os.path.isfile(dest_path)
@@ -2481,6 +3154,19 @@ def upload_game_artwork(game_id: int):
         logging.error(f"Error uploading artwork: {e}")
         return jsonify({"error": str(e)}), 500
 
+# Versioned artwork URLs (?v=...) change whenever the file does, so browsers may
+# keep them for good; unversioned ones are reused for an hour, then revalidated
+# against the ETag/Last-Modified that send_from_directory already sets.
+ARTWORK_CACHE_CONTROL_VERSIONED = "public, max-age=31536000, immutable"
+ARTWORK_CACHE_CONTROL = "public, max-age=3600"
+
+def _send_artwork(directory: str, filename: str):
+    response = send_from_directory(directory, filename, conditional=True)
+    response.headers["Cache-Control"] = (
+        ARTWORK_CACHE_CONTROL_VERSIONED if request.args.get("v") else ARTWORK_CACHE_CONTROL
+    )
+    return response
+
 @app.route("/media/<path:filename>")
 def serve_media(filename: str):
     # Serve files from project root so /media/data/artwork/... works
@@ -2490,18 +3176,124 @@ def serve_media(filename: str):
     if not safe_path.startswith(directory):
         return jsonify({"error": "Invalid path"}), 400
     rel_dir, fname = os.path.split(filename)
+    if safe_path.startswith(ARTWORK_DIR + os.sep):
+        return _send_artwork(os.path.join(directory, rel_dir), fname)
+    # Everything else (e.g. database backups) keeps the default headers
     return send_from_directory(os.path.join(directory, rel_dir), fname)
 
 @app.route("/media/artwork/<path:subpath>")
 def serve_artwork(subpath: str):
     # Serve files from the ARTWORK_DIR for cleaner URLs
     # subpath is like "grids/123_grid_manual.png"
-    return send_from_directory(ARTWORK_DIR, subpath)
+    return _send_artwork(ARTWORK_DIR, subpath)
 
 # -------------------------
 # Gallery API Endpoints - Phase 1
 # -------------------------
 
+def list_json_array_sql(column):
+    """SQL expression giving games.<column> as a JSON array of its trimmed, non-empty entries, in order."""
+    return (
+        f"(SELECT json_group_array(TRIM(j.value)) FROM json_each({list_json_sql(column)}) j "
+        "WHERE TRIM(j.value) != '')"
+    )
+
+# The SteamGridDB artwork columns are mostly NULL, so the gallery reads them as one
+# JSON object; json_patch() onto '{}' drops the NULL members.
+GALLERY_ARTWORK_COLUMNS = (
+    'high_res_cover_url', 'high_res_cover_path', 'hero_image_url', 'hero_image_path',
+    'logo_image_url', 'logo_image_path', 'icon_image_url', 'icon_image_path',
+)
+GALLERY_ARTWORK_SQL = "json_patch('{}', json_object(%s))" % ", ".join(
+    f"'{column}', g.{column}" for column in GALLERY_ARTWORK_COLUMNS
+)
+
+# Gallery listing columns as (response key, SQL); platform and release_year are
+# placeholders filled in by gallery_row_to_dict(). Platforms and genres are
+# split in SQL and arrive as JSON arrays.
+GALLERY_COLUMNS = (
+    ('id', 'g.id'),
+    ('title', 'g.title'),
+    ('description', 'g.description'),
+    ('publisher', 'g.publisher'),
+    ('platform', 'NULL'),
+    ('platforms', list_json_array_sql('g.platforms')),
+    ('genres', list_json_array_sql('g.genres')),
+    ('series', 'g.series'),
+    ('release_date', 'g.release_date'),
+    ('release_year', 'NULL'),
+    ('average_price', 'g.average_price'),
+    ('youtube_trailer_url', 'g.youtube_trailer_url'),
+    ('region', 'g.region'),
+    ('date_added', 'g.date_added'),
+    ('completion_status', 'ggm.completion_status'),
+    ('personal_rating', 'ggm.personal_rating'),
+    ('play_time_hours', 'ggm.play_time_hours'),
+    ('notes', 'ggm.notes'),
+    ('display_priority', 'ggm.display_priority'),
+    ('is_favorite', 'ggm.favorite'),
+    ('date_acquired', 'ggm.date_acquired'),
+    ('date_completed', 'ggm.date_completed'),
+    ('artwork', GALLERY_ARTWORK_SQL),
+    ('steamgriddb_id', 'g.steamgriddb_id'),
+)
+# Long free-text columns a grid doesn't show; only sent when named in ?fields=
+GALLERY_OPTIONAL_FIELDS = ('description', 'notes')
+# Columns built as JSON in SQL, decoded by the JSON converter as rows are fetched
+GALLERY_JSON_FIELDS = ('platforms', 'genres', 'artwork')
+
+@lru_cache(maxsize=None)
+def gallery_select_columns(extra_fields=()):
+    """SELECT list for the gallery: every column except the optional ones not in extra_fields."""
+    return ", ".join(
+        f'{sql} AS "{key} [JSON]"' if key in GALLERY_JSON_FIELDS else f"{sql} AS {key}"
+        for key, sql in GALLERY_COLUMNS
+        if key not in GALLERY_OPTIONAL_FIELDS or key in extra_fields
+    )
+
+def gallery_row_to_dict(row):
+    """Response dict for a gallery row selected with gallery_select_columns()."""
+    game = dict(row)
+
+    # Parse release year
+    if game['release_date']:
+        try:
+            game['release_year'] = int(game['release_date'][:4])
+        except (ValueError, TypeError):
+            pass
+
+    # Platforms and genres arrive as lists (see list_json_array_sql, GALLERY_JSON_FIELDS)
+    # Single platform for display (backward compatibility)
+    game['platform'] = game['platforms'][0] if game['platforms'] else ""
+
+    game['region'] = game['region'] or 'PAL'
+    game['is_favorite'] = bool(game['is_favorite'])
+    # Only the artwork the game actually has (see GALLERY_ARTWORK_SQL)
+    game.update(game.pop('artwork'))
+    return game
+
+# Gallery sort orders in the GAMES_SORTS shape. Directions keep SQLite's default
+# NULL placement (first ascending, last descending); g.id breaks ties so pages
+# can be resumed from an after_value/after_id cursor.
+GALLERY_SORTS = {
+    'title_asc': ('g.title', '{}', False, False),
+    'title_desc': ('g.title', '{}', True, True),
+    'date_desc': ('g.release_date', '{}', True, True),
+    'date_asc': ('g.release_date', '{}', False, False),
+    'rating_desc': ('ggm.personal_rating', '{}', True, True),
+    'rating_asc': ('ggm.personal_rating', '{}', False, False),
+    'price_desc': ('g.average_price', '{}', True, True),
+    'price_asc': ('g.average_price', '{}', False, False),
+    'priority_desc': ('ggm.display_priority', '{}', True, True),
+    # Recently added sorting
+    'added_desc': ('g.date_added', "datetime(COALESCE({}, '1970-01-01'))", True, False),
+    'added_asc': ('g.date_added', "datetime(COALESCE({}, '1970-01-01'))", False, False),
+}
+# Rows pulled from SQLite per step while streaming a gallery page
+GALLERY_FETCH_SIZE = 500
+
+GALLERY_NUMERIC_SORTS = ('rating_desc', 'rating_asc', 'price_desc', 'price_asc', 'priority_desc')
+
 @app.route('/api/gallery/games', methods=['GET'])
 def get_gallery_games():
     """
@@ -2518,12 +3310,33 @@ def get_gallery_games():
     - year_max: Maximum release year
     - completion_status: Filter by completion status
     - sort: Sort order (title_asc, title_desc, date_desc, date_asc, rating_desc, rating_asc, price_desc, price_asc, priority_desc)
+    - after_value, after_id: Keyset cursor (a previous page's next_cursor); replaces page/OFFSET
+    - skip_count: 1 to leave total_count/total_pages out (null) and skip the count query
+    - fields: Comma-separated optional fields to include (description, notes); omitted by default
     """
+    # Parse pagination up front so malformed values are a 400, not a 500 from the handler below
+    page = _intarg('page', 1, 1, sys.maxsize)
+    per_page = _intarg('per_page', 20, 1, 10000)  # Cap at 10000 for price range calculations
+    # Also support "limit" parameter (in addition to per_page) to match gallery_api.py
+    per_page = _intarg('limit', per_page, 1, 10000)
+    sort_order = request.args.get('sort', 'title_asc')
+    if sort_order not in GALLERY_SORTS:
+        sort_order = 'title_asc'
+    extra_fields = tuple(
+        field for field in GALLERY_OPTIONAL_FIELDS
+        if field in request.args.get('fields', '').replace(' ', '').split(',')
+    )
+    after_id = _intarg('after_id', None, -sys.maxsize, sys.maxsize)
+    after_value = request.args.get('after_value')
+    if after_id is not None and after_value is not None and sort_order in GALLERY_NUMERIC_SORTS:
+        try:
+            after_value = float(after_value)
+        except ValueError:
+            abort(json_response({"error": "Invalid number for 'after_value'"}, 400))
+
+    # Pooled connection, returned in the finally below on every path
+    conn = get_db_connection()
     try:
-        # Parse query parameters
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 10000)  # Cap at 10000 for price range calculations
-        
         # Filter parameters (updated to match new API)
         search_filter = request.args.get('search', '').strip()  # Changed from title to search
         platform_filter = request.args.get('platform', '').strip()
@@ -2532,297 +3345,175 @@ def get_gallery_games():
         year_min = request.args.get('year_min')
         year_max = request.args.get('year_max')
         completion_status = request.args.get('completion_status', '').strip()
-        sort_order = request.args.get('sort', 'title_asc')
         # Date-added filters (optional)
         added_after = request.args.get('added_after')
         added_before = request.args.get('added_before')
         
-        # Also support "limit" parameter (in addition to per_page) to match gallery_api.py
-        if request.args.get('limit'):
-            per_page = min(int(request.args.get('limit', 20)), 10000)
-        
-        conn = sqlite3.connect(database_path)
         cursor = conn.cursor()
         
-        # Build the base query (simplified - no more tag joins)
+        # Build the base query (simplified - no more tag joins). game_gallery_metadata
+        # is UNIQUE on game_id, so the join never repeats a game and needs no DISTINCT
         base_query = """
         FROM games g
         LEFT JOIN game_gallery_metadata ggm ON g.id = ggm.game_id
         """
         
-        # Build WHERE conditions
-        where_conditions = []
-        params = []
+        # Build WHERE conditions, ranked like /games so cheap comparisons run first
+        filters = []
         
         if search_filter:
-            # Enhanced search with special character normalization
-            normalized_search = normalize_for_search(search_filter)
-            
-            # Search using both the original term and the accent-stripped version
-            where_conditions.append("""(
-                LOWER(g.title) LIKE ? OR 
-                LOWER(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(REPLACE(
-                    g.title, 'é', 'e'), 'è', 'e'), 'ê', 'e'), 'ë', 'e'), 
-                    'á', 'a'), 'à', 'a'), 'ä', 'a'), 'â', 'a'),
-                    'ó', 'o'), 'ò', 'o')) LIKE ?
-            )""")
-            params.append(f"%{search_filter.lower()}%")
-            params.append(f"%{normalized_search}%")
+            filters.append(title_filter(search_filter, "g"))
         
         if platform_filter:
-            # Platform filtering with support for both string and JSON array data
-            # Handle both simple strings and JSON arrays
-            where_conditions.append("""
-                (g.platforms IS NOT NULL AND (
-                    g.platforms = ? OR
-                    (g.platforms LIKE '[%' AND EXISTS (
-                        SELECT 1 FROM json_each(g.platforms) 
-                        WHERE json_each.value = ?
-                    ))
-                ))
-            """)
-            params.extend([platform_filter, platform_filter])
+            # game_platforms holds one row per platform (from strings and JSON arrays alike),
+            # so this is an index seek instead of parsing every game's platforms
+            filters.append((FILTER_EQUALITY, "g.id IN (SELECT game_id FROM game_platforms WHERE platform = ?)", [platform_filter]))
         
         if genre_filter:
-            where_conditions.append("g.genres LIKE ?")
-            params.append(f"%{genre_filter}%")
+            filters.append((FILTER_EQUALITY, "g.id IN (SELECT game_id FROM game_genres WHERE genre = ?)", [genre_filter]))
         
         if region_filter:
-            where_conditions.append("UPPER(IFNULL(g.region, 'PAL')) = ?")
-            params.append(region_filter.upper())
+            filters.append((FILTER_EQUALITY, "UPPER(IFNULL(g.region, 'PAL')) = ?", [region_filter.upper()]))
         
         if year_min:
-            where_conditions.append("CAST(substr(g.release_date, 1, 4) AS INTEGER) >= ?")
-            params.append(int(year_min))
+            filters.append((FILTER_RANGE, f"{RELEASE_YEAR_SQL.format('g.release_date')} >= ?", [int(year_min)]))
         
         if year_max:
-            where_conditions.append("CAST(substr(g.release_date, 1, 4) AS INTEGER) <= ?")
-            params.append(int(year_max))
+            filters.append((FILTER_RANGE, f"{RELEASE_YEAR_SQL.format('g.release_date')} <= ?", [int(year_max)]))
         
         # Price range filters
         price_min = request.args.get('price_min')
         price_max = request.args.get('price_max')
         if price_min:
             try:
-                where_conditions.append("g.average_price >= ?")
-                params.append(float(price_min))
+                filters.append((FILTER_RANGE, "g.average_price >= ?", [float(price_min)]))
             except (ValueError, TypeError):
                 pass
         if price_max:
             try:
-                where_conditions.append("g.average_price <= ?")
-                params.append(float(price_max))
+                filters.append((FILTER_RANGE, "g.average_price <= ?", [float(price_max)]))
             except (ValueError, TypeError):
                 pass
         
         if completion_status:
-            where_conditions.append("ggm.completion_status = ?")
-            params.append(completion_status)
+            filters.append((FILTER_EQUALITY, "ggm.completion_status = ?", [completion_status]))
 
         # Apply date-added range if provided
         if added_after:
-            try:
-                if len(added_after) == 10:
-                    added_after = added_after + " 00:00:00"
-                where_conditions.append("datetime(g.date_added) >= datetime(?)")
-                params.append(added_after)
-            except Exception:
-                pass
+            if len(added_after) == 10:
+                added_after = added_after + " 00:00:00"
+            filters.append((FILTER_RANGE, "datetime(g.date_added) >= datetime(?)", [added_after]))
         if added_before:
-            try:
-                if len(added_before) == 10:
-                    added_before = added_before + " 23:59:59"
-                where_conditions.append("datetime(g.date_added) <= datetime(?)")
-                params.append(added_before)
-            except Exception:
-                pass
+            if len(added_before) == 10:
+                added_before = added_before + " 23:59:59"
+            filters.append((FILTER_RANGE, "datetime(g.date_added) <= datetime(?)", [added_before]))
         
         # Combine WHERE conditions
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions)
-        
-        # Count total games matching filters
-        count_query = f"SELECT COUNT(DISTINCT g.id) {base_query} {where_clause}"
-        cursor.execute(count_query, params)
-        total_games = cursor.fetchone()[0]
-        
-        # Calculate pagination
-        total_pages = (total_games + per_page - 1) // per_page
-        offset = (page - 1) * per_page
+        filters_sql, params = where_clause(filters)
+        gallery_where = f"WHERE {filters_sql}" if filters else ""
+        
+        total_games = total_pages = None
+        if after_id is None and request.args.get('skip_count') != '1':
+            # Count total games matching filters, once per filter combination
+            count_query = f"SELECT COUNT(*) {base_query} {gallery_where}"
+            count_key = (database_path, count_query, tuple(params))
+            total_games = _games_counts.get(count_key)
+            if total_games is None:
+                cursor.execute(count_query, params)
+                total_games = cursor.fetchone()[0]
+                _games_counts.set(count_key, total_games)
+            
+            # Calculate pagination
+            total_pages = (total_games + per_page - 1) // per_page
+
+        if after_id is None:
+            offset = (page - 1) * per_page
+            page_where = gallery_where
+            page_params = params
+        else:
+            # Cursor requests seek straight to the next row and skip the count
+            cursor_sql, cursor_params = games_after_cursor(
+                sort_order, after_value, after_id, GALLERY_SORTS, 'g.id', 'title_asc'
+            )
+            page_where = (gallery_where or "WHERE 1") + cursor_sql
+            page_params = params + cursor_params
         
         # Build sort order
-        sort_mapping = {
-            'title_asc': 'g.title ASC',
-            'title_desc': 'g.title DESC',
-            'date_desc': 'g.release_date DESC',
-            'date_asc': 'g.release_date ASC',
-            'rating_desc': 'ggm.personal_rating DESC',
-            'rating_asc': 'ggm.personal_rating ASC',
-            'price_desc': 'g.average_price DESC',
-            'price_asc': 'g.average_price ASC',
-            'priority_desc': 'ggm.display_priority DESC',
-            # Recently added sorting
-            'added_desc': 'datetime(COALESCE(g.date_added, "1970-01-01")) DESC',
-            'added_asc': 'datetime(COALESCE(g.date_added, "1970-01-01")) ASC'
-        }
-        
-        order_by = sort_mapping.get(sort_order, 'g.title ASC')
+        order_by = games_order_by(sort_order, GALLERY_SORTS, 'g.id', 'title_asc')
         
         # Main query to fetch games with gallery metadata and high-res artwork
         main_query = f"""
-        SELECT DISTINCT
-            g.id,
-            g.title,
-            g.description,
-            g.publisher,
-            g.platforms,
-            g.genres,
-            g.series,
-            g.release_date,
-            g.average_price,
-            g.youtube_trailer_url,
-            g.region,
-            g.date_added,
-            ggm.completion_status,
-            ggm.personal_rating,
-            ggm.play_time_hours,
-            ggm.notes,
-            ggm.display_priority,
-            ggm.favorite,
-            ggm.date_acquired,
-            ggm.date_completed,
-            g.high_res_cover_url,
-            g.high_res_cover_path,
-            g.hero_image_url,
-            g.hero_image_path,
-            g.logo_image_url,
-            g.logo_image_path,
-            g.icon_image_url,
-            g.icon_image_path,
-            g.steamgriddb_id
+        SELECT {gallery_select_columns(extra_fields)}
         {base_query}
-        {where_clause}
-        ORDER BY {order_by}
-        LIMIT ? OFFSET ?
+        {page_where}
+        {order_by}
+        LIMIT ?
         """
-        
-        cursor.execute(main_query, params + [per_page, offset])
-        games_data = cursor.fetchall()
-        
-        # Process games (no longer fetching tags)
-        games = []
-        for game_row in games_data:
-            game_id = game_row[0]
-            
-            # Parse release year
-            release_year = None
-            if game_row[7]:  # release_date column
-                try:
-                    release_year = int(game_row[7][:4])
-                except (ValueError, TypeError):
-                    pass
-            
-            # Format platform (take first platform if multiple)
-            platform = ""
-            if game_row[4]:  # platforms (now column 4 instead of 5)
-                try:
-                    platforms = json.loads(game_row[4])
-                    if isinstance(platforms, list) and platforms:
-                        platform = platforms[0]
-                    elif isinstance(platforms, str):
-                        platform = platforms
-                except (json.JSONDecodeError, TypeError):
-                    platform = str(game_row[4])
-            
-            # Split genres into list (for individual genre filtering)
-            genres_list = []
-            genres_field = game_row[5]
-            if genres_field and str(genres_field).strip():  # genres column
-                genres_list = [g.strip() for g in str(genres_field).split(',') if g.strip()]
-                
-            # Split platforms into list 
-            platforms_list = []
-            if game_row[4]:  # platforms column
-                try:
-                    # Try to parse as JSON first
-                    platforms_data = json.loads(game_row[4])
-                    if isinstance(platforms_data, list):
-                        platforms_list = platforms_data
-                    else:
-                        platforms_list = [str(platforms_data)]
-                except (json.JSONDecodeError, TypeError):
-                    # Fall back to comma-separated string
-                    platforms_list = [p.strip() for p in str(game_row[4]).split(',') if p.strip()]
-            
-            game = {
-                'id': game_id,
-                'title': game_row[1],
-                'description': game_row[2],
-                'publisher': game_row[3],
-                'platform': platform,  # Single platform for display (backward compatibility)
-                'platforms': platforms_list,  # Convert platforms to list
-                'genres': genres_list,  # Convert to list for frontend
-                'series': game_row[6],
-                'release_date': game_row[7],
-                'release_year': release_year,
-                'average_price': game_row[8],
-                'youtube_trailer_url': game_row[9],
-                'region': game_row[10] or 'PAL',
-                'date_added': game_row[11],
-                'completion_status': game_row[12],
-                'personal_rating': game_row[13],
-                'play_time_hours': game_row[14],
-                'notes': game_row[15],
-                'display_priority': game_row[16],
-                'is_favorite': bool(game_row[17]),
-                'date_acquired': game_row[18],
-                'date_completed': game_row[19],
-                # High-resolution artwork from SteamGridDB  
-                'high_res_cover_url': game_row[20],
-                'high_res_cover_path': game_row[21],
-                'hero_image_url': game_row[22],
-                'hero_image_path': game_row[23],
-                'logo_image_url': game_row[24],
-                'logo_image_path': game_row[25],
-                'icon_image_url': game_row[26],
-                'icon_image_path': game_row[27],
-                'steamgriddb_id': game_row[28]
-            }
-            games.append(game)
-        
-        conn.close()
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'games': games,
-                'pagination': {
-                    'current_page': page,
-                    'total_pages': total_pages,
-                    'total_count': total_games,
-                    'per_page': per_page,
-                    'has_next': page < total_pages,
-                    'has_prev': page > 1
-                },
-                'filters_applied': {
-                    'search': search_filter,
-                    'platform': platform_filter,
-                    'genre': genre_filter,
-                    'region': region_filter,
-                    'year_min': year_min,
-                    'year_max': year_max,
-                    'completion_status': completion_status,
-                    'sort': sort_order
-                }
-            }
-        })
+        # One extra row tells us whether there is a next page
+        limit_params = [per_page + 1]
+        if after_id is None:
+            main_query += " OFFSET ?"
+            limit_params.append(offset)
+        
+        cursor.execute(main_query, page_params + limit_params)
+        pagination = {
+            'current_page': page,
+            'total_pages': total_pages,
+            'total_count': total_games,
+            'per_page': per_page,
+            'has_next': False,
+            'has_prev': page > 1 or after_id is not None,
+            'next_cursor': None
+        }
+        filters_applied = {
+            'search': search_filter,
+            'platform': platform_filter,
+            'genre': genre_filter,
+            'region': region_filter,
+            'year_min': year_min,
+            'year_max': year_max,
+            'completion_status': completion_status,
+            'sort': sort_order
+        }
+        sort_key = GALLERY_SORTS[sort_order][0].split('.')[-1]
+
+        def generate():
+            # Each game is serialized as it's fetched, so large pages never sit in memory
+            # as a whole; pagination goes last since has_next/next_cursor need the final row
+            yield b'{"success":true,"data":{"games":['
+            count = 0
+            last_game = None
+            while not pagination['has_next']:
+                rows = cursor.fetchmany(GALLERY_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    if count == per_page:
+                        # The extra row only tells us there is a next page
+                        pagination['has_next'] = True
+                        break
+                    last_game = gallery_row_to_dict(row)
+                    yield (b',' if count else b'') + json_dumps(last_game)
+                    count += 1
+            if pagination['has_next']:
+                pagination['next_cursor'] = {'after_id': last_game['id'], 'after_value': last_game[sort_key]}
+            # '],"pagination":{...},"filters_applied":{...}}' closes "data", then the outer object
+            yield b'],' + json_dumps({'pagination': pagination, 'filters_applied': filters_applied})[1:] + b'}'
+
+        response = Response(generate(), mimetype='application/json')
+        # The stream owns the connection now; it's returned once the response is finished or abandoned
+        response.call_on_close(conn.close)
+        conn = None
+        return response
         
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
+    finally:
+        if conn is not None:
+            conn.close()
 
 # -------------------------
 # Database Backup Endpoints
@@ -2845,8 +3536,17 @@ def backup_database_endpoint():
         backup_filename = f"games_backup_{ts}.db"
         backup_abs_path = os.path.join(backups_dir, backup_filename)
 
-        # Copy DB
-        shutil.copy2(database_path, backup_abs_path)
+        # Copy DB through SQLite's online backup API: in WAL mode recent commits
+        # can still be sitting in the -wal file, which a plain file copy would miss
+        conn = get_db_connection()
+        try:
+            backup_conn = sqlite3.connect(backup_abs_path)
+            try:
+                conn.backup(backup_conn)
+            finally:
+                backup_conn.close()
+        finally:
+            conn.close()
 
         # Compute relative path for media serving (only works if within project root)
         rel_path = os.path.relpath(backup_abs_path, PROJECT_ROOT)
@@ -2884,8 +3584,8 @@ def list_backups_endpoint():
 @app.route('/api/gallery/game/<int:game_id>', methods=['GET'])
 def get_gallery_game_detail(game_id):
     """Get detailed information for a single game including gallery metadata"""
+    conn = get_db_connection()
     try:
-        conn = sqlite3.connect(database_path)
         cursor = conn.cursor()
         
         # Get game with gallery metadata
@@ -2953,8 +3653,6 @@ def get_gallery_game_detail(game_id):
             'tags': tags
         }
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'game': game
@@ -2965,98 +3663,44 @@ def get_gallery_game_detail(game_id):
             'success': False,
             'error': str(e)
         }), 500
+    finally:
+        conn.close()
 
 @app.route('/api/gallery/filters', methods=['GET'])
 def get_gallery_filters():
     """Get all available filter options for the gallery"""
+    cached = _gallery_filters.get(database_path)
+    if cached is not None:
+        return Response(cached, mimetype="application/json")
+
+    conn = get_db_connection()
     try:
-        conn = sqlite3.connect(database_path)
         cursor = conn.cursor()
         
-        # Get unique platforms from both string and JSON data
-        cursor.execute("""
-            SELECT DISTINCT platforms 
-            FROM games 
-            WHERE platforms IS NOT NULL AND platforms != '' AND platforms != '__PLACEHOLDER__'
-            ORDER BY platforms
-        """)
-        platform_rows = cursor.fetchall()
-        platforms = []
-        for row in platform_rows:
-            platform_data = row[0]
-            if platform_data.startswith('['):
-                # Handle JSON array data
-                try:
-                    parsed_data = json.loads(platform_data)
-                    if isinstance(parsed_data, list):
-                        platforms.extend(parsed_data)
-                    elif isinstance(parsed_data, str):
-                        platforms.append(parsed_data)
-                except (json.JSONDecodeError, TypeError):
-                    # If JSON parsing fails, treat as string
-                    platforms.append(platform_data)
-            else:
-                # Handle simple string data
-                if ',' in platform_data:
-                    # Split comma-separated platforms
-                    split_platforms = [p.strip() for p in platform_data.split(',') if p.strip()]
-                    platforms.extend(split_platforms)
-                else:
-                    platforms.append(platform_data.strip())
-        
-        # Remove duplicates and filter out empty entries
-        unique_platforms = []
-        for platform in platforms:
-            platform = platform.strip()
-            if platform and platform not in unique_platforms:
-                unique_platforms.append(platform)
-        
-        platforms = sorted(unique_platforms)
-        
-        # Get unique genres (split from comma-separated strings)
-        cursor.execute("""
-            SELECT DISTINCT genres 
-            FROM games 
-            WHERE genres IS NOT NULL AND genres != ''
-            ORDER BY genres
-        """)
-        genre_rows = cursor.fetchall()
-        genres = []
-        for row in genre_rows:
-            genre_data = row[0]
-            if genre_data:
-                # Split comma-separated genres and flatten
-                for genre in genre_data.split(','):
-                    genre = genre.strip()
-                    if genre and genre not in genres:
-                        genres.append(genre)
-        genres.sort()
+        # Platforms and genres come split and trimmed from their link tables
+        # (see ensure_list_link_table); DISTINCT reads them off the value index
+        cursor.execute(SQL_DISTINCT_PLATFORMS + " ORDER BY platform")
+        platforms = [row[0] for row in cursor.fetchall()]
+        
+        cursor.execute(SQL_DISTINCT_GENRES + " ORDER BY genre")
+        genres = [row[0] for row in cursor.fetchall()]
         
         # Get unique regions
         cursor.execute("""
             SELECT DISTINCT IFNULL(region, 'PAL') as region
             FROM games 
         """)
-        region_rows = cursor.fetchall()
-        regions = sorted(list(set([row[0] for row in region_rows if row[0]])))
-        
-        # Ensure standard regions are available
-        if 'PAL' not in regions:
-            regions.append('PAL')
-        if 'NTSC' not in regions:
-            regions.append('NTSC')
-        if 'JP' not in regions:
-            regions.append('JP')
-        regions.sort()
-        
-        # Get release years
-        cursor.execute("""
-            SELECT DISTINCT CAST(substr(release_date, 1, 4) AS INTEGER) as year
+        # Standard regions are always offered; one set, sorted once
+        regions = sorted({row[0] for row in cursor.fetchall() if row[0]} | {'PAL', 'NTSC', 'JP'})
+        
+        # Get release years, in the idx_games_release_year_int expression so
+        # they are read from that index; the range keeps only four-digit years
+        release_year = RELEASE_YEAR_SQL.format("release_date")
+        cursor.execute(f"""
+            SELECT DISTINCT {release_year} as year
             FROM games 
-            WHERE release_date IS NOT NULL 
-            AND release_date != '' 
-            AND length(release_date) >= 4
-            AND substr(release_date, 1, 4) GLOB '[0-9][0-9][0-9][0-9]'
+            WHERE {release_year} BETWEEN 1000 AND 9999
+            AND id != -1
             ORDER BY year
         """)
         release_years = [row[0] for row in cursor.fetchall()]
@@ -3070,15 +3714,14 @@ def get_gallery_filters():
         """)
         completion_statuses = [row[0] for row in cursor.fetchall()]
         
-        conn.close()
-        
-        return jsonify({
+        body = json_dumps({
             'success': True,
             'data': {
                 'platforms': platforms,
                 'genres': genres,  
                 'regions': regions,
                 'completion_statuses': completion_statuses,
+                'release_years': release_years,
                 'sort_options': [
                     {'value': 'title_asc', 'label': 'Title (A-Z)'},
                     {'value': 'title_desc', 'label': 'Title (Z-A)'},
@@ -3092,12 +3735,16 @@ def get_gallery_filters():
                 ]
             }
         })
+        _gallery_filters.set(database_path, body)
+        return Response(body, mimetype="application/json")
         
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
+    finally:
+        conn.close()
 
 # -------------------------
 # Price History API Endpoints
@@ -3107,18 +3754,17 @@ def get_gallery_filters():
 def get_price_history(game_id):
     """Get price history for a specific game"""
     try:
-        conn = sqlite3.connect(database_path)
-        cursor = conn.cursor()
-        
-        # Get price history for the game (include entry id)
-        cursor.execute("""
-            SELECT id, price, price_source, date_recorded, currency
-            FROM price_history
-            WHERE game_id = ?
-            ORDER BY date_recorded ASC
-        """, (game_id,))
-        
-        history_rows = cursor.fetchall()
+        with closing(get_db_connection()) as conn:
+            # Get price history for the game (include entry id)
+            history_rows = conn.execute("""
+                SELECT id, price, price_source, date_recorded, currency
+                FROM price_history
+                WHERE game_id = ?
+                ORDER BY date_recorded ASC
+            """, (game_id,)).fetchall()
+            
+            # Also get game details for context
+            game_result = conn.execute("SELECT title FROM games WHERE id = ?", (game_id,)).fetchone()
         
         # Format the data for frontend consumption
         price_history = []
@@ -3131,13 +3777,8 @@ def get_price_history(game_id):
                 'currency': currency or 'GBP'
             })
         
-        # Also get game details for context
-        cursor.execute("SELECT title FROM games WHERE id = ?", (game_id,))
-        game_result = cursor.fetchone()
         game_title = game_result[0] if game_result else f"Game {game_id}"
         
-        conn.close()
-        
         return jsonify({
             'success': True,
             'game_id': game_id,
@@ -3156,41 +3797,16 @@ def get_price_history(game_id):
 def delete_price_history_entry(entry_id: int):
     """Delete a specific price history entry by its ID"""
     try:
-        conn = sqlite3.connect(database_path)
-        cursor = conn.cursor()
-        
-        # Verify it exists and get game_id for optional context
-        cursor.execute("SELECT game_id FROM price_history WHERE id = ?", (entry_id,))
-        row = cursor.fetchone()
-        if not row:
-            conn.close()
-            return jsonify({'success': False, 'error': 'Entry not found'}), 404
-        game_id = row[0]
-
-        cursor.execute("DELETE FROM price_history WHERE id = ?", (entry_id,))
-        
-        # After deletion, recompute latest price for the game and update games.average_price
-        cursor.execute(
-            """
-            SELECT price
-            FROM price_history
-            WHERE game_id = ?
-            ORDER BY datetime(date_recorded) DESC, id DESC
-            LIMIT 1
-            """,
-            (game_id,),
-        )
-        latest_row = cursor.fetchone()
-        if latest_row is not None:
-            latest_price = latest_row[0]
-            cursor.execute("UPDATE games SET average_price = ? WHERE id = ?", (latest_price, game_id))
-        else:
-            # No history remains; clear the current price
-            cursor.execute("UPDATE games SET average_price = NULL WHERE id = ?", (game_id,))
+        with closing(get_db_connection()) as conn, conn:
+            row = conn.execute(SQL_DELETE_PRICE_HISTORY_ENTRY, (entry_id,)).fetchone()
+            if not row:
+                return jsonify({'success': False, 'error': 'Entry not found'}), 404
+            game_id = row[0]
 
-        conn.commit()
-        conn.close()
+            # After deletion, recompute latest price for the game and update games.average_price
+            conn.execute(SQL_UPDATE_GAME_PRICE_FROM_HISTORY, {'game_id': game_id})
 
+        invalidate_game_caches()
         return jsonify({'success': True, 'message': 'Entry deleted', 'entry_id': entry_id, 'game_id': game_id}), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -3212,26 +3828,15 @@ def add_price_history_entry():
         
         from datetime import datetime
         
-        conn = sqlite3.connect(database_path)
-        cursor = conn.cursor()
-        
-        # Add the price history entry
+        # Add the price history entry and update the game's current average_price as well
         current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute("""
-            INSERT INTO price_history (game_id, price, price_source, date_recorded, currency)
-            VALUES (?, ?, ?, ?, ?)
-        """, (game_id, price, price_source, current_date, 'GBP'))
-
-        # Update the game's current average_price as well
-        cursor.execute("""
-            UPDATE games SET average_price = ? WHERE id = ?
-        """, (price, game_id))
-
-        conn.commit()
+        with closing(get_db_connection()) as conn, conn:
+            conn.execute(SQL_INSERT_PRICE_HISTORY, (game_id, price, price_source, current_date, 'GBP'))
+            conn.execute(SQL_UPDATE_GAME_PRICE, (price, game_id))
+        invalidate_game_caches()
 
         # Check for price alerts
         check_price_change_and_alert(game_id, price, price_source)
-        conn.close()
         
         return jsonify({
             'success': True,
@@ -3340,51 +3945,48 @@ def update_game_alert_settings(game_id):
     """Update alert settings for a specific game"""
     try:
         data = request.get_json()
-        conn = sqlite3.connect(database_path)
-        cursor = conn.cursor()
-
-        # Check if settings already exist
-        cursor.execute("SELECT id FROM game_alert_settings WHERE game_id = ?", (game_id,))
-        existing = cursor.fetchone()
-
-        if existing:
-            # Update existing settings
-            cursor.execute("""
-                UPDATE game_alert_settings
-                SET enabled = ?, price_source = ?, price_region = ?, price_drop_threshold = ?,
-                    price_increase_threshold = ?, alert_price_threshold = ?,
-                    alert_value_threshold = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE game_id = ?
-            """, (
-                data.get('enabled', False),
-                data.get('price_source'),
-                data.get('price_region'),
-                data.get('price_drop_threshold'),
-                data.get('price_increase_threshold'),
-                data.get('alert_price_threshold'),
-                data.get('alert_value_threshold'),
-                game_id
-            ))
-        else:
-            # Insert new settings
-            cursor.execute("""
-                INSERT INTO game_alert_settings
-                (game_id, enabled, price_source, price_region, price_drop_threshold, price_increase_threshold,
-                 alert_price_threshold, alert_value_threshold)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                game_id,
-                data.get('enabled', False),
-                data.get('price_source'),
-                data.get('price_region'),
-                data.get('price_drop_threshold'),
-                data.get('price_increase_threshold'),
-                data.get('alert_price_threshold'),
-                data.get('alert_value_threshold')
-            ))
+        with closing(get_db_connection()) as conn, conn:
+            cursor = conn.cursor()
 
-        conn.commit()
-        conn.close()
+            # Check if settings already exist
+            cursor.execute("SELECT id FROM game_alert_settings WHERE game_id = ?", (game_id,))
+            existing = cursor.fetchone()
+
+            if existing:
+                # Update existing settings
+                cursor.execute("""
+                    UPDATE game_alert_settings
+                    SET enabled = ?, price_source = ?, price_region = ?, price_drop_threshold = ?,
+                        price_increase_threshold = ?, alert_price_threshold = ?,
+                        alert_value_threshold = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE game_id = ?
+                """, (
+                    data.get('enabled', False),
+                    data.get('price_source'),
+                    data.get('price_region'),
+                    data.get('price_drop_threshold'),
+                    data.get('price_increase_threshold'),
+                    data.get('alert_price_threshold'),
+                    data.get('alert_value_threshold'),
+                    game_id
+                ))
+            else:
+                # Insert new settings
+                cursor.execute("""
+                    INSERT INTO game_alert_settings
+                    (game_id, enabled, price_source, price_region, price_drop_threshold, price_increase_threshold,
+                     alert_price_threshold, alert_value_threshold)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    game_id,
+                    data.get('enabled', False),
+                    data.get('price_source'),
+                    data.get('price_region'),
+                    data.get('price_drop_threshold'),
+                    data.get('price_increase_threshold'),
+                    data.get('alert_price_threshold'),
+                    data.get('alert_value_threshold')
+                ))
 
         return jsonify({'success': True, 'message': 'Game alert settings updated'})
     except Exception as e:
@@ -3394,13 +3996,8 @@ def update_game_alert_settings(game_id):
 def delete_game_alert_settings(game_id):
     """Reset alert settings for a specific game (use global defaults)"""
     try:
-        conn = sqlite3.connect(database_path)
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM game_alert_settings WHERE game_id = ?", (game_id,))
-
-        conn.commit()
-        conn.close()
+        with closing(get_db_connection()) as conn, conn:
+            conn.execute("DELETE FROM game_alert_settings WHERE game_id = ?", (game_id,))
 
         return jsonify({'success': True, 'message': 'Game alert settings reset to global defaults'})
     except Exception as e:
@@ -3518,45 +4115,62 @@ def fetch_high_res_artwork():
             'error': str(e)
         }), 500
 
+# Artwork counts and the games missing a high-res cover in one statement. The
+# first column tags the row: 0 is the single counts row, 1 is one row per game
+# without a cover, in title order, carrying its {"id", "title", "platform"}
+# entry already as JSON text. Empty strings count as missing everywhere
+# (x <> '' is not true for NULL either). ?summary_only=1 runs the counts alone.
+SQL_HIGH_RES_ARTWORK_COUNTS = """
+    SELECT 0 AS kind,
+           COUNT(*),
+           COUNT(*) FILTER (WHERE high_res_cover_url <> ''),
+           COUNT(*) FILTER (WHERE hero_image_url <> ''),
+           COUNT(*) FILTER (WHERE logo_image_url <> ''),
+           COUNT(*) FILTER (WHERE icon_image_url <> ''),
+           ROUND(100.0 * COUNT(*) FILTER (WHERE high_res_cover_url <> '') / NULLIF(COUNT(*), 0), 1)
+    FROM games
+    WHERE id != -1
+"""
+SQL_HIGH_RES_ARTWORK_STATUS = SQL_HIGH_RES_ARTWORK_COUNTS + """
+    UNION ALL
+    SELECT 1, json_object('id', id, 'title', title, 'platform', platforms), title, NULL, NULL, NULL, NULL
+    FROM games
+    WHERE id != -1 AND (high_res_cover_url IS NULL OR high_res_cover_url = '')
+    ORDER BY 1, 3
+"""
+
+# Missing-cover rows (JSON from SQL) written out per batch while the status response streams
+ARTWORK_STATUS_FETCH_SIZE = 100
+
 @app.route('/api/high_res_artwork/status', methods=['GET'])
 def check_high_res_artwork_status():
-    """Check high resolution artwork status for games"""
+    """Check high resolution artwork status for games
+
+    Query parameters:
+    - summary_only: 1 to return just stats and needs_artwork, without the games_without_artwork list
+
+    summary_only responses carry an ETag built from the counts, so pollers sending
+    If-None-Match get a bodiless 304 while nothing has changed.
+    """
+    summary_only = request.args.get('summary_only') == '1'
+    # Pooled, so the statement is compiled once per connection and reused
+    conn = get_db_connection()
     try:
-        conn = sqlite3.connect(database_path)
         cursor = conn.cursor()
-        
-        # Count games with and without high-res artwork
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_games,
-                COUNT(high_res_cover_url) as games_with_covers,
-                COUNT(hero_image_url) as games_with_heroes,
-                COUNT(logo_image_url) as games_with_logos,
-                COUNT(icon_image_url) as games_with_icons
-            FROM games 
-            WHERE id != -1
-        """)
-        
-        stats = cursor.fetchone()
-        
-        # Get games without high-res covers (most important metric)
-        cursor.execute(
-            """
-            SELECT id, title, platforms AS platform
-            FROM games
-            WHERE id != -1 AND (high_res_cover_url IS NULL OR high_res_cover_url = '')
-            ORDER BY title
-            """
-        )
-        
-        games_without_artwork = [
-            {'id': row[0], 'title': row[1], 'platform': row[2]}
-            for row in cursor.fetchall()
-        ]
-        
-        conn.close()
-        
-        return jsonify({
+        cursor.execute(SQL_HIGH_RES_ARTWORK_COUNTS if summary_only else SQL_HIGH_RES_ARTWORK_STATUS)
+        
+        # Counts row first, then the games without high-res covers (most important metric)
+        stats = cursor.fetchone()[1:]
+        # Every game not counted as covered is on the missing list
+        needs_artwork = stats[0] > stats[1]
+        if summary_only:
+            # The counts are the whole summary, so they make an exact validator
+            etag = hashlib.blake2b(repr(tuple(stats)).encode(), digest_size=8).hexdigest()
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+                response.set_etag(etag)
+                return response
+        summary = {
             'success': True,
             'stats': {
                 'total_games': stats[0],
@@ -3564,38 +4178,68 @@ def check_high_res_artwork_status():
                 'games_with_heroes': stats[2],
                 'games_with_logos': stats[3],
                 'games_with_icons': stats[4],
-                'coverage_percentage': round((stats[1] / stats[0]) * 100, 1) if stats[0] > 0 else 0
-            },
-            'games_without_artwork': games_without_artwork,
-            'needs_artwork': len(games_without_artwork) > 0
-        })
+                'coverage_percentage': stats[5] or 0  # NULL for an empty library
+            }
+        }
+        if summary_only:
+            summary['needs_artwork'] = needs_artwork
+            response = json_response(summary)
+            response.set_etag(etag)
+            return response
+
+        def generate():
+            # The missing list can be most of the library, so it's written out batch by batch
+            yield json_dumps(summary)[:-1] + b',"games_without_artwork":['
+            count = 0
+            while True:
+                rows = cursor.fetchmany(ARTWORK_STATUS_FETCH_SIZE)
+                if not rows:
+                    break
+                yield (b',' if count else b'') + ','.join(row[1] for row in rows).encode()
+                count += len(rows)
+            yield b'],"needs_artwork":' + (b'true' if needs_artwork else b'false') + b'}'
+
+        response = Response(generate(), mimetype='application/json')
+        # The stream owns the connection now; it's closed once the response is finished or abandoned
+        response.call_on_close(conn.close)
+        conn = None
+        return response
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+    finally:
+        if conn is not None:
+            conn.close()
 
 @app.route("/debug/config", methods=["GET"])
 def debug_config():
-    """Debug endpoint to show config file location and contents"""
+    """Debug endpoint to show config file location and contents
+
+    Query parameters:
+    - meta_only: 1 to return only the location/existence fields, without reading the file
+    """
     try:
         config_info = {
             "config_file": CONFIG_FILE,
-            "config_file_absolute": os.path.abspath(CONFIG_FILE),
+            "config_file_absolute": CONFIG_FILE_ABSOLUTE,
             "config_file_exists": os.path.exists(CONFIG_FILE),
-            "config_dir": os.path.dirname(CONFIG_FILE),
-            "config_dir_exists": os.path.exists(os.path.dirname(CONFIG_FILE)),
-            "docker_environment": os.getenv('DOCKER_ENV') or os.path.exists('/.dockerenv'),
+            "config_dir": CONFIG_DIR,
+            "config_dir_exists": os.path.isdir(CONFIG_DIR),
+            "docker_environment": DOCKER_ENVIRONMENT,
             "base_dir": BASE_DIR,
             "current_working_dir": os.getcwd()
         }
+        if request.args.get('meta_only') == '1':
+            return json_response(config_info, 200)
         
         # Try to read the actual config file
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config_contents = json.load(f)
+                with open(CONFIG_FILE, 'rb') as f:
+                    config_contents = json_loads(f.read())
                 config_info["config_contents"] = config_contents
                 config_info["config_file_size"] = os.path.getsize(CONFIG_FILE)
             except Exception as e:
@@ -3603,10 +4247,10 @@ def debug_config():
         else:
             config_info["config_contents"] = "File does not exist"
         
-        return jsonify(config_info), 200
+        return json_response(config_info, 200)
         
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 @app.route("/test/config_save", methods=["POST"])
 def test_config_save():
@@ -3618,25 +4262,23 @@ def test_config_save():
         
         logging.info(f"Testing config save with key: {test_key}, value: {test_value}")
         
-        # Load current config
-        config = load_config()
-        original_value = config.get(test_key)
-        
-        # Set test value
-        config[test_key] = test_value
+        # Load current config (a copy, so original stays as it was)
+        original = load_config()
+        config = {**original, test_key: test_value}
         
         # Save config
         save_config(config)
         
-        # Verify save by reading back
-        with open(CONFIG_FILE, 'r') as f:
-            saved_config = json.load(f)
+        # Verify save by reading back from disk; that the write landed is what's being tested
+        with open(CONFIG_FILE, 'rb') as f:
+            saved_config = json_loads(f.read())
+        
+        # Put the file back as it was, whatever the outcome; nothing to undo if the
+        # test value was already there, and a key that was absent stays absent
+        if config != original:
+            save_config(original)
         
         if saved_config.get(test_key) == test_value:
-            # Restore original value
-            config[test_key] = original_value
-            save_config(config)
-            
             result = {
                 "success": True,
                 "message": f"Config save test successful. Test value '{test_value}' was saved and retrieved correctly.",
@@ -3646,7 +4288,7 @@ def test_config_save():
                 "test_value": test_value,
                 "saved_value": saved_config.get(test_key)
             }
-            return jsonify(result), 200
+            return json_response(result, 200)
         else:
             result = {
                 "success": False,
@@ -3654,26 +4296,38 @@ def test_config_save():
                 "expected": test_value,
                 "actual": saved_config.get(test_key)
             }
-            return jsonify(result), 500
+            return json_response(result, 500)
             
     except Exception as e:
         logging.error(f"Config save test failed: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 if __name__ == "__main__":
-    # Initialize configuration on startup
-    print("🔧 Initializing configuration...")
-    print(f"📁 Config file location: {CONFIG_FILE}")
-    print(f"📁 Config file absolute path: {os.path.abspath(CONFIG_FILE)}")
-    print(f"🐳 Docker environment: {os.getenv('DOCKER_ENV') or os.path.exists('/.dockerenv')}")
-    
+    # Initialize configuration on startup; the banner is collected and written in one go
     config = load_config()
-    print(f"✅ Configuration loaded. Price source: {config.get('price_source', 'Unknown')}")
+    lines = [
+        "🔧 Initializing configuration...",
+        f"📁 Config file location: {CONFIG_FILE}",
+        f"📁 Config file absolute path: {CONFIG_FILE_ABSOLUTE}",
+        f"🐳 Docker environment: {DOCKER_ENVIRONMENT}",
+        f"✅ Configuration loaded. Price source: {config.get('price_source', 'Unknown')}",
+    ]
     if 'steamgriddb_api_key' in config:
         if config['steamgriddb_api_key'].startswith('your_steamgriddb_api_key'):
-            print("⚠️  SteamGridDB API key is set to placeholder. Update config/config.json with your actual API key.")
+            lines.append("⚠️  SteamGridDB API key is set to placeholder. Update config/config.json with your actual API key.")
         else:
-            print("✅ SteamGridDB API key configured")
+            lines.append("✅ SteamGridDB API key configured")
     
-    print("🚀 Starting Flask application...")
-    app.run(host="0.0.0.0", port=5001, debug=True, use_reloader=False)
+    use_waitress = not os.getenv("FLASK_DEBUG") and waitress is not None
+    threads = int(os.getenv("WSGI_THREADS", "8"))
+    if use_waitress:
+        lines.append(f"🚀 Starting Flask application (waitress, {threads} threads)...")
+    else:
+        lines.append("🚀 Starting Flask development server...")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+    if use_waitress:
+        waitress.serve(app, host="0.0.0.0", port=5001, threads=threads)
+    else:
+        app.run(host="0.0.0.0", port=5001, debug=bool(os.getenv("FLASK_DEBUG")), use_reloader=False, threaded=True)
@@ -199,6 +199,18 @@ def update_game_price(game_id):
     else:
         return None
 
+def update_game_prices_bulk(game_ids):
+    """Update the prices of several games in one backend request"""
+    payload = {"ids": game_ids}
+    if "pricecharting_boxed" in st.session_state:
+        payload["prefer_boxed"] = st.session_state.get("pricecharting_boxed", True)
+
+    response = requests.post(f"{BACKEND_URL}/update_game_prices_bulk", json=payload)
+    if response.status_code == 200:
+        return response.json()
+    else:
+        return None
+
 def update_game_artwork(game_id):
     """Update the artwork of a game using SteamGridDB API"""
     response = requests.post(f"{BACKEND_URL}/update_game_artwork/{game_id}")
@@ -285,6 +297,22 @@ def fetch_game_by_id(game_id):
     else:
         return None
 
+def fetch_gallery_game_detail(game_id):
+    """Fetch one game with its gallery metadata (description, notes, ...)"""
+    response = requests.get(f"{BACKEND_URL}/api/gallery/game/{game_id}")
+    if response.status_code == 200:
+        result = response.json()
+        if result.get("success"):
+            return result.get("game")
+    return None
+
+def set_selected_game_detail(fresh):
+    """Store a refreshed game for the detail page, keeping the notes loaded by "View Details" (/game/<id> has none)"""
+    previous = st.session_state.get("selected_game_detail") or {}
+    if "notes" not in fresh and previous.get("id") == fresh.get("id"):
+        fresh["notes"] = previous.get("notes")
+    st.session_state["selected_game_detail"] = fresh
+
 # -------------------------
 # Artwork Helper Functions
 # -------------------------
@@ -374,9 +402,12 @@ def scan_game(barcode):
 # Gallery API Helper Functions
 # -------------------------
 
-def fetch_gallery_games(filters=None, page=1, per_page=20):
+def fetch_gallery_games(filters=None, page=1, per_page=20, fields=None):
     """Fetch games for gallery display with pagination and filtering"""
     params = {"page": page, "limit": per_page}  # API uses "limit" not "per_page"
+    if fields:
+        # Optional long text fields (description, notes) are left out unless asked for
+        params["fields"] = fields
     if filters:
         params.update(filters)
     response = requests.get(f"{BACKEND_URL}/api/gallery/games", params=params)
@@ -945,7 +976,7 @@ def game_detail_page():
         if game_id:
             fresh = fetch_game_by_id(game_id)
             if isinstance(fresh, dict) and fresh:
-                st.session_state["selected_game_detail"] = fresh
+                set_selected_game_detail(fresh)
                 game = fresh
     except Exception:
         # Non-fatal; keep existing session copy if refresh fails
@@ -1330,7 +1361,7 @@ def game_detail_page():
                         try:
                             fresh = fetch_game_by_id(update_price_game_id)
                             if isinstance(fresh, dict) and fresh:
-                                st.session_state["selected_game_detail"] = fresh
+                                set_selected_game_detail(fresh)
                         except Exception:
                             pass
                         st.rerun()
@@ -1366,7 +1397,7 @@ def game_detail_page():
                             try:
                                 fresh = fetch_game_by_id(update_artwork_game_id)
                                 if isinstance(fresh, dict) and fresh:
-                                    st.session_state["selected_game_detail"] = fresh
+                                    set_selected_game_detail(fresh)
                             except Exception:
                                 pass
                             st.rerun()
@@ -1417,7 +1448,7 @@ def game_detail_page():
                             try:
                                 fresh = fetch_game_by_id(update_artwork_game_id)
                                 if isinstance(fresh, dict) and fresh:
-                                    st.session_state["selected_game_detail"] = fresh
+                                    set_selected_game_detail(fresh)
                             except Exception:
                                 pass
                             st.rerun()
@@ -1608,17 +1639,16 @@ def game_detail_page():
         with st.expander("Manage Price History Entries", expanded=False):
             # Update prices for all games on current page using current price source
             if st.button("Update Prices (This Page)", key="update_prices_page"):
-                updated = 0
                 current_page_games = st.session_state.get("current_gallery_games", [])
-                for g in current_page_games:
-                    gid2 = g.get("id")
-                    if gid2:
-                        try:
-                            _ = update_game_price(gid2)
-                            updated += 1
-                        except Exception:
-                            pass
-                st.success(f"Triggered price updates for {updated} games on this page")
+                page_ids = [g.get("id") for g in current_page_games if g.get("id")]
+                try:
+                    result = update_game_prices_bulk(page_ids) if page_ids else None
+                except Exception:
+                    result = None
+                if result:
+                    st.success(f"Updated prices for {result.get('updated', 0)} of {len(page_ids)} games on this page")
+                else:
+                    st.error("Failed to update prices for this page")
 
             st.markdown("---")
             for entry in history_data["price_history"]:
@@ -1636,7 +1666,7 @@ def game_detail_page():
                             try:
                                 fresh = fetch_game_by_id(gid)
                                 if isinstance(fresh, dict) and fresh:
-                                    st.session_state["selected_game_detail"] = fresh
+                                    set_selected_game_detail(fresh)
                             except Exception:
                                 pass
                             st.rerun()
@@ -1684,7 +1714,7 @@ def game_detail_page():
                         try:
                             fresh = fetch_game_by_id(gid)
                             if isinstance(fresh, dict) and fresh:
-                                st.session_state["selected_game_detail"] = fresh
+                                set_selected_game_detail(fresh)
                         except Exception:
                             pass
                         st.rerun()
@@ -2944,6 +2974,17 @@ def display_gallery_tile(column, game):
             ):
                 # Store current gallery state before navigating to game detail
                 store_gallery_state()
+                # Grid rows leave out the long text fields; load them for this one game
+                try:
+                    detail = fetch_gallery_game_detail(game_id)
+                except Exception:
+                    detail = None
+                if detail:
+                    game = {
+                        **game,
+                        "description": detail.get("description"),
+                        "notes": (detail.get("gallery_metadata") or {}).get("notes"),
+                    }
                 st.session_state["selected_game_detail"] = game
                 st.session_state["page"] = "game_detail"
                 st.rerun()
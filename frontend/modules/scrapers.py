@@ -3,10 +3,13 @@ Scraper helpers
 
 Includes lightweight price helpers and a Chrome driver initializer suitable for
 local runs and tests. The driver initializer prefers undetected-chromedriver
-and falls back to selenium + webdriver-manager.
+and falls back to selenium + webdriver-manager. Scrapers borrow drivers from
+driver_pool so a warm browser is reused instead of launched per call.
 """
 
 from typing import Optional, Tuple, Dict
+import atexit
+import queue
 import re
 import logging
 import json
@@ -148,7 +151,7 @@ def scrape_pricecharting_price(game_title: str, platform: Optional[str] = None,
 
     driver = None
     try:
-        driver = get_chrome_driver()
+        driver = driver_pool.acquire()
         
         # Clean up search query
         search_query = game_title.strip()
@@ -217,7 +220,7 @@ def scrape_pricecharting_price(game_title: str, platform: Optional[str] = None,
         return None
     finally:
         if driver:
-            driver.quit()
+            driver_pool.release(driver)
 
 
 def extract_pricecharting_pricing(driver) -> Optional[Dict]:
@@ -363,7 +366,7 @@ def scrape_ebay_prices(game_title):
     scrolls down to load additional results, and then collects all valid price values.
     Returns the lowest price found as a float, or None if no valid prices are found.
     """
-    driver = get_chrome_driver()  # Use the environment-aware driver function
+    driver = driver_pool.acquire()
 
     try:
         # 1. Navigate to eBay UK homepage.
@@ -419,7 +422,7 @@ def scrape_ebay_prices(game_title):
         logging.error(f"Error scraping eBay: {e}")
         return None
     finally:
-        driver.quit()
+        driver_pool.release(driver)
 
 
 def scrape_cex_price(game_title):
@@ -431,7 +434,7 @@ price found.
     """
     driver = None
     try:
-        driver = get_chrome_driver()
+        driver = driver_pool.acquire()
 
         # Navigate to CeX UK search page with the game title
         import urllib.parse
@@ -514,7 +517,7 @@ price found.
         return None
     finally:
         if driver:
-            driver.quit()
+            driver_pool.release(driver)
 
 
 def scrape_amazon_price(game_title: str) -> Optional[float]:
@@ -525,7 +528,7 @@ def scrape_amazon_price(game_title: str) -> Optional[float]:
     """
     driver = None
     try:
-        driver = get_chrome_driver()
+        driver = driver_pool.acquire()
 
         driver.get("https://www.amazon.co.uk/")
         time.sleep(2)
@@ -555,7 +558,7 @@ def scrape_amazon_price(game_title: str) -> Optional[float]:
         return None
     finally:
         if driver:
-            driver.quit()
+            driver_pool.release(driver)
 
 
 def scrape_barcode_lookup(barcode: str) -> Tuple[Optional[str], Optional[float]]:
@@ -568,7 +571,7 @@ def scrape_barcode_lookup(barcode: str) -> Tuple[Optional[str], Optional[float]]
     
     driver = None
     try:
-        driver = get_chrome_driver()  # Use the environment-aware driver function
+        driver = driver_pool.acquire()
         
         url = f"https://www.barcodelookup.com/{barcode}"
         driver.get(url)
@@ -591,7 +594,7 @@ def scrape_barcode_lookup(barcode: str) -> Tuple[Optional[str], Optional[float]]
         return None, None
     finally:
         if driver:
-            driver.quit()
+            driver_pool.release(driver)
 
 
 def get_chrome_driver():
@@ -669,6 +672,55 @@ def get_chrome_driver():
         
         raise Exception("Could not initialize Chrome driver - tried webdriver-manager and undetected-chromedriver")
 
+
+# Starting Chrome costs seconds per scrape, so drivers are kept warm between calls
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "2"))
+
+
+class DriverPool:
+    """Small LIFO pool of Chrome drivers, created on first use and reused afterwards."""
+
+    def __init__(self, size=DRIVER_POOL_SIZE):
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def acquire(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                # Looked up at call time so tests can still patch get_chrome_driver
+                return get_chrome_driver()
+            if getattr(driver, "session_id", None):
+                return driver
+            _quit_driver(driver)
+
+    def release(self, driver):
+        try:
+            # Reset it so the next scrape starts from a clean page
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._idle.put_nowait(driver)
+        except Exception:
+            _quit_driver(driver)
+
+    def close(self):
+        while True:
+            try:
+                _quit_driver(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+def _quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+driver_pool = DriverPool()
+atexit.register(driver_pool.close)
+
 # Note: Do not redefine get_chrome_driver below; the implementation above
 # provides real drivers (uc/selenium) and will raise if unavailable. Tests
 # that rely on a stub should mock this symbol explicitly.
@@ -0,0 +1,22 @@
+import runpy
+import importlib
+
+import pytest
+
+
+@pytest.fixture
+def migrated_app(monkeypatch, tmp_path):
+    """backend.app pointed at a fresh database built by the setup script and the real migrations."""
+    db = tmp_path / "games.db"
+    monkeypatch.setenv("DATABASE_PATH", str(db))
+    # Base schema
+    runpy.run_module("backend.database_setup", run_name="__main__")
+    # Migrations
+    importlib.import_module("backend.migrate_gallery_v1").run_migration()
+    importlib.import_module("backend.migrate_artwork_columns").migrate_artwork_columns()
+    importlib.import_module("backend.add_date_added_column").migrate_add_date_added_column()
+    importlib.import_module("backend.add_region_column").migrate_add_region_column()
+    importlib.import_module("backend.add_price_history").create_price_history_table()
+    appmod = importlib.import_module("backend.app")
+    appmod.database_path = str(db)
+    return appmod, str(db)
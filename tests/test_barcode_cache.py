@@ -0,0 +1,28 @@
+def test_scan_reuses_cached_barcode_title(migrated_app, monkeypatch):
+    appmod, _ = migrated_app
+    monkeypatch.setattr(appmod, "get_igdb_credentials", lambda: ("id", "secret"), raising=True)
+    monkeypatch.setattr(appmod, "get_igdb_access_token", lambda: "DUMMY_TOKEN", raising=True)
+
+    scraped = []
+
+    def fake_lookup(code):
+        scraped.append(code)
+        return "Dummy Game", None
+
+    monkeypatch.setattr(appmod, "scrape_barcode_lookup", fake_lookup, raising=True)
+    monkeypatch.setattr(
+        appmod,
+        "search_game_fuzzy_with_alternates",
+        lambda game_name, token, max_attempts=30, fuzzy_threshold=60: ({"name": game_name, "platforms": []}, []),
+        raising=True,
+    )
+
+    client = appmod.app.test_client()
+    assert client.post("/scan", json={"barcode": "5030917077418"}).status_code == 200
+
+    # Drop the in-memory layer so the second scan has to come from the table
+    appmod._barcode_titles.clear()
+    resp = client.post("/scan", json={"barcode": "5030917077418"})
+    assert resp.status_code == 200
+    assert resp.get_json()["exact_match"]["name"] == "Dummy Game"
+    assert scraped == ["5030917077418"]
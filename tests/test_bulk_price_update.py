@@ -0,0 +1,77 @@
+import sqlite3
+import threading
+
+
+def test_bulk_update_writes_prices_and_history(migrated_app, monkeypatch):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO games (id, title, platforms, average_price) VALUES (?, ?, ?, ?)",
+        [(1, "Zelda", "NES", 3.0), (2, "Metroid", "NES", 4.0), (3, "Unpriced", "NES", 5.0)],
+    )
+    conn.commit()
+    conn.close()
+
+    prices = {"Zelda NES": 10.0, "Metroid NES": 12.5}
+    monkeypatch.setattr(appmod, "get_price_source", lambda: "eBay")
+    monkeypatch.setattr(appmod, "scrape_price", lambda source, query, region, boxed=True: prices.get(query))
+    monkeypatch.setattr(appmod, "check_price_change_and_alert", lambda *args: None)
+
+    client = appmod.app.test_client()
+    r = client.post("/update_game_prices_bulk", json={"ids": [1, 2, 3, 99]})
+    assert r.status_code == 200
+    body = r.get_json()
+    assert body["updated"] == 2
+    assert [res.get("new_price") for res in body["results"]] == [10.0, 12.5, None, None]
+    assert body["results"][3]["error"] == "Game not found"
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT id, average_price FROM games WHERE id IN (1, 2, 3) ORDER BY id").fetchall() == [
+        (1, 10.0), (2, 12.5), (3, 5.0)
+    ]
+    assert conn.execute("SELECT game_id, price FROM price_history ORDER BY game_id").fetchall() == [(1, 10.0), (2, 12.5)]
+    conn.close()
+
+    assert client.post("/update_game_prices_bulk", json={"ids": "1,2"}).status_code == 400
+
+
+def test_deleting_latest_history_entry_restores_previous_price(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, average_price) VALUES (1, 'Zelda', 12.0)")
+    conn.executemany(
+        "INSERT INTO price_history (id, game_id, price, price_source, date_recorded) VALUES (?, 1, ?, 'eBay', ?)",
+        [(1, 10.0, "2024-01-01 00:00:00"), (2, 12.0, "2024-02-01 00:00:00")],
+    )
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+
+    def current_price():
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute("SELECT average_price FROM games WHERE id = 1").fetchone()[0]
+        finally:
+            conn.close()
+
+    assert client.delete("/api/price_history/2").get_json()["game_id"] == 1
+    assert current_price() == 10.0
+    assert client.delete("/api/price_history/2").status_code == 404
+    assert client.delete("/api/price_history/1").status_code == 200
+    assert current_price() is None
+
+
+def test_scrape_prices_runs_sources_together_and_tolerates_failures(migrated_app, monkeypatch):
+    appmod, _ = migrated_app
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_scrape(source, query, region, boxed=True):
+        barrier.wait()  # only passes if both sources are being scraped at the same time
+        if source == "CeX":
+            raise RuntimeError("blocked")
+        return 12.5
+
+    monkeypatch.setattr(appmod, "scrape_price", fake_scrape)
+    prices = appmod.scrape_prices(["eBay", "CeX"], "Halo 3", "PAL")
+    assert prices == {"eBay": 12.5, "CeX": None}
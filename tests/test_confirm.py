@@ -0,0 +1,54 @@
+def test_confirm_finds_the_scan_by_id_or_barcode_and_consumes_it(migrated_app, monkeypatch):
+    appmod, _ = migrated_app
+    saved = []
+    monkeypatch.setattr(appmod, "scrape_price", lambda *args: 9.99)
+    monkeypatch.setattr(appmod, "save_game_to_db", lambda game_data: saved.append(game_data["title"]) or True)
+
+    def remember_scan(scan_id, barcode, name):
+        appmod.GameScan.scans.set(scan_id, {
+            "barcode": barcode,
+            "game_title": name,
+            "exact_match": {"name": name, "platforms": [{"name": "SNES"}]},
+            "alternative_matches": [],
+            "combined_price": None,
+        })
+        appmod.GameScan.scan_ids_by_barcode.set(barcode, scan_id)
+
+    remember_scan("scan-1", "111", "Chrono Trigger")
+    remember_scan("scan-2", "222", "EarthBound")
+    client = appmod.app.test_client()
+
+    def confirm(**payload):
+        return client.post("/confirm", json={"selection": "1", "selected_platform": "SNES", **payload})
+
+    # Without a scan_id or barcode there is no "latest scan" to fall back to
+    assert confirm().status_code == 400
+    assert confirm(scan_id="unknown").status_code == 400
+
+    # The Shortcut sends the barcode; clients that kept the scan_id send that
+    assert confirm(barcode="111").get_json()["title"] == "Chrono Trigger"
+    assert confirm(scan_id="scan-2").get_json()["title"] == "EarthBound"
+    assert saved == ["Chrono Trigger", "EarthBound"]
+
+    # A confirmed scan is gone, under either key
+    assert confirm(barcode="111").status_code == 400
+    assert confirm(barcode="222").status_code == 400
+    assert confirm(scan_id="scan-1").status_code == 400
+
+
+def test_confirm_rejects_price_sources_that_are_not_a_list(migrated_app, monkeypatch):
+    appmod, _ = migrated_app
+    monkeypatch.setattr(appmod, "save_game_to_db", lambda game_data: True)
+    appmod.GameScan.scans.set("scan-1", {
+        "barcode": "111",
+        "game_title": "Chrono Trigger",
+        "exact_match": {"name": "Chrono Trigger", "platforms": [{"name": "SNES"}]},
+        "alternative_matches": [],
+        "combined_price": None,
+    })
+    client = appmod.app.test_client()
+
+    for price_sources in ("ebay", {"ebay": True}):
+        r = client.post("/confirm", json={"scan_id": "scan-1", "selection": "1", "price_sources": price_sources})
+        assert r.status_code == 400
+        assert "error" in r.get_json()
@@ -0,0 +1,124 @@
+import sqlite3
+
+
+def test_platform_filter_matches_whole_platform_names(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO games (id, title, platforms, release_date) VALUES (1, 'Super Mario Bros.', 'NES', '1985-09-13')"
+    )
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+    # First request sets up game_platforms and backfills it from existing rows
+    assert [g["title"] for g in client.get("/games", query_string={"platform": "NES"}).get_json()] == ["Super Mario Bros."]
+
+    # Rows written after setup are kept in sync by triggers
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO games (id, title, platforms, release_date) VALUES (2, 'Super Mario World', 'SNES, Game Boy Advance', '1990-11-21')"
+    )
+    conn.execute("UPDATE games SET platforms = 'NES, Famicom' WHERE id = 1")
+    conn.commit()
+    conn.close()
+
+    assert [g["title"] for g in client.get("/games", query_string={"platform": "NES"}).get_json()] == ["Super Mario Bros."]
+    assert [g["title"] for g in client.get("/games", query_string={"platform": "game boy advance"}).get_json()] == ["Super Mario World"]
+
+
+def test_gallery_platform_filter_reads_game_platforms(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (1, 'Halo 2', 'Xbox')")
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (2, 'Psychonauts', '[\"Xbox\", \"PC\"]')")
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (3, 'Okami', 'PS2, Wii')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+
+    def gallery_titles(platform):
+        data = client.get("/api/gallery/games", query_string={"platform": platform}).get_json()["data"]
+        return [g["title"] for g in data["games"]]
+
+    assert gallery_titles("Xbox") == ["Halo 2", "Psychonauts"]
+    assert gallery_titles("Wii") == ["Okami"]
+
+
+def test_genre_filter_matches_whole_genre_names(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, genres) VALUES (1, 'Chrono Trigger', 'RPG')")
+    conn.execute("INSERT INTO games (id, title, genres) VALUES (2, 'RPG Maker', 'RPG Maker, Simulation')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+    assert [g["title"] for g in client.get("/games", query_string={"genre": "RPG"}).get_json()] == ["Chrono Trigger"]
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE games SET genres = 'Simulation, RPG' WHERE id = 2")
+    conn.commit()
+    conn.close()
+    assert [g["title"] for g in client.get("/games", query_string={"genre": "rpg"}).get_json()] == ["Chrono Trigger", "RPG Maker"]
+
+
+def test_export_csv_platform_and_genre_filters_match_whole_names(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms, genres) VALUES (1, 'Super Mario Bros.', 'NES', 'Platformer')")
+    conn.execute("INSERT INTO games (id, title, platforms, genres) VALUES (2, 'Chrono Trigger', 'SNES', 'RPG')")
+    conn.execute("INSERT INTO games (id, title, platforms, genres) VALUES (3, 'RPG Maker', 'PC', 'RPG Maker, Simulation')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+
+    def export_titles(**args):
+        rows = client.get("/export_csv", query_string=args).get_data(as_text=True).splitlines()[1:]
+        return sorted(row.split(",")[1] for row in rows)
+
+    assert export_titles(platform="NES") == ["Super Mario Bros."]
+    assert export_titles(genre="rpg") == ["Chrono Trigger"]
+
+
+def test_gallery_filters_cached_until_a_game_changes(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (1, 'Halo 2', 'Xbox')")
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (2, 'Okami', 'PS2')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+
+    def platforms():
+        return client.get("/api/gallery/filters").get_json()["data"]["platforms"]
+
+    assert platforms() == ["PS2", "Xbox"]
+
+    # Direct writes are not seen until the cache is dropped
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (3, 'Ico', 'PS3')")
+    conn.commit()
+    conn.close()
+    assert platforms() == ["PS2", "Xbox"]
+
+    assert client.post("/delete_game", json={"id": 1}).status_code == 200
+    assert platforms() == ["PS2", "PS3"]
+
+
+def test_gallery_filters_read_link_tables(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms, genres, release_date) VALUES (1, 'Psychonauts', '[\"Xbox\", \"PC\"]', 'Platform, Adventure', '2005-04-19')")
+    conn.execute("INSERT INTO games (id, title, platforms, genres, release_date) VALUES (2, 'Okami', 'PS2, Wii', 'Adventure', 'TBA')")
+    conn.commit()
+    conn.close()
+
+    data = appmod.app.test_client().get("/api/gallery/filters").get_json()["data"]
+
+    assert data["platforms"] == ["PC", "PS2", "Wii", "Xbox"]
+    assert data["genres"] == ["Adventure", "Platform"]
+    assert data["release_years"] == [2005]
@@ -0,0 +1,168 @@
+import sqlite3
+
+import pytest
+
+
+@pytest.mark.parametrize("sort", [None, "alphabetical", "title_desc", "highest", "lowest", "recent"])
+def test_cursor_pages_match_page_numbers(migrated_app, sort):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    for game_id in range(1, 12):
+        # Repeated titles/prices and some NULL prices exercise the tie-breaks
+        price = None if game_id % 4 == 0 else float(game_id % 3)
+        conn.execute(
+            "INSERT INTO games (id, title, average_price) VALUES (?, ?, ?)",
+            (game_id, f"Game {game_id % 5}", price),
+        )
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+    args = {"per_page": 3}
+    if sort:
+        args["sort"] = sort
+
+    by_page = []
+    for page in range(1, 5):
+        body = client.get("/games", query_string={**args, "page": page}).get_json()
+        assert body["pagination"]["total_count"] == 11
+        by_page += [g["id"] for g in body["games"]]
+
+    by_cursor = []
+    query = dict(args)
+    while True:
+        body = client.get("/games", query_string=query).get_json()
+        by_cursor += [g["id"] for g in body["games"]]
+        next_cursor = body["pagination"]["next_cursor"]
+        if not next_cursor:
+            assert not body["pagination"]["has_next"]
+            break
+        query = {**args, "after_id": next_cursor["after_id"]}
+        if next_cursor["after_value"] is not None:
+            query["after_value"] = next_cursor["after_value"]
+
+    assert sorted(by_page) == list(range(1, 12))
+    assert by_cursor == by_page
+
+
+def test_malformed_page_args_are_rejected(migrated_app):
+    appmod, _ = migrated_app
+    client = appmod.app.test_client()
+
+    for query in (
+        {"page": "abc"},
+        {"per_page": "1.5"},
+        {"after_id": "x"},
+        {"sort": "highest", "after_id": "5", "after_value": "abc"},
+        {"year": "199x"},
+    ):
+        r = client.get("/games", query_string=query)
+        assert r.status_code == 400
+        assert "error" in r.get_json()
+
+    r = client.get("/api/gallery/games", query_string={"page": "abc"})
+    assert r.status_code == 400
+
+
+def test_year_filters_agree(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, release_date) VALUES (1, 'Dated', '1998-11-21')")
+    conn.execute("INSERT INTO games (id, title, release_date) VALUES (2, 'Year only', '1998')")
+    conn.execute("INSERT INTO games (id, title, release_date) VALUES (3, 'Later', '2001-03-01')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+    assert sorted(g["title"] for g in client.get("/games", query_string={"year": "1998"}).get_json()) == ["Dated", "Year only"]
+    exported = client.get("/export_csv", query_string={"year": "1998"}).get_data(as_text=True)
+    assert "Dated" in exported and "Year only" in exported and "Later" not in exported
+    assert sorted(client.get("/unique_values", query_string={"type": "year"}).get_json()) == ["1998", "2001"]
+
+    data = client.get("/api/gallery/games", query_string={"year_min": "1998", "year_max": "1998"}).get_json()["data"]
+    assert sorted(g["title"] for g in data["games"]) == ["Dated", "Year only"]
+
+
+@pytest.fixture
+def gallery_app(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    for game_id in range(1, 12):
+        price = None if game_id % 4 == 0 else float(game_id % 3)
+        added = None if game_id % 5 == 0 else f"2024-01-0{game_id % 3 + 1} 00:00:00"
+        conn.execute(
+            "INSERT INTO games (id, title, average_price, date_added, release_date) VALUES (?, ?, ?, ?, ?)",
+            (game_id, f"Game {game_id % 5}", price, added, f"200{game_id % 2}-01-01"),
+        )
+    conn.execute("INSERT INTO game_gallery_metadata (game_id, personal_rating) VALUES (3, 4), (7, 4), (9, 2)")
+    conn.commit()
+    conn.close()
+    return appmod
+
+
+@pytest.mark.parametrize("sort", ["title_asc", "title_desc", "date_desc", "rating_desc", "rating_asc", "price_asc", "added_desc"])
+def test_gallery_cursor_pages_match_page_numbers(gallery_app, sort):
+    appmod = gallery_app
+    client = appmod.app.test_client()
+    args = {"per_page": 3, "sort": sort}
+
+    by_page = []
+    for page in range(1, 5):
+        data = client.get("/api/gallery/games", query_string={**args, "page": page}).get_json()["data"]
+        # The gallery also lists the -1 placeholder row, so 12 rows in 4 full pages
+        assert data["pagination"]["total_count"] == 12
+        assert data["pagination"]["has_next"] == (page < 4)
+        by_page += [g["id"] for g in data["games"]]
+
+    by_cursor = []
+    query = dict(args)
+    while True:
+        data = client.get("/api/gallery/games", query_string=query).get_json()["data"]
+        by_cursor += [g["id"] for g in data["games"]]
+        next_cursor = data["pagination"]["next_cursor"]
+        if next_cursor is None:
+            break
+        query = {**args, **{k: v for k, v in next_cursor.items() if v is not None}}
+
+    assert sorted(by_page) == [-1] + list(range(1, 12))
+    assert by_cursor == by_page
+
+
+def test_gallery_count_is_cached_and_skippable(gallery_app):
+    appmod = gallery_app
+    client = appmod.app.test_client()
+
+    pagination = client.get("/api/gallery/games", query_string={"per_page": 5, "skip_count": 1}).get_json()["data"]["pagination"]
+    assert pagination["total_count"] is None and pagination["has_next"] is True
+
+    assert client.get("/api/gallery/games").get_json()["data"]["pagination"]["total_count"] == 12
+    # A write through the app drops the cached count
+    assert client.post("/delete_game", json={"id": 1}).status_code == 200
+    assert client.get("/api/gallery/games").get_json()["data"]["pagination"]["total_count"] == 11
+
+
+def test_gallery_omits_long_text_unless_requested(gallery_app):
+    appmod = gallery_app
+    client = appmod.app.test_client()
+
+    lean = client.get("/api/gallery/games", query_string={"per_page": 2}).get_json()["data"]["games"]
+    full = client.get("/api/gallery/games", query_string={"per_page": 2, "fields": "description, notes"}).get_json()["data"]["games"]
+
+    assert all("description" not in game and "notes" not in game for game in lean)
+    assert all("description" in game and "notes" in game for game in full)
+    assert [game["id"] for game in lean] == [game["id"] for game in full]
+
+
+def test_gallery_sends_only_present_artwork(gallery_app):
+    appmod = gallery_app
+    conn = sqlite3.connect(appmod.database_path)
+    conn.execute("UPDATE games SET hero_image_url = '/media/artwork/hero/1.png' WHERE id = 1")
+    conn.commit()
+    conn.close()
+
+    games = appmod.app.test_client().get("/api/gallery/games", query_string={"per_page": 20}).get_json()["data"]["games"]
+    by_id = {game["id"]: game for game in games}
+
+    assert by_id[1]["hero_image_url"] == "/media/artwork/hero/1.png"
+    assert "high_res_cover_url" not in by_id[1]
+    assert not any(key in by_id[2] for key in appmod.GALLERY_ARTWORK_COLUMNS)
@@ -9,3 +9,67 @@ def test_igdb_env_config(monkeypatch):
     assert getattr(appmod, "IGDB_CLIENT_ID", "") == "abc123"
     assert getattr(appmod, "IGDB_CLIENT_SECRET", "") == "def456"
 
+
+
+def test_igdb_token_is_reused_from_disk_and_dropped_on_401(monkeypatch, tmp_path):
+    appmod = importlib.import_module("backend.app")
+    token_file = tmp_path / "igdb_token.json"
+    monkeypatch.setattr(appmod, "IGDB_TOKEN_FILE", str(token_file))
+    monkeypatch.setattr(appmod, "get_igdb_credentials", lambda: ("abc123", "def456"))
+    monkeypatch.setattr(appmod, "_igdb_token_cache", {"key": None, "token": None, "exp": 0.0})
+    posts = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"access_token": f"token{len(posts)}", "expires_in": 5000000}
+
+    monkeypatch.setattr(appmod.igdb_http, "post", lambda url: posts.append(url) or FakeResponse())
+    assert appmod.get_igdb_access_token() == "token1"
+    assert "def456" not in token_file.read_text()
+
+    # A restart starts with an empty in-memory cache but finds the saved token
+    appmod._igdb_token_cache.update(key=None, token=None, exp=0.0)
+    assert appmod.get_igdb_access_token() == "token1"
+    assert len(posts) == 1
+
+    class Rejected:
+        status_code = 401
+        url = "https://api.igdb.com/v4/games"
+
+    appmod._drop_igdb_token_on_401(Rejected())
+    assert not token_file.exists()
+    assert appmod.get_igdb_access_token() == "token2"
+
+
+def test_igdb_multiquery_reuses_cached_searches(monkeypatch):
+    appmod = importlib.import_module("backend.app")
+    monkeypatch.setattr(appmod, "get_igdb_credentials", lambda: ("abc123", "def456"))
+    monkeypatch.setattr(appmod, "_igdb_searches", appmod.TTLCache(maxsize=16, ttl=60))
+    bodies = []
+
+    class FakeResponse:
+        def __init__(self, body):
+            self.body = body
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            names = [part.split('"')[1] for part in self.body.split("query games ")[1:]]
+            return [{"name": name, "result": [{"name": f"Game {name}"}]} for name in names]
+
+    def fake_post(url, headers=None, data=None, timeout=None):
+        bodies.append(data.decode())
+        return FakeResponse(data.decode())
+
+    monkeypatch.setattr(appmod.igdb_http, "post", fake_post)
+    first = appmod.search_igdb_multiquery(["Halo", "Zelda"], "token")
+    first[0][0]["name"] = "changed by caller"
+    second = appmod.search_igdb_multiquery(["zelda ", "Metroid", "HALO"], "token")
+
+    assert second == [[{"name": "Game v1"}], [{"name": "Game v1"}], [{"name": "Game v0"}]]
+    assert len(bodies) == 2
+    assert "Metroid" in bodies[1] and "Halo" not in bodies[1] and "zelda" not in bodies[1]
@@ -0,0 +1,121 @@
+import csv
+import importlib
+import sqlite3
+
+
+def _retitle(client, game_id, title):
+    client.put(f"/update_game/{game_id}", json={
+        "title": title, "description": "", "publisher": [], "platforms": ["Game Boy"],
+        "genres": [], "series": [], "release_date": "", "average_price": None,
+    })
+
+
+def _titles(client, title):
+    return sorted(g["title"] for g in client.get("/games", query_string={"title": title}).get_json())
+
+
+def test_title_search_ignores_accents_and_tracks_changes(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (1, 'Pokémon Red', 'Game Boy')")
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (2, 'Super Mario Land', 'Game Boy')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+    # First request builds the index from existing rows
+    assert _titles(client, "pokemon") == ["Pokémon Red"]
+    assert _titles(client, "POKÉ") == ["Pokémon Red"]
+    assert _titles(client, "mario land") == ["Super Mario Land"]
+
+    # Rows written after setup are kept in sync by triggers
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (3, 'Pokémon Blue', 'Game Boy')")
+    conn.execute("UPDATE games SET title = 'Super Mario Land 2' WHERE id = 2")
+    conn.execute("DELETE FROM games WHERE id = 1")
+    conn.commit()
+    conn.close()
+
+    assert _titles(client, "pokemon") == ["Pokémon Blue"]
+    assert _titles(client, "land 2") == ["Super Mario Land 2"]
+
+    # A blank search is no search at all
+    assert _titles(client, "   ") == ["Pokémon Blue", "Super Mario Land 2"]
+    # Punctuation-only searches match literally rather than as LIKE wildcards
+    assert _titles(client, "%") == []
+
+
+def test_export_csv_title_filter_ignores_accents(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (1, 'Pokémon Red', 'Game Boy')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+    assert "Pokémon Red" in client.get("/export_csv", query_string={"title": "pokemon"}).get_data(as_text=True)
+
+    _retitle(client, 1, "Pokémon Yellow")
+
+    assert "Pokémon Yellow" in client.get("/export_csv", query_string={"title": "POKÉMON YEL"}).get_data(as_text=True)
+    assert "Pokémon" not in client.get("/export_csv", query_string={"title": "red"}).get_data(as_text=True)
+
+
+def test_gallery_search_ignores_accents(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (1, 'Pokémon Red', 'Game Boy')")
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (2, 'Super Mario Land', 'Game Boy')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+
+    def gallery_titles(search):
+        data = client.get("/api/gallery/games", query_string={"search": search}).get_json()["data"]
+        return [g["title"] for g in data["games"]]
+
+    assert gallery_titles("pokemon") == ["Pokémon Red"]
+    assert gallery_titles("POKÉ") == ["Pokémon Red"]
+
+    _retitle(client, 1, "Pokémon Blue")
+    assert gallery_titles("pokemon blue") == ["Pokémon Blue"]
+
+
+def test_title_search_matches_the_same_games_everywhere(migrated_app):
+    appmod, db_path = migrated_app
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (1, 'Pokémon Red', 'Game Boy')")
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (2, 'Super Mario Land', 'Game Boy')")
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (3, 'Dr. Mario', 'Game Boy')")
+    conn.execute("INSERT INTO games (id, title, platforms) VALUES (4, '100% Orange Juice', 'PC')")
+    conn.commit()
+    conn.close()
+
+    client = appmod.app.test_client()
+
+    def export_titles(search):
+        rows = client.get("/export_csv", query_string={"title": search}).get_data(as_text=True).splitlines()[1:]
+        return sorted(title for _, title, *_ in csv.reader(rows))
+
+    def gallery_titles(search):
+        data = client.get("/api/gallery/games", query_string={"search": search}).get_json()["data"]
+        return sorted(g["title"] for g in data["games"])
+
+    for search, expected in [
+        ("mario", ["Dr. Mario", "Super Mario Land"]),
+        ("ario", []),
+        ("POKÉ red", ["Pokémon Red"]),
+        ("%", ["100% Orange Juice"]),
+    ]:
+        assert _titles(client, search) == expected, search
+        assert export_titles(search) == expected, search
+        assert gallery_titles(search) == expected, search
+
+
+def test_clean_game_title_strips_longest_console_names_first():
+    appmod = importlib.import_module("backend.app")
+    assert appmod.clean_game_title("PlayStation 5 Halo") == "Halo"
+    assert appmod.clean_game_title("FIFA 21 ps4 Electronic Arts") == "FIFA 21"
+    # Only whole words are removed
+    assert appmod.clean_game_title("Spider-Man PSP") == "Spider-Man PSP"